@@ -5,7 +5,7 @@ from agno.models.openai import OpenAIChat
 from Opportunity_Discovery_Workflow.Models.data_models import OpportunityList
 from Opportunity_Discovery_Workflow.Instructions.aggregation_instructions import aggregation_instructions
 
-def get_agent(model_id="gpt-5.1-2025-11-13"):
+def get_agent(model_id="gpt-5.1-2025-11-13", http_client=None):
     """
     Initializes and returns the Aggregation Agent.
     
@@ -14,7 +14,7 @@ def get_agent(model_id="gpt-5.1-2025-11-13"):
     """
     return Agent(
         name="Aggregation_Agent",
-        model=OpenAIChat(id=model_id, temperature=0, seed=42),
+        model=OpenAIChat(id=model_id, temperature=0, seed=42, http_client=http_client),
         instructions=aggregation_instructions,
         markdown=True,
         description="Merges opportunities from domain agents, removes duplicates, and enriches descriptions",
@@ -3,7 +3,7 @@ from agno.models.openai import OpenAIChat
 from Opportunity_Discovery_Workflow.Models.data_models import OpportunityList
 from Opportunity_Discovery_Workflow.Instructions.filter_instructions import get_filter_instructions
 
-def get_agent(model_id="gpt-5.1-2025-11-13"):
+def get_agent(model_id="gpt-5.1-2025-11-13", http_client=None):
     """
     Initializes and returns the Filter Agent.
     
@@ -12,7 +12,7 @@ def get_agent(model_id="gpt-5.1-2025-11-13"):
     """
     return Agent(
         name="Filter_Agent",
-        model=OpenAIChat(id=model_id, temperature=0, seed=42),
+        model=OpenAIChat(id=model_id, temperature=0, seed=42, http_client=http_client),
         instructions=get_filter_instructions(),
         markdown=True,
         description="Filters opportunities by domains/keywords and assigns sectors",
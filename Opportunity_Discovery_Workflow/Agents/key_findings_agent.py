@@ -0,0 +1,21 @@
+"""Key Findings Agent - Writes the short narrative of the opportunity report."""
+
+from agno.agent import Agent
+from agno.models.openai import OpenAIChat
+from Opportunity_Discovery_Workflow.Models.data_models import KeyFindings
+from Opportunity_Discovery_Workflow.Instructions.key_findings_instructions import key_findings_instructions
+
+def get_agent(model_id="gpt-5.1-2025-11-13", http_client=None):
+    """
+    Initializes and returns the Key Findings Agent.
+    
+    The report itself is rendered from a template; this agent only writes
+    the Key Findings bullets of the Executive Summary.
+    """
+    return Agent(
+        name="Key_Findings_Agent",
+        model=OpenAIChat(id=model_id, temperature=0, seed=42, http_client=http_client),
+        instructions=key_findings_instructions,
+        markdown=True,
+        output_schema=KeyFindings,
+    )
@@ -0,0 +1,203 @@
+"""
+Process-wide registry of warm, reusable agents.
+
+Building an agent creates a new OpenAIChat model and, on its first call, a
+new OpenAI client with its own connection pool; the filter agent also
+re-reads keywords.json. The registry keeps built agents in a per-type pool
+and hands out lightweight handles whose `run` borrows an idle instance, so
+concurrent chunks never share an agent and sequential runs reuse one. All
+models share one httpx client, so connections to the API stay open across
+agents and workflow runs.
+
+Each pool is rebuilt when its fingerprint changes: the model id, and for the
+filter agent, whose instructions are generated from keywords.json on every
+build, the keywords file mtime. The other agents' instructions are module
+constants imported once per process, so editing them takes a restart.
+"""
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from Opportunity_Discovery_Workflow.utils.keyword_index import resolve_keywords_path
+
+# Generous read timeout: structured scoring responses can take minutes
+_HTTP_TIMEOUT = httpx.Timeout(600.0, connect=10.0)
+_HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+
+
+def _file_version(path: str) -> Tuple[Optional[float], Optional[int]]:
+    try:
+        stat = os.stat(path)
+        return stat.st_mtime, stat.st_size
+    except OSError:
+        return None, None
+
+
+class _AgentSpec:
+    """How to build one kind of agent and what its instances depend on."""
+
+    def __init__(self, builder: Callable, fingerprint: Callable[[], Any]):
+        self.builder = builder
+        self.fingerprint = fingerprint
+
+
+@dataclass(frozen=True)
+class AgentProfile:
+    """Static configuration shared by every instance in a pool."""
+    name: Optional[str]
+    model: Any
+    instructions: Any
+
+    @classmethod
+    def of(cls, agent: Any) -> "AgentProfile":
+        return cls(getattr(agent, "name", None), getattr(agent, "model", None), getattr(agent, "instructions", None))
+
+
+class _Pool:
+    def __init__(self, fingerprint: Any):
+        self.fingerprint = fingerprint
+        self.idle: List[Any] = []
+        self.profile: Optional[AgentProfile] = None
+
+
+class PooledAgent:
+    """
+    Handle to a registered agent; each `run` borrows an idle instance from the pool.
+
+    The name, model and instructions are copied from the pool when the handle
+    is created, so reading them (e.g. for cache keys) never touches the pool.
+    """
+
+    def __init__(self, registry: "AgentRegistry", name: str, model_id: Optional[str] = None):
+        self._registry = registry
+        self._name = name
+        self._model_id = model_id
+        profile = registry.profile(name, model_id)
+        self.name = profile.name
+        self.model = profile.model
+        self.instructions = profile.instructions
+
+    def run(self, *args, **kwargs):
+        agent, fingerprint = self._registry.acquire(self._name, self._model_id)
+        try:
+            return agent.run(*args, **kwargs)
+        finally:
+            self._registry.release(self._name, self._model_id, agent, fingerprint)
+
+
+class AgentRegistry:
+    """Builds each agent once per fingerprint and reuses it across runs and threads."""
+
+    def __init__(self):
+        self._specs: Dict[str, _AgentSpec] = {}
+        self._pools: Dict[Tuple[str, Optional[str]], _Pool] = {}
+        self._lock = threading.Lock()
+        self._http_client: Optional[httpx.Client] = None
+        self._stats = {"builds": 0, "reuses": 0, "rebuilds": 0}
+
+    @property
+    def http_client(self) -> httpx.Client:
+        """httpx client shared by every registered agent's model."""
+        with self._lock:
+            if self._http_client is None or self._http_client.is_closed:
+                self._http_client = httpx.Client(timeout=_HTTP_TIMEOUT, limits=_HTTP_LIMITS)
+            return self._http_client
+
+    def register(self, name: str, builder: Callable, fingerprint: Callable[[], Any] = lambda: None):
+        """`builder(model_id=..., http_client=...)` builds the agent; `fingerprint()` versions its inputs."""
+        with self._lock:
+            self._specs[name] = _AgentSpec(builder, fingerprint)
+            for key in [key for key in self._pools if key[0] == name]:
+                del self._pools[key]
+
+    def get(self, name: str, model_id: Optional[str] = None) -> PooledAgent:
+        if name not in self._specs:
+            raise KeyError(f"Unknown agent '{name}'. Registered: {', '.join(sorted(self._specs))}")
+        return PooledAgent(self, name, model_id)
+
+    def factory(self, name: str, model_id: Optional[str] = None) -> Callable[[], PooledAgent]:
+        """Zero-argument agent factory for the workflow phases."""
+        return lambda: self.get(name, model_id)
+
+    def acquire(self, name: str, model_id: Optional[str] = None):
+        """Borrow an idle instance (building one if none is idle) and the fingerprint it was built for."""
+        spec = self._specs[name]
+        fingerprint = (model_id, spec.fingerprint())
+        with self._lock:
+            pool = self._pools.get((name, model_id))
+            if pool is None or pool.fingerprint != fingerprint:
+                if pool is not None:
+                    self._stats["rebuilds"] += 1
+                pool = self._pools[(name, model_id)] = _Pool(fingerprint)
+            if pool.idle:
+                self._stats["reuses"] += 1
+                return pool.idle.pop(), fingerprint
+            self._stats["builds"] += 1
+
+        kwargs = {"http_client": self.http_client}
+        if model_id is not None:
+            kwargs["model_id"] = model_id
+        return spec.builder(**kwargs), fingerprint
+
+    def release(self, name: str, model_id: Optional[str], agent: Any, fingerprint: Any):
+        """Return a borrowed instance; it is dropped if the pool was rebuilt meanwhile."""
+        with self._lock:
+            pool = self._pools.get((name, model_id))
+            if pool is not None and pool.fingerprint == fingerprint:
+                pool.idle.append(agent)
+                if pool.profile is None:
+                    pool.profile = AgentProfile.of(agent)
+
+    def profile(self, name: str, model_id: Optional[str] = None) -> AgentProfile:
+        """Name, model and instructions of the current pool, building its first instance if needed."""
+        fingerprint = (model_id, self._specs[name].fingerprint())
+        with self._lock:
+            pool = self._pools.get((name, model_id))
+            if pool is not None and pool.fingerprint == fingerprint and pool.profile is not None:
+                return pool.profile
+        agent, fingerprint = self.acquire(name, model_id)
+        self.release(name, model_id, agent, fingerprint)
+        return AgentProfile.of(agent)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["pooled"] = {f"{name}:{model_id or 'default'}": len(pool.idle) for (name, model_id), pool in self._pools.items()}
+        return stats
+
+
+def _filter_fingerprint():
+    # The filter instructions embed keywords.json, so they change with it
+    return _file_version(resolve_keywords_path())
+
+
+def _default_registry() -> AgentRegistry:
+    from Opportunity_Discovery_Workflow.Agents import (
+        aggregation_agent,
+        filter_agent,
+        key_findings_agent,
+        scoring_agent,
+    )
+
+    registry = AgentRegistry()
+    registry.register("aggregation", aggregation_agent.get_agent)
+    registry.register("filter", filter_agent.get_agent, _filter_fingerprint)
+    registry.register("scoring", scoring_agent.get_agent)
+    registry.register("key_findings", key_findings_agent.get_agent)
+    return registry
+
+
+_registry: Optional[AgentRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> AgentRegistry:
+    """Process-wide agent registry with the workflow agents registered."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = _default_registry()
+        return _registry
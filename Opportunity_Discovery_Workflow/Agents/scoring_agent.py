@@ -3,13 +3,15 @@ from agno.models.openai import OpenAIChat
 from Opportunity_Discovery_Workflow.Models.data_models import ScoredOpportunityList
 from Opportunity_Discovery_Workflow.Instructions.scoring_instructions import scoring_instructions
 
-def get_agent(model_id="gpt-5.1-2025-11-13"):
+DEFAULT_MODEL_ID = "gpt-5.1-2025-11-13"
+
+def get_agent(model_id=DEFAULT_MODEL_ID, http_client=None):
     """
     Initializes and returns the Scoring Agent.
     """
     return Agent(
         name="Scoring_Agent",
-        model=OpenAIChat(id=model_id, temperature=0, seed=42),
+        model=OpenAIChat(id=model_id, temperature=0, seed=42, http_client=http_client),
         instructions=scoring_instructions,
         markdown=True,
         reasoning=True,
@@ -1,7 +1,28 @@
+import json
 import sqlite3
 import os
-from typing import List
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
 from Opportunity_Discovery_Workflow.Models.data_models import Opportunity, ScoredOpportunity
+from Opportunity_Discovery_Workflow.utils.dedup import content_hash, near_duplicate_text, source_records
+from Opportunity_Discovery_Workflow.utils.near_duplicates import MinHasher, pack_signature, unpack_signature
+
+# Columns added after the original schema; older databases are migrated in place
+_ADDED_COLUMNS = {
+    "agency": "TEXT",
+    "open_date": "TEXT",
+    "close_date": "TEXT",
+    "opportunity_number": "TEXT",
+    "content_hash": "TEXT",
+    "score_method": "TEXT",
+    # JSON list of the source records merged into the row (see utils.dedup)
+    "sources": "TEXT",
+    # Packed MinHash signature of title + description for cross-run near-duplicate matching
+    "minhash": "BLOB",
+}
+
 
 class DBManager:
     def __init__(self, db_path="opportunity_discovery.db"):
@@ -13,7 +34,7 @@ class DBManager:
     def _init_db(self):
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
-        
+
         # Create opportunities table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS opportunities (
@@ -31,45 +52,187 @@ class DBManager:
                 justification TEXT
             )
         ''')
+
+        cursor.execute('PRAGMA table_info(opportunities)')
+        existing = {row[1] for row in cursor.fetchall()}
+        for column, column_type in _ADDED_COLUMNS.items():
+            if column not in existing:
+                cursor.execute(f'ALTER TABLE opportunities ADD COLUMN {column} {column_type}')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_opportunities_content_hash ON opportunities (content_hash)')
+
         conn.commit()
         conn.close()
 
     def save_opportunities(self, opportunities: List[Opportunity]):
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
-        
+
         for opp in opportunities:
             cursor.execute('''
                 INSERT OR IGNORE INTO opportunities (title, description, source, sector, published_date, url)
                 VALUES (?, ?, ?, ?, ?, ?)
             ''', (opp.title, opp.description, opp.source, opp.sector, opp.published_date, opp.url))
-            
+
         conn.commit()
         conn.close()
 
-    def save_scored_opportunities(self, scored_opportunities: List[ScoredOpportunity]):
+    def save_scored_opportunities(
+        self,
+        scored_opportunities: List[ScoredOpportunity],
+        content_hashes: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Insert or update scored opportunities by URL.
+
+        `content_hashes` maps URL to the hash of the record as fetched; records
+        without an entry are hashed as given.
+        """
+        content_hashes = content_hashes or {}
+        signatures = MinHasher().signatures([near_duplicate_text(opp) for opp in scored_opportunities])
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
-        
-        # For simplicity, we'll just insert them as new rows or update if we had IDs.
-        # Since we don't track IDs from discovery to scoring perfectly in this simple flow,
-        # we will clear the table or just append. Let's append for now, but in a real app we'd update.
-        # Actually, let's just insert them.
-        
-        for opp in scored_opportunities:
+
+        for opp, signature in zip(scored_opportunities, signatures):
              cursor.execute('''
-                INSERT OR REPLACE INTO opportunities (id, title, description, source, sector, published_date, url, 
-                                           feasibility_score, impact_score, alignment_score, total_score, justification)
+                INSERT OR REPLACE INTO opportunities (id, title, description, source, agency, sector, published_date,
+                                           open_date, close_date, url, opportunity_number,
+                                           feasibility_score, impact_score, alignment_score, total_score, justification,
+                                           content_hash, score_method, sources, minhash)
                 VALUES (
                     (SELECT id FROM opportunities WHERE url = ?),
-                    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+                    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
                 )
-            ''', (opp.url, opp.title, opp.description, opp.source, opp.sector, opp.published_date, opp.url,
-                  opp.feasibility_score, opp.impact_score, opp.alignment_score, opp.total_score, opp.justification))
+            ''', (opp.url, opp.title, opp.description, opp.source, opp.agency, opp.sector, opp.published_date,
+                  opp.openDate, opp.closeDate, opp.url, opp.opportunity_number,
+                  opp.feasibility_score, opp.impact_score, opp.alignment_score, opp.total_score, opp.justification,
+                  content_hashes.get(opp.url) or content_hash(opp), opp.score_method,
+                  json.dumps([record.model_dump() for record in source_records(opp)]),
+                  pack_signature(signature)))
 
         conn.commit()
         conn.close()
 
+    def get_scored_by_urls(self, urls: Iterable[str]) -> Dict[str, Tuple[Optional[str], ScoredOpportunity]]:
+        """
+        Stored, scored opportunities keyed by URL, as (content_hash, opportunity).
+
+        Heuristic-only scores are left out so those records are scored again.
+        """
+        urls = [url for url in dict.fromkeys(urls) if url]
+        found = {}
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        # Stay well under SQLite's bound-parameter limit
+        for start in range(0, len(urls), 500):
+            chunk = urls[start:start + 500]
+            cursor.execute(
+                "SELECT * FROM opportunities WHERE total_score IS NOT NULL "
+                "AND (score_method IS NULL OR score_method != 'heuristic') "
+                f'AND url IN ({",".join("?" * len(chunk))})',
+                chunk,
+            )
+            for row in cursor.fetchall():
+                found[row["url"]] = (row["content_hash"], self._row_to_scored(row))
+        conn.close()
+        return found
+
+    @staticmethod
+    def _row_to_scored(row: sqlite3.Row) -> ScoredOpportunity:
+        return ScoredOpportunity(
+            title=row["title"] or "",
+            description=row["description"] or "",
+            source=row["source"] or "",
+            agency=row["agency"],
+            sector=row["sector"] or "",
+            published_date=row["published_date"],
+            openDate=row["open_date"],
+            closeDate=row["close_date"],
+            url=row["url"],
+            opportunity_number=row["opportunity_number"],
+            feasibility_score=row["feasibility_score"] or 0.0,
+            impact_score=row["impact_score"] or 0.0,
+            alignment_score=row["alignment_score"] or 0.0,
+            total_score=row["total_score"],
+            justification=row["justification"] or "",
+            score_method=row["score_method"] or "llm",
+            sources=json.loads(row["sources"]) if row["sources"] else [],
+        )
+
+    def get_stored_signatures(self, hasher: Optional[MinHasher] = None) -> Tuple[List[str], np.ndarray]:
+        """
+        URLs of stored opportunities and their MinHash signatures, one row each.
+
+        Signatures are read as stored; rows saved before they were (or with a
+        different signature length) are hashed once here and updated.
+        """
+        hasher = hasher or MinHasher()
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('SELECT url, minhash FROM opportunities WHERE url IS NOT NULL')
+        rows = cursor.fetchall()
+
+        urls = [url for url, _ in rows]
+        signatures = np.empty((len(rows), hasher.num_perm), dtype=np.uint64)
+        stale = []
+        for i, (_, blob) in enumerate(rows):
+            if blob is not None and len(blob) == 4 * hasher.num_perm:
+                signatures[i] = unpack_signature(blob)
+            else:
+                stale.append(i)
+
+        for start in range(0, len(stale), 500):
+            chunk = stale[start:start + 500]
+            cursor.execute(
+                f'SELECT url, title, description FROM opportunities WHERE url IN ({",".join("?" * len(chunk))})',
+                [urls[i] for i in chunk],
+            )
+            # Same text as dedup.near_duplicate_text
+            texts = {url: f"{title or ''} {description or ''}" for url, title, description in cursor.fetchall()}
+            fresh = hasher.signatures([texts.get(urls[i], "") for i in chunk])
+            signatures[chunk] = fresh
+            cursor.executemany(
+                'UPDATE opportunities SET minhash = ? WHERE url = ?',
+                [(pack_signature(signature), urls[i]) for i, signature in zip(chunk, fresh)],
+            )
+        if stale:
+            conn.commit()
+        conn.close()
+        return urls, signatures
+
+    def get_stored_opportunities(self, urls: Optional[Iterable[str]] = None) -> List[Opportunity]:
+        """Stored opportunities with a URL (only those in `urls` if given), as plain records for cross-run matching."""
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        if urls is None:
+            cursor.execute('SELECT * FROM opportunities WHERE url IS NOT NULL')
+            rows = cursor.fetchall()
+        else:
+            wanted = [url for url in dict.fromkeys(urls) if url]
+            rows = []
+            for start in range(0, len(wanted), 500):
+                chunk = wanted[start:start + 500]
+                cursor.execute(f'SELECT * FROM opportunities WHERE url IN ({",".join("?" * len(chunk))})', chunk)
+                rows.extend(cursor.fetchall())
+        conn.close()
+        return [
+            Opportunity(
+                title=row["title"] or "",
+                description=row["description"] or "",
+                source=row["source"] or "",
+                agency=row["agency"],
+                sector=row["sector"] or "",
+                published_date=row["published_date"],
+                openDate=row["open_date"],
+                closeDate=row["close_date"],
+                url=row["url"],
+                opportunity_number=row["opportunity_number"],
+                sources=json.loads(row["sources"]) if row["sources"] else [],
+            )
+            for row in rows
+        ]
+
     def get_all_opportunities(self):
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
@@ -0,0 +1,200 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from Opportunity_Discovery_Workflow.Instructions.scoring_instructions import scoring_instructions
+
+SCORE_FIELDS = ("feasibility_score", "impact_score", "alignment_score", "total_score", "justification")
+
+DEFAULT_MAX_ENTRIES = 50_000
+DEFAULT_MAX_AGE_DAYS = 90
+
+
+def instructions_hash(*parts: str) -> str:
+    """Hash of the scoring instructions (and any prompt text) that produced a score."""
+    digest = hashlib.sha256()
+    for part in parts or (scoring_instructions,):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ScoreCache:
+    """
+    Persistent LLM scores keyed by (opportunity content hash, scoring
+    instructions hash, model id).
+
+    A change to the instructions or the model simply misses; `invalidate`
+    removes entries explicitly, e.g. after the organizational context in
+    scoring_instructions changes. Entries expire after `max_age_days` and the
+    least recently used are evicted beyond `max_entries`.
+    """
+
+    def __init__(
+        self,
+        db_path="opportunity_discovery.db",
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_age_days: float = DEFAULT_MAX_AGE_DAYS,
+    ):
+        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.db_path = os.path.join(base_path, db_path)
+        self.max_entries = max_entries
+        self.max_age = max_age_days * 24 * 3600
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._init_db()
+
+    def _init_db(self):
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS score_cache (
+                content_hash TEXT NOT NULL,
+                instructions_hash TEXT NOT NULL,
+                model_id TEXT NOT NULL,
+                feasibility_score REAL,
+                impact_score REAL,
+                alignment_score REAL,
+                total_score REAL,
+                justification TEXT,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (content_hash, instructions_hash, model_id)
+            )
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_score_cache_accessed ON score_cache (accessed_at)')
+        conn.commit()
+        conn.close()
+
+    def get_many(
+        self, content_hashes: Iterable[str], instructions: str, model_id: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """Content hash -> cached score fields for every fresh hit."""
+        hashes = list(dict.fromkeys(content_hashes))
+        if not hashes:
+            return {}
+        now = time.time()
+        found: Dict[str, Dict[str, Any]] = {}
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        # Stay under SQLite's bound-parameter limit
+        for i in range(0, len(hashes), 500):
+            batch = hashes[i:i + 500]
+            placeholders = ",".join("?" * len(batch))
+            cursor.execute(f'''
+                SELECT content_hash, {", ".join(SCORE_FIELDS)} FROM score_cache
+                WHERE instructions_hash = ? AND model_id = ? AND created_at >= ?
+                  AND content_hash IN ({placeholders})
+            ''', (instructions, model_id, now - self.max_age, *batch))
+            for row in cursor.fetchall():
+                found[row[0]] = dict(zip(SCORE_FIELDS, row[1:]))
+        if found:
+            cursor.executemany(
+                'UPDATE score_cache SET accessed_at = ? WHERE content_hash = ? AND instructions_hash = ? AND model_id = ?',
+                [(now, digest, instructions, model_id) for digest in found]
+            )
+            conn.commit()
+        conn.close()
+        with self._lock:
+            self.hits += len(found)
+            self.misses += len(hashes) - len(found)
+        return found
+
+    def put_many(self, entries: Iterable[Tuple[str, Dict[str, Any]]], instructions: str, model_id: str):
+        """Store (content hash, score fields) pairs, then apply age and size eviction."""
+        now = time.time()
+        rows = [
+            (digest, instructions, model_id, *(scores.get(name) for name in SCORE_FIELDS), now, now)
+            for digest, scores in entries
+        ]
+        if not rows:
+            return
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.executemany(f'''
+            INSERT OR REPLACE INTO score_cache (
+                content_hash, instructions_hash, model_id, {", ".join(SCORE_FIELDS)}, created_at, accessed_at
+            ) VALUES ({",".join("?" * (len(SCORE_FIELDS) + 5))})
+        ''', rows)
+        self._evict(cursor, now)
+        conn.commit()
+        conn.close()
+
+    def _evict(self, cursor: sqlite3.Cursor, now: float):
+        cursor.execute('DELETE FROM score_cache WHERE created_at < ?', (now - self.max_age,))
+        cursor.execute('SELECT COUNT(*) FROM score_cache')
+        excess = cursor.fetchone()[0] - self.max_entries
+        if excess > 0:
+            cursor.execute('''
+                DELETE FROM score_cache WHERE rowid IN (
+                    SELECT rowid FROM score_cache ORDER BY accessed_at ASC LIMIT ?
+                )
+            ''', (excess,))
+
+    def invalidate(
+        self,
+        instructions: Optional[str] = None,
+        model_id: Optional[str] = None,
+        keep_instructions: Optional[str] = None,
+    ) -> int:
+        """
+        Delete cached scores and return how many were removed.
+
+        Filters combine: `instructions` / `model_id` restrict to entries with
+        that key part, `keep_instructions` spares entries produced by those
+        (typically the current) instructions. With no filters everything goes.
+        """
+        clauses, params = [], []
+        if instructions is not None:
+            clauses.append('instructions_hash = ?')
+            params.append(instructions)
+        if model_id is not None:
+            clauses.append('model_id = ?')
+            params.append(model_id)
+        if keep_instructions is not None:
+            clauses.append('instructions_hash != ?')
+            params.append(keep_instructions)
+        where = f' WHERE {" AND ".join(clauses)}' if clauses else ''
+
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute(f'DELETE FROM score_cache{where}', params)
+        removed = cursor.rowcount
+        conn.commit()
+        conn.close()
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('SELECT COUNT(*), COUNT(DISTINCT instructions_hash) FROM score_cache')
+        entries, versions = cursor.fetchone()
+        conn.close()
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        lookups = hits + misses
+        return {
+            "entries": entries,
+            "instruction_versions": versions,
+            "max_entries": self.max_entries,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+_cache: Optional[ScoreCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_score_cache() -> ScoreCache:
+    """Process-wide score cache, so hit counters cover every run in the process."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ScoreCache()
+        return _cache
@@ -0,0 +1,141 @@
+import sqlite3
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterable, List, Optional, Set
+from Opportunity_Discovery_Workflow.Models.data_models import Opportunity
+
+
+def watermark_id(opp: Opportunity) -> str:
+    """Stable per-source identifier used to recognise already-seen records."""
+    return opp.opportunity_number or opp.url or opp.title
+
+
+def watermark_scope(days_back: int, domains: Optional[Iterable[str]] = None) -> str:
+    """
+    Normalized request parameters a watermark is valid for.
+
+    A run over a shorter window or fewer domains never sees (or keeps) the
+    records a wider run would, so each combination keeps its own watermark.
+    """
+    scope = f"days={days_back}"
+    wanted = sorted({d.strip().lower() for d in domains or [] if d and d.strip()})
+    if wanted:
+        scope += ";domains=" + ",".join(wanted)
+    return scope
+
+
+@dataclass
+class Watermark:
+    """Last seen post date for a source and scope plus the IDs seen on that date."""
+    source: str
+    last_post_date: str
+    scope: str = ""
+    seen_ids: Set[str] = field(default_factory=set)
+    updated_at: Optional[str] = None
+
+
+class WatermarkStore:
+    """
+    Persistent incremental-fetch watermarks, one per data source and scope.
+
+    Post dates are day-granular, so the next fetch re-reads the watermark day
+    and drops the IDs already seen on it. The scope (see `watermark_scope`)
+    keeps restricted runs from advancing the watermark of wider ones.
+    """
+
+    def __init__(self, db_path="opportunity_discovery.db"):
+        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.db_path = os.path.join(base_path, db_path)
+        self._init_db()
+
+    def _init_db(self):
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA table_info(fetch_watermarks)")
+        columns = {row[1] for row in cursor.fetchall()}
+        if columns and "scope" not in columns:
+            # Unscoped watermarks may have been advanced by restricted runs; start over
+            cursor.execute('DROP TABLE fetch_watermarks')
+            cursor.execute('DROP TABLE IF EXISTS fetch_watermark_ids')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS fetch_watermarks (
+                source TEXT NOT NULL,
+                scope TEXT NOT NULL DEFAULT '',
+                last_post_date TEXT NOT NULL,
+                updated_at TEXT,
+                PRIMARY KEY (source, scope)
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS fetch_watermark_ids (
+                source TEXT NOT NULL,
+                scope TEXT NOT NULL DEFAULT '',
+                opportunity_id TEXT NOT NULL,
+                PRIMARY KEY (source, scope, opportunity_id)
+            )
+        ''')
+        conn.commit()
+        conn.close()
+
+    def get(self, source: str, scope: str = "") -> Optional[Watermark]:
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute(
+            'SELECT last_post_date, updated_at FROM fetch_watermarks WHERE source = ? AND scope = ?',
+            (source, scope)
+        )
+        row = cursor.fetchone()
+        if not row:
+            conn.close()
+            return None
+        cursor.execute(
+            'SELECT opportunity_id FROM fetch_watermark_ids WHERE source = ? AND scope = ?', (source, scope)
+        )
+        seen_ids = {r[0] for r in cursor.fetchall()}
+        conn.close()
+        return Watermark(source=source, last_post_date=row[0], scope=scope, seen_ids=seen_ids, updated_at=row[1])
+
+    def advance(self, source: str, opportunities: List[Opportunity], scope: str = "") -> Optional[Watermark]:
+        """Move the watermark forward to the newest post date in `opportunities`."""
+        dated = [opp for opp in opportunities if opp.published_date]
+        if not dated:
+            return self.get(source, scope)
+
+        newest = max(opp.published_date for opp in dated)
+        current = self.get(source, scope)
+        if current and current.last_post_date > newest:
+            return current
+
+        seen_ids = {watermark_id(opp) for opp in dated if opp.published_date == newest}
+        if current and current.last_post_date == newest:
+            seen_ids |= current.seen_ids
+
+        updated_at = datetime.now().isoformat()
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('''
+            INSERT OR REPLACE INTO fetch_watermarks (source, scope, last_post_date, updated_at)
+            VALUES (?, ?, ?, ?)
+        ''', (source, scope, newest, updated_at))
+        cursor.execute('DELETE FROM fetch_watermark_ids WHERE source = ? AND scope = ?', (source, scope))
+        cursor.executemany(
+            'INSERT OR IGNORE INTO fetch_watermark_ids (source, scope, opportunity_id) VALUES (?, ?, ?)',
+            [(source, scope, opp_id) for opp_id in seen_ids]
+        )
+        conn.commit()
+        conn.close()
+        return Watermark(source=source, last_post_date=newest, scope=scope, seen_ids=seen_ids, updated_at=updated_at)
+
+    def reset(self, source: Optional[str] = None):
+        """Drop the watermarks (every scope) for one source, or for all sources."""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        if source:
+            cursor.execute('DELETE FROM fetch_watermarks WHERE source = ?', (source,))
+            cursor.execute('DELETE FROM fetch_watermark_ids WHERE source = ?', (source,))
+        else:
+            cursor.execute('DELETE FROM fetch_watermarks')
+            cursor.execute('DELETE FROM fetch_watermark_ids')
+        conn.commit()
+        conn.close()
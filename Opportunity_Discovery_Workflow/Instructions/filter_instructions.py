@@ -2,9 +2,11 @@
 
 import json
 
+from Opportunity_Discovery_Workflow.utils.keyword_index import resolve_keywords_path
+
 def get_filter_instructions():
     # Load keywords from file to embed in instructions
-    keywords_path = r"d:\Agno\keywords.json"
+    keywords_path = resolve_keywords_path()
     
     try:
         with open(keywords_path, 'r', encoding='utf-8') as f:
@@ -1,6 +1,13 @@
 from pydantic import BaseModel, Field
+from pydantic.json_schema import SkipJsonSchema
 from typing import List, Optional, Dict
 
+class SourceRecord(BaseModel):
+    """One raw source record an opportunity was built from."""
+    source: str = Field(description="Source the record was fetched from")
+    opportunity_number: Optional[str] = Field(default=None, description="Number at that source")
+    url: Optional[str] = Field(default=None, description="Link at that source")
+
 class Opportunity(BaseModel):
     """Detailed information about a discovered opportunity."""
     title: str = Field(description="Title of the opportunity")
@@ -12,6 +19,9 @@ class Opportunity(BaseModel):
     openDate: Optional[str] = Field(description="Open date from source")
     closeDate: Optional[str] = Field(description="Close date from source")
     url: Optional[str] = Field(description="Direct link to the opportunity")
+    opportunity_number: Optional[str] = Field(description="Opportunity or solicitation number from source")
+    # Set by dedup, not the agents: every source record merged into this one
+    sources: SkipJsonSchema[List[SourceRecord]] = Field(default_factory=list, description="Merged source records")
 
 class ScoredOpportunity(Opportunity):
     """Opportunity with scoring details."""
@@ -20,6 +30,8 @@ class ScoredOpportunity(Opportunity):
     alignment_score: float = Field(description="Score 1-10")
     total_score: float = Field(description="Average score")
     justification: str = Field(description="Reasoning for the score")
+    # Set by the workflow, not the agent: "llm" or "heuristic" (pre-scored, never sent to the agent)
+    score_method: SkipJsonSchema[str] = Field(default="llm", description="How the scores were produced")
 
 class OpportunityList(BaseModel):
     """List of discovered opportunities."""
@@ -28,3 +40,7 @@ class OpportunityList(BaseModel):
 class ScoredOpportunityList(BaseModel):
     """List of scored opportunities."""
     opportunities: List[ScoredOpportunity] = Field(description="List of scored opportunities")
+
+class KeyFindings(BaseModel):
+    """Strategic insights for the report's Executive Summary."""
+    findings: List[str] = Field(description="3-4 concise bullet points on themes, funding trends and priorities")
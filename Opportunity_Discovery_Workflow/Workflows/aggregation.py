@@ -0,0 +1,247 @@
+"""
+Aggregation phase shared by the CLI workflow and the API workflow service.
+
+Exact duplicates are merged deterministically; only the ambiguous groups left
+over are sent to the aggregation agent. Those groups are packed into
+token-budgeted chunks (related groups kept together by blocking key), the
+chunks run concurrently, and a small reduce pass merges duplicates that ended
+up in different chunks.
+"""
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from Opportunity_Discovery_Workflow.Models.data_models import Opportunity, OpportunityList
+from Opportunity_Discovery_Workflow.utils.dedup import (
+    NEAR_DUPLICATE_THRESHOLD,
+    DedupResult,
+    MergedOpportunity,
+    canonical_url,
+    deduplicate,
+    find_ambiguous_groups,
+    merge_sources,
+    normalize_number,
+    normalize_title,
+)
+from workflow_common.tokens import count_tokens
+
+# Prompt tokens of opportunity JSON per aggregation call
+CHUNK_TOKEN_BUDGET = 6000
+MAX_CONCURRENT_CHUNKS = 4
+
+_PROMPT = (
+    "Each inner list below is a group of opportunities that may be duplicates of each other:\n"
+    "{groups}\n\n"
+    "Within each group, merge only the opportunities that are the same and enrich their descriptions. "
+    "Return every opportunity that is not a duplicate unchanged."
+)
+
+
+@dataclass
+class AggregationResult:
+    """Aggregated opportunities plus what the dedup and LLM stages did."""
+    opportunities: List[Opportunity]
+    dedup: DedupResult
+    llm_input_count: int = 0
+    llm_output_count: int = 0
+    chunk_count: int = 0
+    reduce_group_count: int = 0
+    llm_errors: List[str] = field(default_factory=list)
+
+    @property
+    def llm_error(self) -> Optional[str]:
+        return "; ".join(self.llm_errors) if self.llm_errors else None
+
+    @property
+    def summary(self) -> str:
+        text = (
+            f"{len(self.opportunities)} unique from {self.dedup.input_count} raw "
+            f"({self.dedup.duplicates_removed} exact duplicates merged"
+        )
+        if self.llm_input_count:
+            text += (
+                f", {self.llm_input_count} ambiguous reviewed by LLM in {self.chunk_count} chunks"
+                f" -> {self.llm_output_count}"
+            )
+        if self.reduce_group_count:
+            text += f", {self.reduce_group_count} cross-chunk groups reduced"
+        return text + ")"
+
+
+def _payload(groups: List[List[Opportunity]]) -> str:
+    return json.dumps([[opp.model_dump(exclude={"sources"}) for opp in group] for group in groups], separators=(",", ":"))
+
+
+def _match_keys(opp: Opportunity) -> List[str]:
+    keys = [f"title:{normalize_title(opp.title)}"] if opp.title else []
+    if normalize_number(opp.opportunity_number):
+        keys.append(f"number:{normalize_number(opp.opportunity_number)}")
+    if canonical_url(opp.url):
+        keys.append(f"url:{canonical_url(opp.url)}")
+    return keys
+
+
+def _carry_sources(groups: List[List[Opportunity]], merged: List[Opportunity]) -> List[Opportunity]:
+    """
+    Give each agent output the sources of the inputs it was built from: the
+    inputs sharing its title, number or URL, plus the rest of its group when
+    the group came back as that single record.
+    """
+    owners: Dict[str, List[Tuple[int, Opportunity]]] = {}
+    for index, group in enumerate(groups):
+        for opp in group:
+            for key in _match_keys(opp):
+                owners.setdefault(key, []).append((index, opp))
+
+    built_from: List[Dict[int, Opportunity]] = []
+    outputs_of: Dict[int, List[int]] = {}
+    for position, opp in enumerate(merged):
+        found = {}
+        for key in _match_keys(opp):
+            for index, member in owners.get(key, []):
+                found[id(member)] = member
+                if position not in outputs_of.setdefault(index, []):
+                    outputs_of[index].append(position)
+        built_from.append(found)
+
+    claimed = {member_id for found in built_from for member_id in found}
+    for index, group in enumerate(groups):
+        positions = outputs_of.get(index, [])
+        if len(positions) == 1:
+            for opp in group:
+                if id(opp) not in claimed:
+                    built_from[positions[0]][id(opp)] = opp
+
+    return [
+        opp.model_copy(update={"sources": merge_sources(list(found.values()))}) if found else opp
+        for opp, found in zip(merged, built_from)
+    ]
+
+
+def _blocking_key(group: List[Opportunity]) -> str:
+    """Agency, else opportunity-number prefix, so related groups share a chunk."""
+    for opp in group:
+        if opp.agency:
+            return normalize_title(opp.agency)
+    for opp in group:
+        if opp.opportunity_number:
+            return re.split(r"[^A-Za-z]", opp.opportunity_number.upper(), 1)[0]
+    return ""
+
+
+def plan_chunks(groups: List[List[Opportunity]], token_budget: int = CHUNK_TOKEN_BUDGET) -> List[List[List[Opportunity]]]:
+    """
+    Pack groups into chunks of at most `token_budget` prompt tokens, ordered by
+    blocking key. A group that alone exceeds the budget is split across chunks
+    and put back together by the reduce pass.
+    """
+    sized = []
+    for group in sorted(groups, key=_blocking_key):
+        tokens = count_tokens(_payload([group]))
+        if tokens <= token_budget or len(group) == 1:
+            sized.append((group, tokens))
+            continue
+        piece: List[Opportunity] = []
+        for opp in group:
+            if piece and count_tokens(_payload([piece + [opp]])) > token_budget:
+                sized.append((piece, count_tokens(_payload([piece]))))
+                piece = []
+            piece.append(opp)
+        sized.append((piece, count_tokens(_payload([piece]))))
+
+    chunks, current, used = [], [], 0
+    for group, tokens in sized:
+        if current and used + tokens > token_budget:
+            chunks.append(current)
+            current, used = [], 0
+        current.append(group)
+        used += tokens
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _run_chunk(agent_factory: Callable, groups: List[List[Opportunity]]):
+    """Aggregate one chunk; on failure its records are returned unmerged with the error."""
+    members = [opp for group in groups for opp in group]
+    try:
+        agent = agent_factory()
+        response = agent.run(_PROMPT.format(groups=_payload(groups)), response_model=OpportunityList)
+        if not response.content or isinstance(response.content, str):
+            raise ValueError("unexpected response format")
+        merged = response.content.opportunities
+        # Each group yields at least one record and never more than it started with
+        if not len(groups) <= len(merged) <= len(members):
+            raise ValueError(f"returned {len(merged)} records for {len(groups)} groups of {len(members)}")
+        return _carry_sources(groups, list(merged)), None
+    except Exception as e:
+        return members, str(e)
+
+
+def _map(agent_factory: Callable, chunks, max_workers: int):
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as executor:
+        return list(executor.map(lambda chunk: _run_chunk(agent_factory, chunk), chunks))
+
+
+def aggregate_opportunities(
+    opportunities: List[Opportunity],
+    agent_factory: Optional[Callable] = None,
+    token_budget: int = CHUNK_TOKEN_BUDGET,
+    max_workers: int = MAX_CONCURRENT_CHUNKS,
+    near_duplicate_threshold: Optional[float] = NEAR_DUPLICATE_THRESHOLD,
+) -> AggregationResult:
+    """
+    Deduplicate `opportunities`, asking the aggregation agent only about groups
+    that exact keys could not settle. `agent_factory` builds one agent per
+    chunk so chunks can run concurrently. Chunks whose agent call fails keep
+    their records separate. `near_duplicate_threshold` is the MinHash
+    similarity that makes records ambiguous (None: loose titles only).
+    """
+    dedup = deduplicate(opportunities, near_duplicate_threshold)
+    result = AggregationResult(opportunities=[m.opportunity for m in dedup.unambiguous], dedup=dedup)
+
+    groups = [[item.opportunity for item in group] for group in dedup.ambiguous_groups]
+    if not groups:
+        result.opportunities = dedup.opportunities
+        return result
+
+    if agent_factory is None:
+        from Opportunity_Discovery_Workflow.Agents.aggregation_agent import get_agent
+        agent_factory = get_agent
+
+    result.llm_input_count = sum(len(group) for group in groups)
+
+    # Map: aggregate each chunk independently
+    chunks = plan_chunks(groups, token_budget)
+    result.chunk_count = len(chunks)
+    outputs = []
+    for chunk_index, (merged, error) in enumerate(_map(agent_factory, chunks, max_workers)):
+        if error:
+            result.llm_errors.append(f"chunk {chunk_index + 1}: {error}")
+        outputs.extend((chunk_index, opp) for opp in merged)
+
+    # Reduce: re-check only look-alikes that landed in different chunks
+    aggregated = [opp for _, opp in outputs]
+    if len(chunks) > 1:
+        wrapped = [MergedOpportunity(opp, [opp]) for opp in aggregated]
+        chunk_of = {id(item): outputs[i][0] for i, item in enumerate(wrapped)}
+        cross_groups = [
+            group for group in find_ambiguous_groups(wrapped, near_duplicate_threshold)
+            if len({chunk_of[id(item)] for item in group}) > 1
+        ]
+        if cross_groups:
+            result.reduce_group_count = len(cross_groups)
+            in_reduce = {id(item.opportunity) for group in cross_groups for item in group}
+            reduced = []
+            reduce_chunks = plan_chunks([[item.opportunity for item in group] for group in cross_groups], token_budget)
+            for merged, error in _map(agent_factory, reduce_chunks, max_workers):
+                if error:
+                    result.llm_errors.append(f"reduce: {error}")
+                reduced.extend(merged)
+            aggregated = [opp for opp in aggregated if id(opp) not in in_reduce] + reduced
+
+    result.llm_output_count = len(aggregated)
+    result.opportunities = result.opportunities + aggregated
+    return result
@@ -1,32 +1,62 @@
-from Opportunity_Discovery_Workflow.Agents.simpler_grants_gov_agent import get_agent as get_fetch_agent_simpler
-from Opportunity_Discovery_Workflow.Agents.grants_gov_agent import get_agent as get_fetch_agent_grants_gov
-from Opportunity_Discovery_Workflow.Agents.sam_gov_agent import get_agent as get_fetch_agent_sam_gov
-from Opportunity_Discovery_Workflow.Agents.aggregation_agent import get_agent as get_aggregation_agent
-from Opportunity_Discovery_Workflow.Agents.filter_agent import get_agent as get_filter_agent
-from Opportunity_Discovery_Workflow.Agents.scoring_agent import get_agent as get_scoring_agent
-from Opportunity_Discovery_Workflow.Agents.report_agent import get_agent as get_report_agent
-from Opportunity_Discovery_Workflow.Models.data_models import OpportunityList, ScoredOpportunityList
-from Opportunity_Discovery_Workflow.utils.pdf_converter import convert_md_to_pdf
+from Opportunity_Discovery_Workflow.Agents.registry import get_registry
+from workflow_common.pdf_service import COMPLETED, get_pdf_service
+from Opportunity_Discovery_Workflow.utils.pdf_templates import PDF_TEMPLATE
+from workflow_common.artifacts import ArtifactSink
+from Opportunity_Discovery_Workflow.Database.watermark_store import WatermarkStore
+from Opportunity_Discovery_Workflow.Database.db_manager import DBManager
+from Opportunity_Discovery_Workflow.Workflows.aggregation import aggregate_opportunities
+from Opportunity_Discovery_Workflow.Workflows.filtering import filter_opportunities, filter_unchanged
+from Opportunity_Discovery_Workflow.Workflows.incremental import split_by_content
+from Opportunity_Discovery_Workflow.Workflows.reporting import generate_report
+from Opportunity_Discovery_Workflow.Database.score_cache import get_score_cache
+from Opportunity_Discovery_Workflow.Workflows.scoring import SCORING_VERSION, score_opportunities
+from Opportunity_Discovery_Workflow.utils.keyword_matcher import KeywordMatcher
+from Opportunity_Discovery_Workflow.utils.dedup import near_duplicate_threshold
+from workflow_common.agent_cache import cached_factory, get_agent_cache
+from Opportunity_Discovery_Workflow.Workflows.fetch_engine import (
+    FetchEngine,
+    source_fetchers,
+    ALL_SOURCES,
+    SOURCE_LABELS,
+)
 import os
-import json
 from datetime import datetime
 
 class DiscoveryWorkflow:
-    def __init__(self):
+    def __init__(self, days_back=7, full_backfill=False, reset_score_cache=False):
         print("Initializing Simple Grants Workflow...")
-        self.fetch_agent_simpler = get_fetch_agent_simpler()
-        self.fetch_agent_grants_gov = get_fetch_agent_grants_gov()
-        self.fetch_agent_sam_gov = get_fetch_agent_sam_gov()
-        self.aggregation_agent = get_aggregation_agent()
-        self.filter_agent = get_filter_agent()
-        self.scoring_agent = get_scoring_agent()
-        self.report_agent = get_report_agent()
+        self.agents = get_registry()
+        self.days_back = days_back
+        self.full_backfill = full_backfill
+        self.near_duplicate_threshold = near_duplicate_threshold()
+        self.fetch_engine = FetchEngine(source_fetchers(), watermarks=WatermarkStore())
+        self.fetch_result = None
+        self.db = DBManager()
+        self.score_cache = get_score_cache()
+        if reset_score_cache:
+            removed = self.score_cache.invalidate()
+            print(f"🧹 Score cache cleared ({removed} entries)")
+        else:
+            # Scores from earlier scoring instructions can never be hit again
+            removed = self.score_cache.invalidate(keep_instructions=SCORING_VERSION)
+            if removed:
+                print(f"🧹 Dropped {removed} cached scores from previous scoring instructions")
         
         self.base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         self.output_dir = os.path.join(self.base_path, "outputs")
         os.makedirs(self.output_dir, exist_ok=True)
+        self.artifacts = ArtifactSink(self.output_dir)
 
     def run(self):
+        try:
+            self._run()
+        finally:
+            # Early returns still wait for queued writes and stop the writer thread
+            self.artifacts.close()
+            for error in self.artifacts.errors:
+                print(f"⚠️ Could not write artifact {error}")
+
+    def _run(self):
         print("\n" + "="*70)
         print("SIMPLE GRANTS WORKFLOW - START")
         print("="*70)
@@ -43,231 +73,182 @@ class DiscoveryWorkflow:
             print("⚠️ Aggregation failed. Workflow terminated.")
             return
 
+        content_split = split_by_content(aggregated_opportunities, self.db, self.near_duplicate_threshold)
+        print(f"🧮 Content check: {content_split.summary}")
+
         print("\n--- PHASE 3: FILTER BY DOMAINS/KEYWORDS ---")
-        filtered_opportunities = self._filter_opportunities(aggregated_opportunities)
-        if not filtered_opportunities:
+        filtered_opportunities = []
+        if content_split.to_process:
+            filtered_opportunities = self._filter_opportunities(content_split.to_process)
+        reused = self._filter_unchanged(content_split.unchanged)
+        if filtered_opportunities is None or reused is None:
+            # Watermarks stay put so the next run fetches these records again
+            print("⚠️ Filtering failed. Workflow terminated.")
+            return
+        if not filtered_opportunities and not reused:
             print("⚠️ No opportunities matched keywords. Workflow terminated.")
+            self.fetch_engine.commit_watermarks(self.fetch_result)
             return
         
         print("\n--- PHASE 4: SCORE OPPORTUNITIES ---")
-        scored_opportunities = self._score_opportunities(filtered_opportunities)
-        if not scored_opportunities:
-            print("⚠️ Scoring failed. Workflow terminated.")
-            return
+        scored_opportunities = []
+        scoring_complete = True
+        if filtered_opportunities:
+            scoring = self._score_opportunities(filtered_opportunities)
+            if scoring is None or not scoring.scored:
+                print("⚠️ Scoring failed. Workflow terminated.")
+                return
+            scored_opportunities = scoring.scored
+            scoring_complete = not scoring.unscored
+            self.db.save_scored_opportunities(scored_opportunities, content_split.hashes)
+        if scoring_complete:
+            self.fetch_engine.commit_watermarks(self.fetch_result)
+        else:
+            print("⚠️ Some opportunities could not be scored; fetch watermarks not advanced")
+        scored_opportunities = scored_opportunities + reused
         
         print("\n--- PHASE 5: GENERATE REPORT ---")
         self._generate_report(scored_opportunities)
+
+        agent_cache = get_agent_cache().stats()
+        if agent_cache["hits"] or agent_cache["misses"]:
+            print(f"\n💾 Agent cache: {agent_cache['hits']} hits, {agent_cache['misses']} misses "
+                  f"({agent_cache['hit_ratio']:.0%}), ~{agent_cache['tokens_saved']} tokens saved")
         
         print("\n" + "="*70)
         print("SIMPLE GRANTS WORKFLOW - COMPLETED")
         print("="*70)
 
     def _fetch_opportunities(self):
-        all_opps = []
-        
-        try:
-            print("🔍 Fetching from Simpler.Grants.gov...")
-            response = self.fetch_agent_simpler.run(
-                "Fetch opportunities posted in the last 7 days.",
-                response_model=OpportunityList
-            )
-            if response.content and not isinstance(response.content, str):
-                opps = response.content.opportunities
-                print(f"   ✅ Simpler.Grants.gov: {len(opps)} opportunities")
-                all_opps.extend(opps)
-            else:
-                print("   ⚠️ Simpler.Grants.gov: No structured data")
-        except Exception as e:
-            print(f"   ❌ Simpler.Grants.gov Error: {e}")
-
-        try:
-            print("🔍 Fetching from Grants.gov...")
-            response = self.fetch_agent_grants_gov.run(
-                "Fetch opportunities posted in the last 7 days.",
-                response_model=OpportunityList
-            )
-            if response.content and not isinstance(response.content, str):
-                opps = response.content.opportunities
-                print(f"   ✅ Grants.gov: {len(opps)} opportunities")
-                all_opps.extend(opps)
-            else:
-                print("   ⚠️ Grants.gov: No structured data")
-        except Exception as e:
-            print(f"   ❌ Grants.gov Error: {e}")
+        labels = ", ".join(SOURCE_LABELS[source] for source in ALL_SOURCES)
+        print(f"🔍 Fetching from {labels} concurrently...")
+        result = self.fetch_engine.fetch(ALL_SOURCES, days_back=self.days_back, full_backfill=self.full_backfill)
+        self.fetch_result = result
 
-        try:
-            print("🔍 Fetching from SAM.gov...")
-            response = self.fetch_agent_sam_gov.run(
-                "Fetch opportunities posted in the last 7 days.",
-                response_model=OpportunityList
-            )
-            if response.content and not isinstance(response.content, str):
-                opps = response.content.opportunities
-                print(f"   ✅ SAM.gov: {len(opps)} opportunities")
-                all_opps.extend(opps)
+        for source, source_result in result.sources.items():
+            label = SOURCE_LABELS[source]
+            if source_result.ok:
+                delta = f", new since {source_result.since}" if source_result.since else ""
+                print(f"   ✅ {label}: {len(source_result.opportunities)} opportunities{delta} ({source_result.duration_seconds:.1f}s)")
             else:
-                print("   ⚠️ SAM.gov: No structured data")
-        except Exception as e:
-            print(f"   ❌ SAM.gov Error: {e}")
+                print(f"   ❌ {label} Error: {source_result.error} ({source_result.duration_seconds:.1f}s)")
 
-        print(f"\n✅ Total fetched: {len(all_opps)}")
+        all_opps = result.opportunities
+        print(f"\n✅ Total fetched: {len(all_opps)} in {result.duration_seconds:.1f}s")
         return all_opps
 
     def _aggregate_opportunities(self, opportunities):
         try:
             print(f"🔄 Aggregating {len(opportunities)} opportunities...")
-            opps_json = json.dumps([opp.model_dump() for opp in opportunities], indent=2)
-            
-            response = self.aggregation_agent.run(
-                f"Here is the list of opportunities:\n{opps_json}\n\n"
-                f"Merge duplicates, remove redundant information, and enrich descriptions.",
-                response_model=OpportunityList
+            result = aggregate_opportunities(
+                opportunities,
+                cached_factory(self.agents.factory("aggregation")),
+                near_duplicate_threshold=self.near_duplicate_threshold,
             )
             
-            if response.content and not isinstance(response.content, str):
-                aggregated = response.content.opportunities
-                print(f"✅ Aggregation complete: {len(aggregated)} unique (from {len(opportunities)} raw)")
-                return aggregated
-            else:
-                return self._deduplicate(opportunities)
+            print(f"   Exact-key dedup: {result.dedup.duplicates_removed} duplicates merged, "
+                  f"{len(result.dedup.ambiguous_groups)} ambiguous groups")
+            if result.llm_error:
+                print(f"   ⚠️ LLM review of ambiguous groups failed, kept them separate: {result.llm_error}")
+            print(f"✅ Aggregation complete: {result.summary}")
+            return result.opportunities
                 
         except Exception as e:
             print(f"❌ Error in aggregation: {e}")
             return opportunities
 
-    def _deduplicate(self, opportunities):
-        unique_opps = {}
-        for opp in opportunities:
-            key = opp.url or opp.title
-            if key not in unique_opps:
-                unique_opps[key] = opp
-        print(f"   Basic deduplication: {len(unique_opps)} opportunities")
-        return list(unique_opps.values())
-
     def _filter_opportunities(self, opportunities):
         try:
-            keywords_path = r"d:\Agno\keywords.json"
-            try:
-                with open(keywords_path, 'r', encoding='utf-8') as f:
-                    keywords_data = json.load(f)
-                    domains = list(keywords_data.get('keywords', {}).keys())
-                    domain_count = len(domains)
-            except Exception:
-                domains = []
-                domain_count = 0
-
-            print(f"🔍 Filtering {len(opportunities)} opportunities by {domain_count} domains...")
+            matcher = KeywordMatcher.from_file()
+            print(f"🔍 Filtering {len(opportunities)} opportunities by {len(matcher.domains)} domains...")
             
-            batch_size = 10
-            filtered_opportunities = []
-            total_batches = (len(opportunities) + batch_size - 1) // batch_size
-            
-            for i in range(0, len(opportunities), batch_size):
-                batch = opportunities[i:i + batch_size]
-                batch_num = i // batch_size + 1
-                print(f"   Processing batch {batch_num}/{total_batches}...")
-                
-                opps_json = json.dumps([opp.model_dump() for opp in batch], indent=2)
-                
-                try:
-                    response = self.filter_agent.run(
-                        f"Filter these opportunities:\n\n{opps_json}\n\n"
-                        f"Only keep opportunities matching keywords. Assign appropriate sector.",
-                        response_model=OpportunityList
-                    )
-                    
-                    if response.content and not isinstance(response.content, str):
-                        filtered_opportunities.extend(response.content.opportunities)
-                except Exception as e:
-                    print(f"     ❌ Batch {batch_num} error: {e}")
+            result = filter_opportunities(opportunities, cached_factory(self.agents.factory("filter")), matcher=matcher)
+            filtered_opportunities = result.opportunities
             
+            print(f"   Keyword pre-filter: {result.summary}")
+            for error in result.llm_errors:
+                print(f"     ❌ {error} (kept with keyword sector)")
             print(f"✅ Filtered to {len(filtered_opportunities)} relevant opportunities")
             
             if filtered_opportunities:
-                domain_counts = {}
-                for opp in filtered_opportunities:
-                    sector = opp.sector or "Unknown"
-                    domain_counts[sector] = domain_counts.get(sector, 0) + 1
-                
                 print("   Domain breakdown:")
-                for domain, count in sorted(domain_counts.items(), key=lambda x: x[1], reverse=True):
+                for domain, count in sorted(result.domain_counts.items(), key=lambda x: x[1], reverse=True):
                     print(f"     - {domain}: {count}")
             
             return filtered_opportunities
                 
         except Exception as e:
             print(f"❌ Error in filter phase: {e}")
+            return None
+
+    def _filter_unchanged(self, opportunities):
+        if not opportunities:
             return []
+        try:
+            reused = filter_unchanged(opportunities, matcher=KeywordMatcher.from_file())
+            print(f"   Reusing stored scores for {len(reused)}/{len(opportunities)} unchanged opportunities "
+                  f"still matching the keywords")
+            return reused
+        except Exception as e:
+            print(f"❌ Error filtering unchanged opportunities: {e}")
+            return None
 
     def _score_opportunities(self, opportunities):
         try:
             print(f"📊 Scoring {len(opportunities)} opportunities...")
-            opps_json = json.dumps([opp.model_dump() for opp in opportunities], indent=2)
-            
-            response = self.scoring_agent.run(
-                f"Here is the list of opportunities:\n{opps_json}\n\nScore and rank them.",
-                response_model=ScoredOpportunityList
-            )
-            
-            if response.content and not isinstance(response.content, str):
-                scored = response.content.opportunities
-                print(f"✅ Scored {len(scored)} opportunities")
-                
-                if scored:
-                    scores = [opp.total_score for opp in scored]
-                    print(f"   Score range: {min(scores):.2f} - {max(scores):.2f} (avg: {sum(scores)/len(scores):.2f})")
-                
+            result = score_opportunities(opportunities, cached_factory(self.agents.factory("scoring")), cache=self.score_cache)
+            scored = result.scored
+
+            for error in result.llm_errors:
+                print(f"   ⚠️ Scoring chunk failed: {error}")
+            if result.unscored:
+                print(f"   ⚠️ {len(result.unscored)} opportunities missing from every scoring response")
+            print(f"✅ Scored {result.summary}")
+
+            if scored:
+                scores = [opp.total_score for opp in scored]
+                print(f"   Score range: {min(scores):.2f} - {max(scores):.2f} (avg: {sum(scores)/len(scores):.2f})")
+
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                scored_filepath = os.path.join(self.output_dir, f"simple_grants_scored_{timestamp}.json")
-                
-                with open(scored_filepath, "w", encoding="utf-8") as f:
-                    json.dump([opp.model_dump() for opp in scored], f, indent=2)
-                
-                return scored
-            else:
-                print("❌ Unexpected response format")
-                return []
-                
+                self.artifacts.write_json(f"simple_grants_scored_{timestamp}.json", scored)
+
+            return result
+
         except Exception as e:
             print(f"❌ Error in scoring: {e}")
-            return []
+            return None
 
     def _generate_report(self, scored_opportunities):
         try:
             print(f"📝 Generating report for {len(scored_opportunities)} opportunities...")
             
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            data_filename = f"simple_grants_report_data_{timestamp}.json"
-            data_filepath = os.path.join(self.output_dir, data_filename)
             report_filename = f"Simple_Grants_Report_{timestamp}.md"
-            report_filepath = os.path.join(self.output_dir, report_filename)
+            pdf_filename = f"Simple_Grants_Report_{timestamp}.pdf"
             
-            with open(data_filepath, "w", encoding="utf-8") as f:
-                json.dump([opp.model_dump() for opp in scored_opportunities], f, indent=2)
-            
-            self.report_agent.run(
-                f"Read '{data_filepath}' and generate a comprehensive Markdown report. Save as '{report_filepath}'."
-            )
+            result = generate_report(scored_opportunities, cached_factory(self.agents.factory("key_findings")))
+            if result.llm_error:
+                print(f"   ⚠️ Key Findings agent failed, using data-driven findings: {result.llm_error}")
             
+            self.artifacts.write_text(report_filename, result.markdown)
             print(f"✅ Report saved to: {report_filename}")
             
-            if os.path.exists(data_filepath):
-                os.remove(data_filepath)
-            
             print("\n--- PHASE 6: CONVERT TO PDF ---")
-            self._convert_to_pdf(report_filepath)
+            self._convert_to_pdf(result.markdown, self.artifacts.path(pdf_filename))
             
         except Exception as e:
             print(f"❌ Error in report generation: {e}")
 
-    def _convert_to_pdf(self, md_filepath):
+    def _convert_to_pdf(self, markdown, pdf_filepath):
         try:
-            print("📄 Converting to PDF...")
-            pdf_filepath = convert_md_to_pdf(md_filepath)
-            
-            if pdf_filepath:
-                print(f"✅ PDF saved to: {os.path.basename(pdf_filepath)}")
-            else:
-                print("⚠️ PDF conversion failed.")
+            job = get_pdf_service().submit(markdown, pdf_filepath, PDF_TEMPLATE, on_done=self._pdf_done)
+            print(f"📄 PDF rendering queued in the background (job {job.job_id[:8]})")
         except Exception as e:
             print(f"❌ Error in PDF conversion: {e}")
+
+    @staticmethod
+    def _pdf_done(job):
+        if job.status == COMPLETED:
+            print(f"✅ PDF saved to: {os.path.basename(job.pdf_path)}")
+        else:
+            print(f"⚠️ PDF conversion {job.status}: {job.error}")
@@ -0,0 +1,199 @@
+"""Concurrent multi-source fetch engine for the discovery workflow."""
+
+import time
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from Opportunity_Discovery_Workflow.Models.data_models import Opportunity
+from Opportunity_Discovery_Workflow.Database.watermark_store import WatermarkStore, watermark_id, watermark_scope
+
+# fetcher(days_back, since) -> opportunities; `since` is a YYYY-MM-DD watermark or None
+SourceFetcher = Callable[[int, Optional[str]], List[Opportunity]]
+
+# Keys match the values of api.schemas.workflow.DataSource
+SIMPLER_GRANTS = "simpler_grants"
+GRANTS_GOV = "grants_gov"
+SAM_GOV = "sam_gov"
+ALL_SOURCES = [SIMPLER_GRANTS, GRANTS_GOV, SAM_GOV]
+
+SOURCE_LABELS = {
+    SIMPLER_GRANTS: "Simpler.Grants.gov",
+    GRANTS_GOV: "Grants.gov",
+    SAM_GOV: "SAM.gov",
+}
+
+DEFAULT_SOURCE_TIMEOUT = 300.0
+
+
+@dataclass
+class SourceFetchResult:
+    """Outcome of fetching a single source."""
+    source: str
+    opportunities: List[Opportunity] = field(default_factory=list)
+    duration_seconds: float = 0.0
+    error: Optional[str] = None
+    timed_out: bool = False
+    since: Optional[str] = None
+    skipped_seen: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class FetchResult:
+    """Combined outcome of a concurrent fetch across sources."""
+    sources: Dict[str, SourceFetchResult]
+    duration_seconds: float
+    # Watermark scope of the run (see watermark_scope); commit_watermarks advances it
+    scope: Optional[str] = None
+
+    @property
+    def opportunities(self) -> List[Opportunity]:
+        # Keep a stable source order regardless of completion order
+        opps = []
+        for result in self.sources.values():
+            opps.extend(result.opportunities)
+        return opps
+
+    @property
+    def latencies(self) -> Dict[str, float]:
+        return {name: round(r.duration_seconds, 2) for name, r in self.sources.items()}
+
+    @property
+    def errors(self) -> Dict[str, str]:
+        return {name: r.error for name, r in self.sources.items() if r.error}
+
+
+def source_fetchers() -> Dict[str, SourceFetcher]:
+    """Build the deterministic adapter fetchers for every known source."""
+    from Opportunity_Discovery_Workflow.tools.source_adapters import (
+        SimplerGrantsGovAdapter,
+        GrantsGovAdapter,
+        SamGovAdapter,
+    )
+    return {
+        SIMPLER_GRANTS: SimplerGrantsGovAdapter().fetch,
+        GRANTS_GOV: GrantsGovAdapter().fetch,
+        SAM_GOV: SamGovAdapter().fetch,
+    }
+
+
+class FetchEngine:
+    """
+    Runs every selected source at the same time on a bounded thread pool.
+
+    Each source gets its own timeout measured from the moment the fetch starts,
+    so the slowest source (or its timeout) sets the wall-clock time of the phase.
+    A failing or timed-out source is reported and the others still return.
+
+    With a watermark store, each source only fetches the delta since its last
+    committed post date for the run's scope. Watermarks are advanced by
+    `commit_watermarks` once the caller has filtered, scored and saved the
+    result; callers that fail on the way, or do not persist what they fetched,
+    must not commit.
+    """
+
+    def __init__(
+        self,
+        fetchers: Dict[str, SourceFetcher],
+        timeout: float = DEFAULT_SOURCE_TIMEOUT,
+        timeouts: Optional[Dict[str, float]] = None,
+        max_workers: Optional[int] = None,
+        watermarks: Optional[WatermarkStore] = None,
+    ):
+        self.fetchers = fetchers
+        self.timeout = timeout
+        self.timeouts = timeouts or {}
+        self.max_workers = max_workers
+        self.watermarks = watermarks
+
+    def _run_source(self, source: str, days_back: int, scope: Optional[str]) -> SourceFetchResult:
+        start = time.perf_counter()
+        try:
+            watermark = None
+            if self.watermarks is not None and scope is not None:
+                watermark = self.watermarks.get(source, scope)
+                window_start = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
+                if watermark and watermark.last_post_date < window_start:
+                    watermark = None
+
+            since = watermark.last_post_date if watermark else None
+            opps = self.fetchers[source](days_back, since)
+
+            skipped = 0
+            if watermark:
+                fresh = [opp for opp in opps if watermark_id(opp) not in watermark.seen_ids]
+                skipped = len(opps) - len(fresh)
+                opps = fresh
+
+            return SourceFetchResult(
+                source=source,
+                opportunities=opps,
+                duration_seconds=time.perf_counter() - start,
+                since=since,
+                skipped_seen=skipped,
+            )
+        except Exception as e:
+            return SourceFetchResult(
+                source=source,
+                duration_seconds=time.perf_counter() - start,
+                error=str(e) or e.__class__.__name__,
+            )
+
+    def commit_watermarks(self, result: FetchResult):
+        """Advance the watermark of every source that fetched successfully, in the fetch's scope."""
+        if self.watermarks is None or result.scope is None:
+            return
+        for source, source_result in result.sources.items():
+            if source_result.ok:
+                self.watermarks.advance(source, source_result.opportunities, result.scope)
+
+    def fetch(
+        self,
+        sources: List[str],
+        days_back: int = 7,
+        full_backfill: bool = False,
+        domains: Optional[List[str]] = None,
+    ) -> FetchResult:
+        """
+        Fetch all sources concurrently and collect partial results.
+
+        Watermarks are scoped to `days_back` and the `domains` the caller
+        filters to. A full backfill re-fetches the whole window and still
+        commits into that scope.
+        """
+        scope = watermark_scope(days_back, domains)
+        selected = [s for s in dict.fromkeys(sources) if s in self.fetchers]
+        results: Dict[str, SourceFetchResult] = {}
+        if not selected:
+            return FetchResult(sources=results, duration_seconds=0.0, scope=scope)
+
+        start = time.perf_counter()
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers or len(selected),
+            thread_name_prefix="fetch",
+        )
+        try:
+            read_scope = None if full_backfill else scope
+            futures = {s: executor.submit(self._run_source, s, days_back, read_scope) for s in selected}
+            for source in selected:
+                deadline = start + self.timeouts.get(source, self.timeout)
+                try:
+                    results[source] = futures[source].result(timeout=max(0.0, deadline - time.perf_counter()))
+                except FutureTimeoutError:
+                    futures[source].cancel()
+                    results[source] = SourceFetchResult(
+                        source=source,
+                        duration_seconds=time.perf_counter() - start,
+                        error=f"Timed out after {self.timeouts.get(source, self.timeout):.0f}s",
+                        timed_out=True,
+                    )
+        finally:
+            # Do not block on a hung source; its thread finishes in the background
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return FetchResult(sources=results, duration_seconds=time.perf_counter() - start, scope=scope)
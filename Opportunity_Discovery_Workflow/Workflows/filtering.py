@@ -0,0 +1,219 @@
+"""
+Filter phase shared by the CLI workflow and the API workflow service.
+
+The local keyword matcher settles clear matches and misses; only borderline
+records are sent to the filter agent. BM25 domain relevance breaks sector
+ties, drops off-topic borderline records before they reach the agent, and
+orders both the agent queue and the filtered output most relevant first.
+
+Agent batches are packed by token count and run concurrently under a
+process-wide limit; a batch that fails is split in half and retried, and a
+single record that still fails is kept with its local sector.
+"""
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from Opportunity_Discovery_Workflow.Models.data_models import Opportunity, OpportunityList, ScoredOpportunity
+from Opportunity_Discovery_Workflow.utils.keyword_matcher import ACCEPT, BORDERLINE, KeywordMatch, KeywordMatcher
+from Opportunity_Discovery_Workflow.utils.relevance import MIN_RELEVANCE, RelevanceRanker
+from workflow_common.tokens import count_tokens
+
+# Prompt tokens of opportunity JSON per filter call, and a cap on records per call
+FILTER_TOKEN_BUDGET = 4000
+FILTER_BATCH_SIZE = 25
+MAX_CONCURRENT_FILTER_BATCHES = 4
+
+# Shared by every filter run in the process (CLI or concurrent API workflows)
+_filter_slots = threading.BoundedSemaphore(MAX_CONCURRENT_FILTER_BATCHES)
+
+_PROMPT = (
+    "Filter these opportunities:\n\n{opportunities}\n\n"
+    "Only keep opportunities matching keywords. Assign appropriate sector."
+)
+
+
+@dataclass
+class FilterResult:
+    """Opportunities kept by the filter phase and how each was decided."""
+    opportunities: List[Opportunity] = field(default_factory=list)
+    accepted_locally: int = 0
+    rejected_locally: int = 0
+    negative_matches: int = 0
+    borderline: int = 0
+    below_relevance: int = 0
+    borderline_kept: int = 0
+    llm_batches: int = 0
+    llm_errors: List[str] = field(default_factory=list)
+    # URL (or title) -> best-domain BM25 relevance
+    relevance: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def summary(self) -> str:
+        return (
+            f"{self.accepted_locally} matched locally, {self.rejected_locally} rejected locally "
+            f"({self.negative_matches} by negative keywords, {self.below_relevance} below relevance cut-off), "
+            f"{self.borderline_kept}/{self.borderline} borderline kept after LLM review"
+            + (f" in {self.llm_batches} batches" if self.llm_batches else "")
+        )
+
+    @property
+    def domain_counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for opp in self.opportunities:
+            sector = opp.sector or "Unknown"
+            counts[sector] = counts.get(sector, 0) + 1
+        return counts
+
+
+def filter_opportunities(
+    opportunities: List[Opportunity],
+    agent_factory: Optional[Callable] = None,
+    domains: Optional[List[str]] = None,
+    matcher: Optional[KeywordMatcher] = None,
+    batch_size: int = FILTER_BATCH_SIZE,
+    min_relevance: float = MIN_RELEVANCE,
+    token_budget: int = FILTER_TOKEN_BUDGET,
+) -> FilterResult:
+    """
+    Keep opportunities matching the domain keywords and assign their sector.
+
+    `domains` restricts matching to those keyword domains. Borderline records
+    below `min_relevance` are rejected; the rest go to the filter agent in
+    token-sized batches of at most `batch_size` records, most relevant first.
+    """
+    matcher = matcher or KeywordMatcher.from_file(domains=domains)
+    relevance = RelevanceRanker(matcher.index.queries, matcher.domains).score(opportunities)
+    best_scores = relevance.best_scores
+    relevant = relevance.above(min_relevance)
+    result = FilterResult()
+    borderline = []
+
+    for row, opp in enumerate(opportunities):
+        result.relevance[opp.url or opp.title] = float(best_scores[row])
+        match = matcher.match(opp.title, opp.description)
+        if match.decision == ACCEPT:
+            result.accepted_locally += 1
+            result.opportunities.append(opp.model_copy(update={"sector": match.sector}))
+        elif match.decision == BORDERLINE and relevant[row]:
+            # Tied keyword domains are settled by BM25 relevance
+            best = relevance.best_domain(row, match.top_domains)
+            match.top_domains.remove(best)
+            match.top_domains.insert(0, best)
+            borderline.append((row, opp, match))
+        else:
+            result.rejected_locally += 1
+            if match.negative_keywords:
+                result.negative_matches += 1
+            elif match.decision == BORDERLINE:
+                result.below_relevance += 1
+
+    result.borderline = len(borderline)
+    if borderline:
+        borderline.sort(key=lambda item: -best_scores[item[0]])
+        _review_borderline(
+            result, [(opp, match) for _, opp, match in borderline], matcher, agent_factory, batch_size, token_budget
+        )
+
+    result.opportunities.sort(key=lambda opp: -result.relevance.get(opp.url or opp.title, 0.0))
+    return result
+
+
+def filter_unchanged(
+    opportunities: List[ScoredOpportunity],
+    domains: Optional[List[str]] = None,
+    matcher: Optional[KeywordMatcher] = None,
+) -> List[ScoredOpportunity]:
+    """
+    Re-apply the keyword rules to records reused from an earlier run, without the agent.
+
+    Clear matches are kept with their keyword sector; negative-keyword hits and
+    records outside `domains` are dropped. A borderline record's content has not
+    changed since the agent reviewed it, so it is kept when its stored sector is
+    one of the requested domains. Stored scores are left as they are.
+    """
+    matcher = matcher or KeywordMatcher.from_file(domains=domains)
+    active = set(matcher.domains)
+    kept = []
+    for opp in opportunities:
+        match = matcher.match(opp.title, opp.description)
+        if match.decision == ACCEPT:
+            kept.append(opp.model_copy(update={"sector": match.sector}))
+        elif match.decision == BORDERLINE and opp.sector in active:
+            kept.append(opp)
+    return kept
+
+
+def _payload(opportunities: List[Opportunity]) -> str:
+    return json.dumps([opp.model_dump(exclude={"sources"}) for opp in opportunities], separators=(",", ":"))
+
+
+def plan_batches(items: List[Tuple[Opportunity, KeywordMatch]], batch_size: int, token_budget: int):
+    """Pack items in order into batches of at most `token_budget` prompt tokens and `batch_size` records."""
+    batches, current, used = [], [], 0
+    for item in items:
+        tokens = count_tokens(_payload([item[0]]))
+        if current and (used + tokens > token_budget or len(current) >= batch_size):
+            batches.append(current)
+            current, used = [], 0
+        current.append(item)
+        used += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _run_batch(agent_factory: Callable, batch, errors: List[str], label: str) -> List[Opportunity]:
+    """
+    Filter one batch. On failure the batch is split in half and each half
+    retried; a single record that still fails is kept with its local sector.
+    """
+    try:
+        agent = agent_factory()
+        with _filter_slots:
+            response = agent.run(
+                _PROMPT.format(opportunities=_payload([opp for opp, _ in batch])),
+                response_model=OpportunityList
+            )
+        if not response.content or isinstance(response.content, str):
+            raise ValueError("unexpected response format")
+        return list(response.content.opportunities)
+    except Exception as e:
+        errors.append(f"batch {label}: {e}")
+        if len(batch) == 1:
+            opp, match = batch[0]
+            return [opp.model_copy(update={"sector": match.sector})]
+        mid = len(batch) // 2
+        return (
+            _run_batch(agent_factory, batch[:mid], errors, f"{label}a")
+            + _run_batch(agent_factory, batch[mid:], errors, f"{label}b")
+        )
+
+
+def _review_borderline(result: FilterResult, borderline, matcher: KeywordMatcher, agent_factory, batch_size: int, token_budget: int):
+    """Ask the filter agent about borderline (opportunity, match) pairs, batches in parallel."""
+    if agent_factory is None:
+        from Opportunity_Discovery_Workflow.Agents.filter_agent import get_agent
+        agent_factory = get_agent
+
+    batches = plan_batches(borderline, batch_size, token_budget)
+    result.llm_batches = len(batches)
+    batch_errors: List[List[str]] = [[] for _ in batches]
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_CONCURRENT_FILTER_BATCHES, len(batches)))) as executor:
+        outputs = list(executor.map(
+            lambda i: _run_batch(agent_factory, batches[i], batch_errors[i], str(i + 1)), range(len(batches))
+        ))
+
+    valid_sectors = set(matcher.domains)
+    for batch, kept, errors in zip(batches, outputs, batch_errors):
+        result.llm_errors.extend(errors)
+        candidates = {opp.url or opp.title: (opp, match) for opp, match in batch}
+        for opp in kept:
+            original, match = candidates.get(opp.url or opp.title, (None, None))
+            update = {"sources": original.sources} if original is not None else {}
+            if opp.sector not in valid_sectors and match is not None:
+                update["sector"] = match.sector
+            result.opportunities.append(opp.model_copy(update=update) if update else opp)
+        result.borderline_kept += len(kept)
@@ -0,0 +1,114 @@
+"""
+Cross-run skip of opportunities that were already filtered and scored.
+
+Each aggregated opportunity is hashed on its normalized content and compared
+with the hash stored alongside its score. Unchanged records reuse the stored
+scores and only go through the local keyword rules (`filter_unchanged`); new
+or changed ones go through the full filter and scoring. Records that only got
+a heuristic score are never treated as unchanged.
+
+Records with a URL the database has never seen are also checked against the
+stored opportunities with MinHash/LSH: a near-duplicate of a stored record
+(an amendment or re-posting under a new URL) counts as changed and inherits
+the stored record's sources. Stored signatures are saved with each record, so
+only the new records are hashed on a run.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from Opportunity_Discovery_Workflow.Database.db_manager import DBManager
+from Opportunity_Discovery_Workflow.Models.data_models import Opportunity, ScoredOpportunity
+from Opportunity_Discovery_Workflow.utils.dedup import (
+    NEAR_DUPLICATE_THRESHOLD,
+    content_hash,
+    merge_sources,
+    near_duplicate_text,
+)
+from Opportunity_Discovery_Workflow.utils.near_duplicates import LSHIndex
+
+
+@dataclass
+class ContentSplit:
+    """Opportunities partitioned against what is already stored."""
+    new: List[Opportunity] = field(default_factory=list)
+    changed: List[Opportunity] = field(default_factory=list)
+    unchanged: List[ScoredOpportunity] = field(default_factory=list)
+    # URL -> content hash of the record as aggregated, saved with its score
+    hashes: Dict[str, str] = field(default_factory=dict)
+    # URL -> URL of the stored record it is a near-duplicate of (also in `changed`)
+    reposted: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def to_process(self) -> List[Opportunity]:
+        return self.new + self.changed
+
+    @property
+    def summary(self) -> str:
+        text = f"{len(self.new)} new, {len(self.changed)} changed, {len(self.unchanged)} unchanged"
+        if self.reposted:
+            text += f" ({len(self.reposted)} changed are re-postings of stored records)"
+        return text
+
+
+def _match_stored(
+    opportunities: List[Opportunity], stored_urls: List[str], stored_signatures: np.ndarray, threshold: float
+) -> List[Optional[str]]:
+    """For each record, the URL of the most similar stored record at or above `threshold`, if any."""
+    index = LSHIndex(threshold=threshold)
+    for url, signature in zip(stored_urls, stored_signatures):
+        index.add(url, "", signature)
+
+    texts = [near_duplicate_text(opp) for opp in opportunities]
+    matches = []
+    for text, signature in zip(texts, index.hasher.signatures(texts)):
+        found = index.query(text, signature)
+        matches.append(found[0][0] if found else None)
+    return matches
+
+
+def split_by_content(
+    opportunities: List[Opportunity],
+    db: DBManager,
+    near_duplicate_threshold: Optional[float] = NEAR_DUPLICATE_THRESHOLD,
+) -> ContentSplit:
+    """
+    Split `opportunities` into new, changed and unchanged by content hash.
+
+    New records that are near-duplicates of a stored one (MinHash similarity
+    at or above `near_duplicate_threshold`; None skips the check) move to
+    changed.
+    """
+    split = ContentSplit()
+    stored = db.get_scored_by_urls(opp.url for opp in opportunities)
+
+    for opp in opportunities:
+        digest = content_hash(opp)
+        if opp.url:
+            split.hashes[opp.url] = digest
+
+        previous = stored.get(opp.url) if opp.url else None
+        if previous is None:
+            split.new.append(opp)
+        elif previous[0] == digest:
+            split.unchanged.append(previous[1])
+        else:
+            split.changed.append(opp)
+
+    if near_duplicate_threshold is not None and split.new:
+        known = {opp.url for opp in opportunities if opp.url}
+        urls, signatures = db.get_stored_signatures()
+        keep = [i for i, url in enumerate(urls) if url not in known]
+        if keep:
+            matches = _match_stored(split.new, [urls[i] for i in keep], signatures[keep], near_duplicate_threshold)
+            matched = {opp.url: opp for opp in db.get_stored_opportunities(url for url in matches if url)}
+            still_new = []
+            for opp, url in zip(split.new, matches):
+                if url is None or url not in matched or not opp.url:
+                    still_new.append(opp)
+                    continue
+                split.reposted[opp.url] = url
+                split.changed.append(opp.model_copy(update={"sources": merge_sources([opp, matched[url]])}))
+            split.new = still_new
+    return split
@@ -0,0 +1,187 @@
+"""
+Report phase shared by the CLI workflow and the API workflow service.
+
+The Markdown report (Executive Summary counts, one section per domain with
+its opportunities ranked by total score, score tables, appendix) is rendered
+from a Jinja2 template. The only LLM call is a small one for the Key
+Findings bullets, made from a compact summary of the scored opportunities;
+if it fails, deterministic findings are used.
+"""
+import json
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence
+
+from jinja2 import Environment, StrictUndefined
+
+from Opportunity_Discovery_Workflow.Models.data_models import KeyFindings, ScoredOpportunity
+from Opportunity_Discovery_Workflow.utils.report_templates import REPORT_TEMPLATE
+
+# Opportunities listed individually in the Key Findings prompt
+KEY_FINDINGS_TOP_N = 12
+# Close dates within this many days count as upcoming deadlines
+UPCOMING_DEADLINE_DAYS = 30
+STRONG_SCORE = 7.0
+OTHER_DOMAIN = "Other"
+
+_PROMPT = "Summary of the scored opportunities in this report:\n{summary}\n\nWrite the Key Findings."
+
+
+@dataclass
+class ReportResult:
+    """Rendered Markdown report and where its Key Findings came from."""
+    markdown: str
+    key_findings: List[str] = field(default_factory=list)
+    llm_error: Optional[str] = None
+
+
+@lru_cache(maxsize=1)
+def _template():
+    environment = Environment(trim_blocks=True, lstrip_blocks=True, keep_trailing_newline=True, undefined=StrictUndefined)
+    return environment.from_string(REPORT_TEMPLATE)
+
+
+def _ranked(opportunities: Sequence[ScoredOpportunity]) -> List[ScoredOpportunity]:
+    return sorted(opportunities, key=lambda opp: (-opp.total_score, opp.title or "", opp.url or ""))
+
+
+def group_by_domain(opportunities: Sequence[ScoredOpportunity]) -> List[Dict]:
+    """Domains with at least one opportunity, largest first, each ranked by total score."""
+    groups: Dict[str, List[ScoredOpportunity]] = {}
+    for opp in _ranked(opportunities):
+        groups.setdefault(opp.sector or OTHER_DOMAIN, []).append(opp)
+    return [
+        {"name": name, "opportunities": opps}
+        for name, opps in sorted(groups.items(), key=lambda item: (-len(item[1]), item[0]))
+    ]
+
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    try:
+        return datetime.strptime((value or "")[:10], "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+def analysis_period(opportunities: Sequence[ScoredOpportunity]) -> str:
+    """Range of published dates, or "Not specified"."""
+    dates = sorted(d for d in (_parse_date(opp.published_date) for opp in opportunities) if d)
+    if not dates:
+        return "Not specified"
+    return f"{dates[0].isoformat()} to {dates[-1].isoformat()}"
+
+
+def _upcoming(opportunities: Sequence[ScoredOpportunity], today: date) -> List[ScoredOpportunity]:
+    horizon = today + timedelta(days=UPCOMING_DEADLINE_DAYS)
+    upcoming = [opp for opp in opportunities if (closes := _parse_date(opp.closeDate)) and today <= closes <= horizon]
+    return sorted(upcoming, key=lambda opp: opp.closeDate)
+
+
+def summarize(opportunities: Sequence[ScoredOpportunity], today: Optional[date] = None) -> Dict:
+    """Compact facts about the report for the Key Findings prompt."""
+    today = today or date.today()
+    ranked = _ranked(opportunities)
+    scores = [opp.total_score for opp in ranked]
+    return {
+        "total": len(ranked),
+        "domains": dict(Counter(opp.sector or OTHER_DOMAIN for opp in ranked).most_common()),
+        "agencies": dict(Counter(opp.agency for opp in ranked if opp.agency).most_common(8)),
+        "scores": {
+            "max": max(scores, default=0.0),
+            "average": round(sum(scores) / len(scores), 2) if scores else 0.0,
+            f"at_least_{STRONG_SCORE:g}": sum(score >= STRONG_SCORE for score in scores),
+        },
+        "upcoming_deadlines": [
+            {"title": opp.title, "close_date": opp.closeDate, "total_score": opp.total_score}
+            for opp in _upcoming(ranked, today)[:5]
+        ],
+        "top_opportunities": [
+            {
+                "title": opp.title,
+                "domain": opp.sector,
+                "agency": opp.agency,
+                "total_score": opp.total_score,
+                "close_date": opp.closeDate,
+            }
+            for opp in ranked[:KEY_FINDINGS_TOP_N]
+        ],
+    }
+
+
+def fallback_findings(opportunities: Sequence[ScoredOpportunity], today: Optional[date] = None) -> List[str]:
+    """Key Findings stated directly from the data, used when the agent is unavailable."""
+    today = today or date.today()
+    ranked = _ranked(opportunities)
+    if not ranked:
+        return ["No opportunities matched the configured domains in this period."]
+    top = ranked[0]
+    domains = Counter(opp.sector or OTHER_DOMAIN for opp in ranked)
+    domain, count = domains.most_common(1)[0]
+    findings = [
+        f"The highest-scoring opportunity is \"{top.title}\" ({top.sector or OTHER_DOMAIN}) at {top.total_score:.2f}/10.",
+        f"{domain} leads with {count} of {len(ranked)} opportunities.",
+        f"{sum(opp.total_score >= STRONG_SCORE for opp in ranked)} opportunities score {STRONG_SCORE:g} or higher.",
+    ]
+    upcoming = _upcoming(ranked, today)
+    if upcoming:
+        findings.append(f"{len(upcoming)} opportunities close within {UPCOMING_DEADLINE_DAYS} days, "
+                        f"the first on {upcoming[0].closeDate}.")
+    return findings
+
+
+def key_findings(opportunities: Sequence[ScoredOpportunity], agent_factory: Callable):
+    """Key Findings bullets from the agent, and the error if it had to fall back."""
+    try:
+        agent = agent_factory()
+        response = agent.run(
+            _PROMPT.format(summary=json.dumps(summarize(opportunities), separators=(",", ":"))),
+            response_model=KeyFindings,
+        )
+        if not response.content or isinstance(response.content, str):
+            raise ValueError("unexpected response format")
+        findings = [finding.strip().lstrip("-* ").strip() for finding in response.content.findings]
+        findings = [finding for finding in findings if finding]
+        if not findings:
+            raise ValueError("no findings returned")
+        return findings, None
+    except Exception as e:
+        return fallback_findings(opportunities), str(e)
+
+
+def render_report(
+    opportunities: Sequence[ScoredOpportunity],
+    findings: Sequence[str],
+    period: Optional[str] = None,
+    generated_at: Optional[datetime] = None,
+) -> str:
+    """Render the Markdown report; no LLM involved."""
+    return _template().render(
+        generated_at=(generated_at or datetime.now()).strftime("%Y-%m-%d"),
+        total=len(opportunities),
+        period=period or analysis_period(opportunities),
+        domains=group_by_domain(opportunities),
+        heuristic_count=sum(opp.score_method == "heuristic" for opp in opportunities),
+        key_findings=list(findings),
+        sources=sorted({opp.source for opp in opportunities if opp.source}),
+    )
+
+
+def generate_report(
+    opportunities: Sequence[ScoredOpportunity],
+    agent_factory: Optional[Callable] = None,
+    period: Optional[str] = None,
+    generated_at: Optional[datetime] = None,
+) -> ReportResult:
+    """Key Findings from one small agent call, everything else from the template."""
+    if agent_factory is None:
+        from Opportunity_Discovery_Workflow.Agents.key_findings_agent import get_agent
+        agent_factory = get_agent
+
+    findings, error = key_findings(opportunities, agent_factory) if opportunities else (fallback_findings([]), None)
+    return ReportResult(
+        markdown=render_report(opportunities, findings, period, generated_at),
+        key_findings=findings,
+        llm_error=error,
+    )
@@ -0,0 +1,220 @@
+"""
+Scoring phase shared by the CLI workflow and the API workflow service.
+
+Opportunities are packed into token-budgeted chunks that are scored
+concurrently. Each response is matched back to its inputs; records the agent
+dropped are resubmitted in a later round. The merged list is ranked by
+total score with a deterministic tie-break.
+
+With a ScoreCache, records whose content was already scored under the same
+instructions and model are served from it and never reach the agent. The
+remaining records are triaged by the heuristic pre-scorer: only the most
+promising go to the agent, the rest keep their provisional score.
+"""
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from Opportunity_Discovery_Workflow.Database.score_cache import SCORE_FIELDS, ScoreCache, instructions_hash
+from Opportunity_Discovery_Workflow.Instructions.scoring_instructions import scoring_instructions
+from Opportunity_Discovery_Workflow.Models.data_models import (
+    Opportunity,
+    ScoredOpportunity,
+    ScoredOpportunityList,
+)
+from Opportunity_Discovery_Workflow.utils.dedup import content_hash, normalize_title
+from Opportunity_Discovery_Workflow.utils.keyword_index import KeywordIndex
+from Opportunity_Discovery_Workflow.utils.prescoring import PRESCORE_THRESHOLD, PRESCORE_TOP_N, prescore
+from Opportunity_Discovery_Workflow.utils.relevance import RelevanceMatrix, RelevanceRanker
+from workflow_common.tokens import count_tokens
+
+# Prompt tokens of opportunity JSON per scoring call; responses run several
+# times longer, so chunks stay well under the output limit
+SCORING_TOKEN_BUDGET = 3000
+SCORING_BATCH_SIZE = 15
+MAX_CONCURRENT_SCORING_CHUNKS = 8
+# Extra rounds for records missing from a response
+MAX_RESUBMITS = 2
+
+_PROMPT = "Here is the list of opportunities:\n{opportunities}\n\nScore and rank them."
+# Score cache key part; changes whenever the instructions or the prompt do
+SCORING_VERSION = instructions_hash(scoring_instructions, _PROMPT)
+
+
+@dataclass
+class ScoringResult:
+    """Ranked scored opportunities plus how the chunks went."""
+    scored: List[ScoredOpportunity] = field(default_factory=list)
+    chunk_count: int = 0
+    cache_hits: int = 0
+    heuristic: int = 0
+    resubmitted: int = 0
+    unscored: List[Opportunity] = field(default_factory=list)
+    llm_errors: List[str] = field(default_factory=list)
+
+    @property
+    def summary(self) -> str:
+        text = f"{len(self.scored)} scored in {self.chunk_count} chunks"
+        if self.cache_hits:
+            text += f", {self.cache_hits} from score cache"
+        if self.heuristic:
+            text += f", {self.heuristic} heuristic only"
+        if self.resubmitted:
+            text += f", {self.resubmitted} resubmitted"
+        if self.unscored:
+            text += f", {len(self.unscored)} could not be scored"
+        return text
+
+
+def _payload(opportunities: List[Opportunity]) -> str:
+    return json.dumps([opp.model_dump(exclude={"sources"}) for opp in opportunities], separators=(",", ":"))
+
+
+def _keys(opp: Opportunity) -> List[str]:
+    keys = []
+    if opp.url:
+        keys.append(f"url:{opp.url}")
+    if opp.title:
+        keys.append(f"title:{normalize_title(opp.title)}")
+    return keys
+
+
+def plan_chunks(
+    opportunities: List[Opportunity],
+    token_budget: int = SCORING_TOKEN_BUDGET,
+    batch_size: int = SCORING_BATCH_SIZE,
+) -> List[List[Opportunity]]:
+    """Pack opportunities in order into chunks of at most `token_budget` tokens and `batch_size` records."""
+    chunks, current, used = [], [], 0
+    for opp in opportunities:
+        tokens = count_tokens(_payload([opp]))
+        if current and (used + tokens > token_budget or len(current) >= batch_size):
+            chunks.append(current)
+            current, used = [], 0
+        current.append(opp)
+        used += tokens
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _run_chunk(agent_factory: Callable, chunk: List[Opportunity]):
+    """
+    Score one chunk. Returns the scored records matched to their inputs (the
+    input fields are kept, only the scores come from the agent), the inputs
+    the response left out, and the error if the call failed.
+    """
+    try:
+        agent = agent_factory()
+        response = agent.run(
+            _PROMPT.format(opportunities=_payload(chunk)),
+            response_model=ScoredOpportunityList
+        )
+        if not response.content or isinstance(response.content, str):
+            raise ValueError("unexpected response format")
+        returned = response.content.opportunities
+    except Exception as e:
+        return [], list(chunk), str(e)
+
+    pending: Dict[str, int] = {}
+    for i, opp in enumerate(chunk):
+        for key in _keys(opp):
+            pending.setdefault(key, i)
+
+    scored, matched = [], set()
+    for item in returned:
+        index = next((pending[key] for key in _keys(item) if key in pending and pending[key] not in matched), None)
+        if index is None:
+            continue
+        matched.add(index)
+        scores = {name: getattr(item, name) for name in SCORE_FIELDS}
+        scored.append(ScoredOpportunity(**chunk[index].model_dump(), **scores))
+
+    missing = [opp for i, opp in enumerate(chunk) if i not in matched]
+    return scored, missing, None
+
+
+def _relevance(opportunities: List[Opportunity]) -> RelevanceMatrix:
+    return RelevanceRanker(KeywordIndex.load().queries).score(opportunities)
+
+
+def score_opportunities(
+    opportunities: List[Opportunity],
+    agent_factory: Optional[Callable] = None,
+    token_budget: int = SCORING_TOKEN_BUDGET,
+    batch_size: int = SCORING_BATCH_SIZE,
+    max_workers: int = MAX_CONCURRENT_SCORING_CHUNKS,
+    max_resubmits: int = MAX_RESUBMITS,
+    cache: Optional[ScoreCache] = None,
+    model_id: Optional[str] = None,
+    triage: bool = True,
+    top_n: Optional[int] = PRESCORE_TOP_N,
+    threshold: Optional[float] = PRESCORE_THRESHOLD,
+) -> ScoringResult:
+    """
+    Score `opportunities` in concurrent chunks, resubmitting records a chunk
+    dropped, and rank the result by total score (ties by title, then URL).
+
+    `cache` is consulted before and filled after the agent calls; `model_id`
+    (default: the scoring agent's model) must be the model `agent_factory`
+    builds so cached scores stay keyed to it.
+
+    With `triage`, records not served from the cache are pre-scored and only
+    the `top_n` at or above `threshold` reach the agent.
+    """
+    if agent_factory is None:
+        from Opportunity_Discovery_Workflow.Agents.scoring_agent import get_agent
+        agent_factory = get_agent
+    if cache is not None and model_id is None:
+        from Opportunity_Discovery_Workflow.Agents.scoring_agent import DEFAULT_MODEL_ID
+        model_id = DEFAULT_MODEL_ID
+
+    result = ScoringResult()
+    pending = list(opportunities)
+    if cache is not None and pending:
+        hashes = [content_hash(opp) for opp in pending]
+        cached = cache.get_many(hashes, SCORING_VERSION, model_id)
+        misses = []
+        for opp, digest in zip(pending, hashes):
+            if digest in cached:
+                result.scored.append(ScoredOpportunity(**opp.model_dump(), **cached[digest]))
+            else:
+                misses.append(opp)
+        result.cache_hits = len(result.scored)
+        pending = misses
+
+    heuristic: List[ScoredOpportunity] = []
+    if triage and pending:
+        triaged = prescore(pending, _relevance(pending), top_n=top_n, threshold=threshold)
+        pending, heuristic = triaged.to_score, triaged.heuristic
+        result.heuristic = len(heuristic)
+
+    for round_number in range(max_resubmits + 1):
+        if not pending:
+            break
+        if round_number:
+            result.resubmitted += len(pending)
+        chunks = plan_chunks(pending, token_budget, batch_size)
+        result.chunk_count += len(chunks)
+        pending = []
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as executor:
+            outputs = list(executor.map(lambda chunk: _run_chunk(agent_factory, chunk), chunks))
+        for chunk_index, (scored, missing, error) in enumerate(outputs):
+            if error:
+                result.llm_errors.append(f"round {round_number + 1} chunk {chunk_index + 1}: {error}")
+            result.scored.extend(scored)
+            pending.extend(missing)
+
+    result.unscored = pending
+    if cache is not None:
+        fresh = result.scored[result.cache_hits:]
+        cache.put_many(
+            [(content_hash(opp), {name: getattr(opp, name) for name in SCORE_FIELDS}) for opp in fresh],
+            SCORING_VERSION,
+            model_id,
+        )
+    # Only agent scores are cached; heuristic ones carry their score_method flag
+    result.scored.extend(heuristic)
+    result.scored.sort(key=lambda opp: (-opp.total_score, opp.title or "", opp.url or ""))
+    return result
@@ -48,6 +48,7 @@ class Settings(BaseSettings):
     default_days_back: int = 7
     max_days_back: int = 30
     batch_size: int = 10
+    fetch_timeout_seconds: float = 300.0
     
     class Config:
         env_file = ".env"
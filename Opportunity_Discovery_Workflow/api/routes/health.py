@@ -4,7 +4,7 @@ Health check and system status endpoints.
 from fastapi import APIRouter, status
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import os
 import sys
 
@@ -27,6 +27,11 @@ class SystemInfoResponse(BaseModel):
     database_exists: bool
     keywords_file_exists: bool
     outputs_directory_exists: bool
+    source_http: Optional[Dict[str, int]] = None
+    source_cache: Optional[Dict[str, Any]] = None
+    agent_cache: Optional[Dict[str, Any]] = None
+    agent_registry: Optional[Dict[str, Any]] = None
+    pdf_renderer: Optional[Dict[str, Any]] = None
 
 
 @router.get(
@@ -88,11 +93,17 @@ async def system_info():
     """
     Get system information.
     
-    Returns Python version, platform, and resource availability.
+    Returns Python version, platform, resource availability, and counters
+    for the shared source HTTP client and its response cache.
     """
     import platform
+    from Opportunity_Discovery_Workflow.tools.http_client import get_http_client
+    from workflow_common.agent_cache import get_agent_cache
+    from Opportunity_Discovery_Workflow.Agents.registry import get_registry
+    from workflow_common.pdf_service import get_pdf_service
     
     base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    http_client = get_http_client()
     
     return SystemInfoResponse(
         python_version=sys.version,
@@ -101,4 +112,9 @@ async def system_info():
         database_exists=os.path.exists(os.path.join(base_path, "opportunity_discovery.db")),
         keywords_file_exists=os.path.exists(r"d:\Agno\keywords.json"),
         outputs_directory_exists=os.path.exists(os.path.join(base_path, "outputs")),
+        source_http=http_client.stats(),
+        source_cache=http_client.cache_stats(),
+        agent_cache=get_agent_cache().stats(),
+        agent_registry=get_registry().stats(),
+        pdf_renderer=get_pdf_service().stats(),
     )
@@ -80,6 +80,39 @@ async def get_statistics():
     return opportunity_service.get_statistics()
 
 
+@router.get(
+    "/score-cache",
+    response_model=Dict[str, Any],
+    summary="Get Score Cache Statistics",
+    description="Get entry count and hit ratio of the persistent score cache."
+)
+async def get_score_cache_stats():
+    """
+    Get statistics about the score cache.
+    
+    Cached scores are keyed by opportunity content, scoring instructions and model.
+    """
+    return opportunity_service.get_score_cache_stats()
+
+
+@router.delete(
+    "/score-cache",
+    response_model=Dict[str, int],
+    summary="Invalidate Score Cache",
+    description="Delete cached scores so opportunities are re-scored by the scoring agent."
+)
+async def clear_score_cache(
+    stale_only: bool = Query(default=False, description="Only delete scores from previous scoring instructions"),
+):
+    """
+    Invalidate cached scores, e.g. after editing the organizational context
+    in the scoring instructions.
+    
+    - **stale_only**: Keep scores produced by the current instructions
+    """
+    return {"removed": opportunity_service.clear_score_cache(stale_only=stale_only)}
+
+
 @router.get(
     "/sectors",
     response_model=Dict[str, int],
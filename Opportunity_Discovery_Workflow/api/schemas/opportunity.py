@@ -2,7 +2,7 @@
 Pydantic schemas for Opportunity API endpoints.
 """
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 
@@ -39,6 +39,10 @@ class ScoredOpportunityResponse(OpportunityResponse):
     alignment_score: float = Field(..., ge=0, le=10, description="Alignment score (0-10)")
     total_score: float = Field(..., ge=0, le=10, description="Total/average score (0-10)")
     justification: Optional[str] = Field(None, description="Reasoning for the score")
+    score_method: Optional[str] = Field(None, description="'llm' or 'heuristic' (pre-scored, not reviewed by the scoring agent)")
+    sources: Optional[List[Dict[str, Optional[str]]]] = Field(
+        None, description="Source records merged into this opportunity (source, opportunity_number, url)"
+    )
 
 
 class OpportunityListResponse(BaseModel):
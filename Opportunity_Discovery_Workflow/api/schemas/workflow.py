@@ -58,6 +58,10 @@ class WorkflowRequest(BaseModel):
         default=True,
         description="Whether to save results to database"
     )
+    full_backfill: bool = Field(
+        default=False,
+        description="Ignore fetch watermarks and re-fetch the whole days_back window"
+    )
 
 
 class WorkflowPhaseResult(BaseModel):
@@ -67,6 +71,12 @@ class WorkflowPhaseResult(BaseModel):
     count: Optional[int] = Field(None, description="Number of items processed")
     duration_seconds: Optional[float] = Field(None, description="Duration of phase in seconds")
     message: Optional[str] = Field(None, description="Status message or error")
+    source_latencies: Optional[Dict[str, float]] = Field(
+        None, description="Per-source fetch latency in seconds (fetch phase only)"
+    )
+    source_errors: Optional[Dict[str, str]] = Field(
+        None, description="Per-source fetch errors (fetch phase only)"
+    )
 
 
 class WorkflowResponse(BaseModel):
@@ -92,6 +102,10 @@ class WorkflowStatusResponse(BaseModel):
     total_opportunities_scored: Optional[int] = Field(None, description="Total opportunities scored")
     report_path: Optional[str] = Field(None, description="Path to generated markdown report")
     pdf_path: Optional[str] = Field(None, description="Path to generated PDF report")
+    pdf_job_id: Optional[str] = Field(None, description="Background PDF rendering job ID")
+    pdf_status: Optional[str] = Field(
+        None, description="PDF rendering status: queued, running, completed, failed or timeout"
+    )
     error: Optional[str] = Field(None, description="Error message if failed")
 
 
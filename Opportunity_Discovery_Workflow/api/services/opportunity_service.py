@@ -1,6 +1,7 @@
 """
 Service layer for Opportunity operations.
 """
+import json
 import sqlite3
 import os
 from typing import List, Optional, Dict, Any
@@ -15,6 +16,13 @@ from ..schemas.opportunity import (
 )
 
 
+def _sources(row: sqlite3.Row) -> Optional[List[Dict[str, Any]]]:
+    """Merged source records stored with a row, if any."""
+    if "sources" not in row.keys() or not row["sources"]:
+        return None
+    return json.loads(row["sources"])
+
+
 class OpportunityService:
     """Service class for opportunity database operations."""
     
@@ -142,6 +150,8 @@ class OpportunityService:
                 alignment_score=row["alignment_score"] or 0.0,
                 total_score=row["total_score"] or 0.0,
                 justification=row["justification"],
+                score_method=row["score_method"] if "score_method" in row.keys() else None,
+                sources=_sources(row),
             )
             opportunities.append(opp)
             if row["total_score"]:
@@ -185,6 +195,8 @@ class OpportunityService:
             alignment_score=row["alignment_score"] or 0.0,
             total_score=row["total_score"] or 0.0,
             justification=row["justification"],
+            score_method=row["score_method"] if "score_method" in row.keys() else None,
+            sources=_sources(row),
         )
     
     def get_opportunities_by_sector(self, sector: str) -> ScoredOpportunityListResponse:
@@ -293,3 +305,22 @@ class OpportunityService:
             "by_sector": sector_dist,
             "by_source": source_dist,
         }
+    
+    def get_score_cache_stats(self) -> Dict[str, Any]:
+        """Get size and instruction versions of the persistent score cache."""
+        from Opportunity_Discovery_Workflow.Database.score_cache import get_score_cache
+        from Opportunity_Discovery_Workflow.Workflows.scoring import SCORING_VERSION
+        
+        stats = get_score_cache().stats()
+        stats["current_instructions_hash"] = SCORING_VERSION
+        return stats
+    
+    def clear_score_cache(self, stale_only: bool = False) -> int:
+        """Delete cached scores (only those from older scoring instructions if `stale_only`)."""
+        from Opportunity_Discovery_Workflow.Database.score_cache import get_score_cache
+        from Opportunity_Discovery_Workflow.Workflows.scoring import SCORING_VERSION
+        
+        cache = get_score_cache()
+        if stale_only:
+            return cache.invalidate(keep_instructions=SCORING_VERSION)
+        return cache.invalidate()
@@ -2,7 +2,6 @@
 Service layer for Workflow operations.
 """
 import os
-import json
 import uuid
 import asyncio
 from datetime import datetime
@@ -19,6 +18,7 @@ from ..schemas.workflow import (
     WorkflowPhaseResult,
     DataSource,
 )
+from ..config import settings
 
 
 class WorkflowService:
@@ -106,62 +106,69 @@ class WorkflowService:
     def _execute_workflow(self, workflow_id: str, request: WorkflowRequest):
         """Execute the workflow in a background thread."""
         import time
+        from workflow_common.artifacts import ArtifactSink
         
+        # Disk writes of this run happen off the workflow thread
+        artifacts = ArtifactSink(self.output_dir)
         try:
             self._update_workflow_status(workflow_id, status=WorkflowStatus.RUNNING)
             
             # Import workflow components
-            from Opportunity_Discovery_Workflow.Agents.simpler_grants_gov_agent import get_agent as get_fetch_agent_simpler
-            from Opportunity_Discovery_Workflow.Agents.grants_gov_agent import get_agent as get_fetch_agent_grants_gov
-            from Opportunity_Discovery_Workflow.Agents.sam_gov_agent import get_agent as get_fetch_agent_sam_gov
-            from Opportunity_Discovery_Workflow.Agents.aggregation_agent import get_agent as get_aggregation_agent
-            from Opportunity_Discovery_Workflow.Agents.filter_agent import get_agent as get_filter_agent
-            from Opportunity_Discovery_Workflow.Agents.scoring_agent import get_agent as get_scoring_agent
-            from Opportunity_Discovery_Workflow.Agents.report_agent import get_agent as get_report_agent
-            from Opportunity_Discovery_Workflow.Models.data_models import OpportunityList, ScoredOpportunityList
+            from Opportunity_Discovery_Workflow.Agents.registry import get_registry
+            from Opportunity_Discovery_Workflow.Workflows.fetch_engine import FetchEngine, source_fetchers
+            from Opportunity_Discovery_Workflow.Workflows.aggregation import aggregate_opportunities
+            from Opportunity_Discovery_Workflow.Workflows.incremental import split_by_content
+            from Opportunity_Discovery_Workflow.Workflows.filtering import filter_opportunities, filter_unchanged
+            from Opportunity_Discovery_Workflow.Workflows.scoring import score_opportunities
+            from Opportunity_Discovery_Workflow.Workflows.reporting import generate_report
+            from Opportunity_Discovery_Workflow.Database.score_cache import get_score_cache
+            from workflow_common.agent_cache import cached_factory
+            from Opportunity_Discovery_Workflow.Database.db_manager import DBManager
+            from Opportunity_Discovery_Workflow.Database.watermark_store import WatermarkStore
+            from Opportunity_Discovery_Workflow.utils.dedup import near_duplicate_threshold
             
-            all_opportunities = []
+            # Warm agents shared by every workflow run in this process
+            agents = get_registry()
+            similarity_threshold = near_duplicate_threshold()
             
             # PHASE 1: FETCH
             self._update_workflow_status(workflow_id, current_phase=WorkflowPhase.FETCH)
-            phase_start = time.time()
             
             sources_to_fetch = request.sources
             if DataSource.ALL in sources_to_fetch:
                 sources_to_fetch = [DataSource.SIMPLER_GRANTS, DataSource.GRANTS_GOV, DataSource.SAM_GOV]
             
-            # Fetch from each source
-            for source in sources_to_fetch:
-                try:
-                    if source == DataSource.SIMPLER_GRANTS:
-                        agent = get_fetch_agent_simpler()
-                    elif source == DataSource.GRANTS_GOV:
-                        agent = get_fetch_agent_grants_gov()
-                    elif source == DataSource.SAM_GOV:
-                        agent = get_fetch_agent_sam_gov()
-                    else:
-                        continue
-                    
-                    response = agent.run(
-                        f"Fetch opportunities posted in the last {request.days_back} days.",
-                        response_model=OpportunityList
-                    )
-                    
-                    if response.content and not isinstance(response.content, str):
-                        all_opportunities.extend(response.content.opportunities)
-                        
-                except Exception as e:
-                    print(f"Error fetching from {source}: {e}")
+            # Fetch all selected sources concurrently
+            fetch_engine = FetchEngine(
+                source_fetchers(),
+                timeout=settings.fetch_timeout_seconds,
+                watermarks=WatermarkStore(),
+            )
+            fetch_result = fetch_engine.fetch(
+                [source.value for source in sources_to_fetch],
+                days_back=request.days_back,
+                full_backfill=request.full_backfill,
+                domains=request.domains,
+            )
+            all_opportunities = fetch_result.opportunities
+            
+            for source, error in fetch_result.errors.items():
+                print(f"Error fetching from {source}: {error}")
+            
+            fetch_message = f"Fetched {len(all_opportunities)} opportunities"
+            if fetch_result.errors:
+                fetch_message += f" (failed: {', '.join(fetch_result.errors)})"
             
-            fetch_duration = time.time() - phase_start
             self._update_workflow_status(
                 workflow_id,
                 phase_result=WorkflowPhaseResult(
                     phase=WorkflowPhase.FETCH,
                     status=WorkflowStatus.COMPLETED,
                     count=len(all_opportunities),
-                    duration_seconds=round(fetch_duration, 2),
-                    message=f"Fetched {len(all_opportunities)} opportunities"
+                    duration_seconds=round(fetch_result.duration_seconds, 2),
+                    message=fetch_message,
+                    source_latencies=fetch_result.latencies,
+                    source_errors=fetch_result.errors or None,
                 ),
                 total_opportunities_found=len(all_opportunities)
             )
@@ -179,21 +186,17 @@ class WorkflowService:
             self._update_workflow_status(workflow_id, current_phase=WorkflowPhase.AGGREGATE)
             phase_start = time.time()
             
+            aggregation_message = None
             try:
-                aggregation_agent = get_aggregation_agent()
-                opps_json = json.dumps([opp.model_dump() for opp in all_opportunities], indent=2)
-                
-                response = aggregation_agent.run(
-                    f"Here is the list of opportunities:\n{opps_json}\n\nMerge duplicates and enrich.",
-                    response_model=OpportunityList
+                aggregation = aggregate_opportunities(
+                    all_opportunities,
+                    cached_factory(agents.factory("aggregation")),
+                    near_duplicate_threshold=similarity_threshold,
                 )
-                
-                if response.content and not isinstance(response.content, str):
-                    aggregated_opportunities = response.content.opportunities
-                else:
-                    # Fallback: basic deduplication
-                    unique = {opp.url or opp.title: opp for opp in all_opportunities}
-                    aggregated_opportunities = list(unique.values())
+                aggregated_opportunities = aggregation.opportunities
+                aggregation_message = f"Aggregated to {aggregation.summary}"
+                if aggregation.llm_error:
+                    print(f"Aggregation LLM error: {aggregation.llm_error}")
                     
             except Exception as e:
                 print(f"Aggregation error: {e}")
@@ -207,34 +210,36 @@ class WorkflowService:
                     status=WorkflowStatus.COMPLETED,
                     count=len(aggregated_opportunities),
                     duration_seconds=round(agg_duration, 2),
-                    message=f"Aggregated to {len(aggregated_opportunities)} unique opportunities"
+                    message=aggregation_message or f"Aggregated to {len(aggregated_opportunities)} unique opportunities"
                 )
             )
             
+            # Skip records already scored in an earlier run with the same content
+            db = DBManager()
+            content_split = split_by_content(aggregated_opportunities, db, similarity_threshold)
+            to_process = content_split.to_process
+            
             # PHASE 3: FILTER
             self._update_workflow_status(workflow_id, current_phase=WorkflowPhase.FILTER)
             phase_start = time.time()
             
+            filter_summary = None
+            # Watermarks only advance once everything fetched was filtered, scored and saved
+            processed_ok = request.save_to_db
             try:
-                filter_agent = get_filter_agent()
-                filtered_opportunities = []
-                batch_size = 10
-                
-                for i in range(0, len(aggregated_opportunities), batch_size):
-                    batch = aggregated_opportunities[i:i + batch_size]
-                    opps_json = json.dumps([opp.model_dump() for opp in batch], indent=2)
-                    
-                    response = filter_agent.run(
-                        f"Filter these opportunities:\n{opps_json}",
-                        response_model=OpportunityList
-                    )
-                    
-                    if response.content and not isinstance(response.content, str):
-                        filtered_opportunities.extend(response.content.opportunities)
+                filter_result = filter_opportunities(to_process, cached_factory(agents.factory("filter")), domains=request.domains)
+                filtered_opportunities = filter_result.opportunities
+                # Unchanged records keep their scores but still honour the requested domains
+                reused = filter_unchanged(content_split.unchanged, domains=request.domains)
+                filter_summary = filter_result.summary
+                for error in filter_result.llm_errors:
+                    print(f"Filter LLM error: {error}")
                         
             except Exception as e:
                 print(f"Filter error: {e}")
-                filtered_opportunities = aggregated_opportunities
+                filtered_opportunities = to_process
+                reused = content_split.unchanged
+                processed_ok = False
             
             filter_duration = time.time() - phase_start
             self._update_workflow_status(
@@ -244,11 +249,18 @@ class WorkflowService:
                     status=WorkflowStatus.COMPLETED,
                     count=len(filtered_opportunities),
                     duration_seconds=round(filter_duration, 2),
-                    message=f"Filtered to {len(filtered_opportunities)} relevant opportunities"
+                    message=(
+                        f"Filtered to {len(filtered_opportunities)} relevant opportunities "
+                        f"({content_split.summary}, {len(reused)} unchanged still relevant"
+                        + (f"; {filter_summary}" if filter_summary else "")
+                        + ")"
+                    )
                 )
             )
             
-            if not filtered_opportunities:
+            if not filtered_opportunities and not reused:
+                if processed_ok:
+                    fetch_engine.commit_watermarks(fetch_result)
                 self._update_workflow_status(
                     workflow_id,
                     status=WorkflowStatus.COMPLETED,
@@ -261,23 +273,27 @@ class WorkflowService:
             self._update_workflow_status(workflow_id, current_phase=WorkflowPhase.SCORE)
             phase_start = time.time()
             
+            scored_opportunities = []
+            scoring_summary = None
             try:
-                scoring_agent = get_scoring_agent()
-                opps_json = json.dumps([opp.model_dump() for opp in filtered_opportunities], indent=2)
-                
-                response = scoring_agent.run(
-                    f"Score these opportunities:\n{opps_json}",
-                    response_model=ScoredOpportunityList
-                )
-                
-                if response.content and not isinstance(response.content, str):
-                    scored_opportunities = response.content.opportunities
-                else:
-                    scored_opportunities = []
-                    
+                if filtered_opportunities:
+                    scoring_result = score_opportunities(
+                        filtered_opportunities, cached_factory(agents.factory("scoring")), cache=get_score_cache()
+                    )
+                    scored_opportunities = scoring_result.scored
+                    scoring_summary = scoring_result.summary
+                    for error in scoring_result.llm_errors:
+                        print(f"Scoring chunk error: {error}")
+                    if scoring_result.unscored:
+                        processed_ok = False
+
             except Exception as e:
                 print(f"Scoring error: {e}")
                 scored_opportunities = []
+                processed_ok = False
+
+            newly_scored = scored_opportunities
+            scored_opportunities = newly_scored + reused
             
             score_duration = time.time() - phase_start
             self._update_workflow_status(
@@ -287,49 +303,44 @@ class WorkflowService:
                     status=WorkflowStatus.COMPLETED,
                     count=len(scored_opportunities),
                     duration_seconds=round(score_duration, 2),
-                    message=f"Scored {len(scored_opportunities)} opportunities"
+                    message=(
+                        f"Scored {len(newly_scored)} opportunities, "
+                        f"reused {len(reused)} unchanged"
+                        + (f"; {scoring_summary}" if scoring_summary else "")
+                    )
                 ),
                 total_opportunities_scored=len(scored_opportunities)
             )
             
             # Save scored opportunities
+            if request.save_to_db and newly_scored:
+                db.save_scored_opportunities(newly_scored, content_split.hashes)
+            
+            if processed_ok:
+                fetch_engine.commit_watermarks(fetch_result)
+            
             if request.save_to_db and scored_opportunities:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                scored_filename = f"simple_grants_scored_{timestamp}.json"
-                scored_filepath = os.path.join(self.output_dir, scored_filename)
-                
-                with open(scored_filepath, "w", encoding="utf-8") as f:
-                    json.dump([opp.model_dump() for opp in scored_opportunities], f, indent=2)
+                artifacts.write_json(f"simple_grants_scored_{timestamp}.json", scored_opportunities)
             
             # PHASE 5: REPORT
             report_path = None
-            pdf_path = None
+            report_markdown = None
             if request.generate_report and scored_opportunities:
                 self._update_workflow_status(workflow_id, current_phase=WorkflowPhase.REPORT)
                 phase_start = time.time()
                 
                 try:
-                    report_agent = get_report_agent()
                     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    
-                    # Save data for report
-                    data_filename = f"api_workflow_data_{timestamp}.json"
-                    data_filepath = os.path.join(self.output_dir, data_filename)
-                    
-                    with open(data_filepath, "w", encoding="utf-8") as f:
-                        json.dump([opp.model_dump() for opp in scored_opportunities], f, indent=2)
-                    
                     report_filename = f"API_Workflow_Report_{timestamp}.md"
                     
-                    report_agent.run(
-                        f"Read '{data_filename}' and generate a report. Save as '{report_filename}'."
-                    )
-                    
-                    report_path = report_filename
+                    report_result = generate_report(scored_opportunities, cached_factory(agents.factory("key_findings")))
+                    if report_result.llm_error:
+                        print(f"Key Findings error (used data-driven findings): {report_result.llm_error}")
                     
-                    # Cleanup data file
-                    if os.path.exists(data_filepath):
-                        os.remove(data_filepath)
+                    artifacts.write_text(report_filename, report_result.markdown)
+                    report_markdown = report_result.markdown
+                    report_path = artifacts.path(report_filename)
                         
                 except Exception as e:
                     print(f"Report error: {e}")
@@ -342,40 +353,33 @@ class WorkflowService:
                         status=WorkflowStatus.COMPLETED,
                         count=1 if report_path else 0,
                         duration_seconds=round(report_duration, 2),
-                        message=f"Generated report: {report_path}" if report_path else "Report generation failed"
+                        message=f"Generated report: {os.path.basename(report_path)}" if report_path else "Report generation failed"
                     ),
-                    report_path=report_path
+                    report_path=os.path.basename(report_path) if report_path else None
                 )
                 
-                # PHASE 6: PDF CONVERSION
+                # PHASE 6: PDF CONVERSION (rendered in the background; pdf_path is filled in when done)
                 if report_path:
-                    self._update_workflow_status(workflow_id, current_phase=WorkflowPhase.PDF_CONVERT)
-                    phase_start = time.time()
-                    
                     try:
-                        from Opportunity_Discovery_Workflow.utils.pdf_converter import convert_md_to_pdf
+                        from Opportunity_Discovery_Workflow.utils.pdf_templates import PDF_TEMPLATE
+                        from workflow_common.pdf_service import QUEUED, get_pdf_service
                         
-                        md_filepath = os.path.join(self.output_dir, report_path)
-                        pdf_result = convert_md_to_pdf(md_filepath)
-                        
-                        if pdf_result:
-                            pdf_path = os.path.basename(pdf_result)
-                            
+                        # Set before submitting so a fast job's final status is not overwritten
+                        self._update_workflow_status(workflow_id, pdf_status=QUEUED)
+                        job = get_pdf_service().submit(
+                            report_markdown,
+                            os.path.splitext(report_path)[0] + ".pdf",
+                            PDF_TEMPLATE,
+                            on_done=lambda job: self._pdf_finished(workflow_id, job),
+                        )
+                        self._update_workflow_status(workflow_id, pdf_job_id=job.job_id)
                     except Exception as e:
                         print(f"PDF conversion error: {e}")
-                    
-                    pdf_duration = time.time() - phase_start
-                    self._update_workflow_status(
-                        workflow_id,
-                        phase_result=WorkflowPhaseResult(
-                            phase=WorkflowPhase.PDF_CONVERT,
-                            status=WorkflowStatus.COMPLETED if pdf_path else WorkflowStatus.FAILED,
-                            count=1 if pdf_path else 0,
-                            duration_seconds=round(pdf_duration, 2),
-                            message=f"Generated PDF: {pdf_path}" if pdf_path else "PDF conversion failed"
-                        ),
-                        pdf_path=pdf_path
-                    )
+            
+            # The report must be on disk before clients are told the run completed
+            artifacts.flush()
+            for error in artifacts.errors:
+                print(f"Artifact write error: {error}")
             
             # Mark workflow as completed
             self._update_workflow_status(
@@ -392,6 +396,26 @@ class WorkflowService:
                 error=str(e),
                 completed_at=datetime.now()
             )
+        finally:
+            artifacts.close()
+    
+    def _pdf_finished(self, workflow_id: str, job):
+        """Record a background PDF job's outcome on its workflow."""
+        from workflow_common.pdf_service import COMPLETED
+        
+        ok = job.status == COMPLETED
+        self._update_workflow_status(
+            workflow_id,
+            phase_result=WorkflowPhaseResult(
+                phase=WorkflowPhase.PDF_CONVERT,
+                status=WorkflowStatus.COMPLETED if ok else WorkflowStatus.FAILED,
+                count=1 if ok else 0,
+                duration_seconds=job.to_dict()["render_seconds"],
+                message=f"Generated PDF: {os.path.basename(job.pdf_path)}" if ok else f"PDF conversion {job.status}: {job.error}"
+            ),
+            pdf_path=os.path.basename(job.pdf_path) if ok else None,
+            pdf_status=job.status,
+        )
     
     def get_workflow_status(self, workflow_id: str) -> Optional[WorkflowStatusResponse]:
         """Get the status of a workflow by ID."""
@@ -0,0 +1,210 @@
+"""
+Compare PDF backends on real reports.
+
+Renders each Markdown report with every backend (or those given with
+--backend) through MarkdownToPdfConverter, bypassing the PDF render cache, and
+records per report and backend:
+
+- render time: median over --repeat runs, after one warm-up render so
+  imports and font loading are not counted
+- peak Python heap (tracemalloc, on one extra render) and peak process RSS
+  (ru_maxrss, Unix only)
+- output size
+
+Each (backend, report) pair runs in a fresh process so memory peaks do not
+carry over. Backends that cannot run here (e.g. WeasyPrint without Pango) are
+reported as unavailable.
+
+    python Opportunity_Discovery_Workflow/benchmark_pdf_backends.py [report.md | dir ...] [--json results.json]
+
+Without paths, the corpus is report.md at the repository root plus the
+Markdown reports in both workflows' outputs directories.
+"""
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from workflow_common.pdf_backends import BACKENDS, get_backend
+
+_REPO_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CORPUS = [
+    os.path.join(_REPO_PATH, "report.md"),
+    os.path.join(_REPO_PATH, "Opportunity_Discovery_Workflow", "outputs"),
+    os.path.join(_REPO_PATH, "crtical_minerals_news", "outputs"),
+]
+WARMUP_MARKDOWN = "# Warm-up\n\n| a | b |\n|---|---|\n| 1 | 2 |\n"
+
+_mp = multiprocessing.get_context("spawn")
+
+
+def collect_reports(paths):
+    """Markdown files named directly or found in the given directories."""
+    reports = []
+    for path in paths:
+        if os.path.isdir(path):
+            reports.extend(sorted(glob.glob(os.path.join(path, "*.md"))))
+        elif os.path.isfile(path) and path.lower().endswith(".md"):
+            reports.append(path)
+    return list(dict.fromkeys(os.path.abspath(report) for report in reports))
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale, 1)
+
+
+def _measure(backend_name, report_path, repeat, results):
+    """Child process: render one report `repeat` times with one backend."""
+    from Opportunity_Discovery_Workflow.utils.pdf_converter import MarkdownToPdfConverter
+
+    converter = MarkdownToPdfConverter(backend_name)
+    with open(report_path, "r", encoding="utf-8") as f:
+        md_content = f.read()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pdf_path = os.path.join(tmp_dir, "report.pdf")
+        if not converter.convert_text(WARMUP_MARKDOWN, pdf_path, use_cache=False):
+            results.put({"error": "warm-up render failed"})
+            return
+        rss_before = _peak_rss_mb()
+
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            ok = converter.convert_text(md_content, pdf_path, use_cache=False)
+            timings.append(time.perf_counter() - start)
+            if not ok:
+                results.put({"error": "render failed"})
+                return
+
+        # tracemalloc slows allocation down, so the heap is measured on a separate render
+        tracemalloc.start()
+        converter.convert_text(md_content, pdf_path, use_cache=False)
+        _, heap_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        results.put({
+            "seconds": round(statistics.median(timings), 3),
+            "heap_peak_mb": round(heap_peak / (1024 * 1024), 1),
+            "rss_peak_mb": _peak_rss_mb(),
+            "rss_before_mb": rss_before,
+            "pdf_bytes": os.path.getsize(pdf_path),
+        })
+
+
+def run_one(backend_name, report_path, repeat, timeout):
+    results = _mp.Queue()
+    process = _mp.Process(target=_measure, args=(backend_name, report_path, repeat, results))
+    process.start()
+    process.join(timeout)
+    if process.is_alive():
+        process.terminate()
+        process.join(5)
+        return {"error": f"timed out after {timeout:.0f}s"}
+    try:
+        return results.get(timeout=5)
+    except Exception:
+        return {"error": f"renderer exited with code {process.exitcode}"}
+
+
+def benchmark(reports, backends, repeat=3, timeout=600.0):
+    rows = []
+    for backend_name in backends:
+        unavailable = get_backend(backend_name).available()
+        if unavailable:
+            print(f"⚠️ {backend_name} unavailable: {unavailable}")
+            rows.append({"backend": backend_name, "report": None, "error": f"unavailable: {unavailable}"})
+            continue
+        for report in reports:
+            print(f"🔄 {backend_name}: {os.path.basename(report)}")
+            row = {"backend": backend_name, "report": report, "md_bytes": os.path.getsize(report)}
+            row.update(run_one(backend_name, report, repeat, timeout))
+            rows.append(row)
+    return rows
+
+
+def summarize(rows):
+    """Per-backend totals over the reports every measured backend rendered."""
+    ok = [row for row in rows if "seconds" in row]
+    backends = sorted({row["backend"] for row in ok})
+    common = set.intersection(*({row["report"] for row in ok if row["backend"] == b} for b in backends)) if backends else set()
+    summary = {}
+    for backend_name in backends:
+        measured = [row for row in ok if row["backend"] == backend_name and row["report"] in common]
+        summary[backend_name] = {
+            "reports": len(measured),
+            "total_seconds": round(sum(row["seconds"] for row in measured), 3),
+            "max_heap_peak_mb": max(row["heap_peak_mb"] for row in measured),
+            "max_rss_peak_mb": max((row["rss_peak_mb"] for row in measured if row["rss_peak_mb"] is not None), default=None),
+            "total_pdf_bytes": sum(row["pdf_bytes"] for row in measured),
+        }
+    return summary
+
+
+def print_results(rows, summary):
+    print("\n" + "=" * 96)
+    print(f"{'Backend':<12} {'Report':<40} {'Time (s)':>9} {'Heap MB':>8} {'RSS MB':>8} {'PDF KB':>8}")
+    print("-" * 96)
+    for row in rows:
+        name = os.path.basename(row["report"]) if row.get("report") else "-"
+        if "seconds" in row:
+            rss = f"{row['rss_peak_mb']:.1f}" if row["rss_peak_mb"] is not None else "n/a"
+            print(f"{row['backend']:<12} {name[:40]:<40} {row['seconds']:>9.3f} {row['heap_peak_mb']:>8.1f} "
+                  f"{rss:>8} {row['pdf_bytes'] / 1024:>8.1f}")
+        else:
+            print(f"{row['backend']:<12} {name[:40]:<40} ✗ {row['error']}")
+    print("=" * 96)
+    for backend_name, totals in summary.items():
+        print(f"{backend_name}: {totals['total_seconds']:.3f}s over {totals['reports']} reports, "
+              f"peak heap {totals['max_heap_peak_mb']:.1f} MB, "
+              f"{totals['total_pdf_bytes'] / 1024:.1f} KB of PDF")
+    if len(summary) > 1:
+        fastest = min(summary, key=lambda name: summary[name]["total_seconds"])
+        print(f"✓ Fastest on this corpus: {fastest}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PDF backends on Markdown reports")
+    parser.add_argument("paths", nargs="*", help="Markdown reports or directories of them")
+    parser.add_argument("--backend", action="append", choices=sorted(BACKENDS), help="Backend to measure (repeatable; default all)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed renders per report (median is reported)")
+    parser.add_argument("--timeout", type=float, default=600.0, help="Seconds allowed per backend and report")
+    parser.add_argument("--json", dest="json_path", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    reports = collect_reports(args.paths or DEFAULT_CORPUS)
+    if not reports:
+        print("✗ No Markdown reports found")
+        return 1
+
+    print(f"📄 {len(reports)} report(s), {args.repeat} timed render(s) each")
+    rows = benchmark(reports, args.backend or list(BACKENDS), max(1, args.repeat), args.timeout)
+    summary = summarize(rows)
+    print_results(rows, summary)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump({"results": rows, "summary": summary}, f, indent=2)
+        print(f"💾 Results saved to {args.json_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,13 +6,20 @@ from dotenv import load_dotenv
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from Opportunity_Discovery_Workflow.Workflows.discovery_workflow import DiscoveryWorkflow
+from workflow_common.pdf_service import get_pdf_service
 
 # Load environment variables
 load_dotenv()
 
 def main():
-    workflow = DiscoveryWorkflow()
+    workflow = DiscoveryWorkflow(
+        full_backfill="--full-backfill" in sys.argv,
+        reset_score_cache="--reset-score-cache" in sys.argv,
+    )
     workflow.run()
 
+    # The workflow hands PDFs to the background renderer; let them finish before exiting
+    get_pdf_service().wait_all()
+
 if __name__ == "__main__":
     main()
@@ -5,6 +5,7 @@ from dotenv import load_dotenv
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from Opportunity_Discovery_Workflow.Workflows.discovery_workflow import DiscoveryWorkflow
+from workflow_common.pdf_service import get_pdf_service
 
 def main():
 
@@ -13,6 +14,8 @@ def main():
     try:
         workflow = DiscoveryWorkflow()
         workflow.run()
+        # PDFs render in the background; let them finish before exiting
+        get_pdf_service().wait_all()
     except Exception as e:
         print(f"An error occurred while running the workflow: {e}")
         import traceback
@@ -1,18 +1,22 @@
 import requests
 from datetime import datetime, timedelta
 import json
+import os
 from typing import Optional
 from agno.tools import Toolkit
+from Opportunity_Discovery_Workflow.tools.http_client import SourceHttpClient, get_http_client
 
 class GrantsGovTools(Toolkit):
     
-    def __init__(self):
+    def __init__(self, http_client: SourceHttpClient = None, base_url: str = None):
         super().__init__(name="grants_gov_tools")
+        self.http = http_client or get_http_client()
+        self.base_url = (base_url or os.getenv("GRANTS_GOV_BASE_URL") or "https://api.grants.gov").rstrip("/")
         self.register(self.search_grants)
 
     def search_grants(self, keywords: Optional[str] = None, days_back: int = 7, limit: int = 100):
 
-        url = "https://api.grants.gov/v1/api/search2"
+        url = f"{self.base_url}/v1/api/search2"
         
         payload = {
             "keyword": keywords if keywords else None,
@@ -33,7 +37,7 @@ class GrantsGovTools(Toolkit):
         }
 
         try:
-            response = requests.post(url, json=payload, headers=headers)
+            response = self.http.post(url, json=payload, headers=headers)
             response.raise_for_status()
             data = response.json()
             
@@ -0,0 +1,179 @@
+"""
+Shared HTTP client for the government source toolkits.
+
+One keep-alive `requests.Session` per process with bounded per-host connection
+pools, default timeouts, jittered exponential retry on 429/5xx responses and
+an optional on-disk response cache.
+"""
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from Opportunity_Discovery_Workflow.tools.response_cache import ResponseCache
+
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+DEFAULT_TIMEOUT = (
+    float(os.getenv("SOURCE_HTTP_CONNECT_TIMEOUT", "10")),
+    float(os.getenv("SOURCE_HTTP_READ_TIMEOUT", "60")),
+)
+DEFAULT_MAX_RETRIES = int(os.getenv("SOURCE_HTTP_MAX_RETRIES", "4"))
+DEFAULT_POOL_MAXSIZE = int(os.getenv("SOURCE_HTTP_POOL_MAXSIZE", "8"))
+
+
+class SourceHttpClient:
+    """Pooled, retrying HTTP client with request/retry/byte counters."""
+
+    def __init__(
+        self,
+        timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = 0.5,
+        backoff_max: float = 30.0,
+        pool_connections: int = 10,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        cache: Optional[ResponseCache] = None,
+    ):
+        self.timeout = timeout
+        self.cache = cache
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+
+        self.session = requests.Session()
+        # pool_maxsize bounds the connections kept per host; pool_block makes it a hard limit
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=True,
+            max_retries=0,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "retries": 0,
+            "errors": 0,
+            "bytes_sent": 0,
+            "bytes_received": 0,
+        }
+
+    def _count(self, **increments: int):
+        with self._stats_lock:
+            for key, value in increments.items():
+                self._stats[key] += value
+
+    def stats(self) -> Dict[str, int]:
+        """Return a snapshot of the client counters."""
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Return response cache counters, or None when no cache is attached."""
+        return self.cache.stats() if self.cache is not None else None
+
+    def _backoff(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """Full-jitter exponential backoff, honouring Retry-After when present."""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return min(float(retry_after), self.backoff_max)
+                except ValueError:
+                    try:
+                        delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                        return min(max(delay, 0.0), self.backoff_max)
+                    except (TypeError, ValueError):
+                        pass
+        ceiling = min(self.backoff_max, self.backoff_factor * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    def request(self, method: str, url: str, use_cache: bool = True, **kwargs: Any) -> requests.Response:
+        """
+        Send a request, retrying connection errors and 429/5xx responses.
+
+        Successful responses are served from and stored in the response cache
+        unless it is disabled or `use_cache` is False. Returns the last response
+        (callers still call raise_for_status) or re-raises the last connection
+        error once retries are exhausted.
+        """
+        cache_key = None
+        if self.cache is not None:
+            if self.cache.enabled and use_cache:
+                cache_key = self.cache.make_key(
+                    method, url, kwargs.get("params"), kwargs.get("json"), kwargs.get("data")
+                )
+                cached = self.cache.get(cache_key, url)
+                if cached is not None:
+                    return cached
+            else:
+                self.cache.count_bypass()
+
+        response = self._send(method, url, **kwargs)
+        if cache_key is not None and response.status_code == 200:
+            self.cache.put(cache_key, response)
+        return response
+
+    def _send(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        attempt = 0
+        while True:
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                self._count(requests=1, errors=1)
+                if attempt >= self.max_retries:
+                    raise
+                self._count(retries=1)
+                time.sleep(self._backoff(attempt))
+                attempt += 1
+                continue
+
+            body = response.request.body if response.request is not None else None
+            self._count(
+                requests=1,
+                bytes_sent=len(body) if body else 0,
+                bytes_received=len(response.content or b""),
+            )
+
+            if response.status_code in RETRY_STATUS_CODES and attempt < self.max_retries:
+                self._count(retries=1)
+                delay = self._backoff(attempt, response)
+                response.close()
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            if response.status_code >= 400:
+                self._count(errors=1)
+            return response
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+
+_client: Optional[SourceHttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> SourceHttpClient:
+    """Get the process-wide client shared by all source toolkits."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = SourceHttpClient(cache=ResponseCache())
+        return _client
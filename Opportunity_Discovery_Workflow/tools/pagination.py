@@ -0,0 +1,87 @@
+"""
+Concurrent page prefetching for paginated source APIs.
+
+The first page is fetched on its own to learn the total record count; the
+remaining pages are then fetched through a bounded sliding window and
+consumed strictly in page order, so early-stop rules (such as a post-date
+cutoff on a descending sort) behave exactly as in a serial loop.
+"""
+import math
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
+
+# fetch_page(page_number) -> (items on that page, total record count or None)
+PageFetcher = Callable[[int], Tuple[List[Any], Optional[int]]]
+
+
+def fetch_all_pages(
+    fetch_page: PageFetcher,
+    first_page: int,
+    page_size: int,
+    limit: Optional[int],
+    max_in_flight: int = 4,
+    stop_at: Optional[Callable[[Any], bool]] = None,
+) -> Tuple[List[Any], Optional[int]]:
+    """
+    Fetch up to `limit` items across pages.
+
+    Args:
+        fetch_page: Callable returning the items of a page and the total record count
+        first_page: Index of the first page (0 for SAM.gov, 1 for Simpler.Grants.gov)
+        page_size: Items per page
+        limit: Maximum number of items to return; None follows the total record count
+        max_in_flight: Maximum number of pages requested concurrently
+        stop_at: Optional predicate; the first item for which it returns True ends
+            the scan and every page after it is cancelled
+
+    Returns:
+        (items, total_records) where total_records is as reported by the first page
+    """
+    collected: List[Any] = []
+
+    def consume(batch: List[Any]) -> bool:
+        """Append a page in order; return True when the scan should stop."""
+        for item in batch:
+            if stop_at is not None and stop_at(item):
+                return True
+            collected.append(item)
+            if limit is not None and len(collected) >= limit:
+                return True
+        # A short page is the last page
+        return len(batch) < page_size
+
+    items, total = fetch_page(first_page)
+    if consume(items):
+        return collected, total
+
+    if total is not None:
+        wanted = total if limit is None else min(total, limit)
+        last_page = first_page + math.ceil(wanted / page_size) - 1
+    else:
+        last_page = None  # Unknown total: keep going until a short page
+
+    next_page = first_page + 1
+    pending = deque()
+    executor = ThreadPoolExecutor(max_workers=max(1, max_in_flight), thread_name_prefix="page")
+
+    def fill_window():
+        nonlocal next_page
+        while len(pending) < max_in_flight and (last_page is None or next_page <= last_page):
+            pending.append(executor.submit(fetch_page, next_page))
+            next_page += 1
+
+    try:
+        fill_window()
+        while pending:
+            batch, _ = pending.popleft().result()
+            if consume(batch):
+                break
+            fill_window()
+    finally:
+        # Pages past the stop point are cancelled (or ignored if already in flight)
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return collected, total
@@ -0,0 +1,384 @@
+"""
+Local stand-in for the Grants.gov, SAM.gov and Simpler.Grants.gov search APIs.
+
+Serves recorded payloads from a fixtures directory (one `<source>.json` list of
+raw API items per source) or, when none are recorded, deterministic synthetic
+records. Latency, error rate and page counts are configurable so fetch-path
+benchmarks can run offline and reproducibly.
+
+Point the toolkits at it with GRANTS_GOV_BASE_URL, SAM_GOV_BASE_URL and
+SIMPLER_GRANTS_GOV_BASE_URL (or their `base_url` arguments), and set
+SOURCE_CACHE_ENABLED=false when measuring raw fetch throughput.
+
+Usage:
+    python -m Opportunity_Discovery_Workflow.tools.replay_server --port 8765 --latency 0.2
+    python -m Opportunity_Discovery_Workflow.tools.replay_server --record --fixtures fixtures/
+"""
+import argparse
+import json
+import os
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+GRANTS_GOV = "grants_gov"
+SAM_GOV = "sam_gov"
+SIMPLER_GRANTS = "simpler_grants"
+
+# Request path -> (source, upstream base URL)
+ROUTES = {
+    "/v1/api/search2": (GRANTS_GOV, "https://api.grants.gov"),
+    "/opportunities/v2/search": (SAM_GOV, "https://api.sam.gov"),
+    "/v1/opportunities/search": (SIMPLER_GRANTS, "https://api.simpler.grants.gov"),
+}
+
+_AGENCIES = (
+    "Department of Energy",
+    "Department of Defense",
+    "National Science Foundation",
+    "Department of the Interior",
+    "Department of Commerce",
+)
+_TOPICS = (
+    "Critical Minerals Processing",
+    "Grid Modernization",
+    "Advanced Manufacturing",
+    "Rare Earth Element Separation",
+    "Battery Materials Supply Chain",
+    "Water Infrastructure Resilience",
+)
+
+
+@dataclass
+class ReplayConfig:
+    """Knobs for the stand-in server."""
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    pages: int = 5
+    per_day: int = 20
+    fixtures_dir: Optional[str] = None
+    record: bool = False
+    seed: int = 42
+
+
+def synthetic_item(source: str, index: int, today: datetime, per_day: int) -> Dict[str, Any]:
+    """Deterministic raw API item; Grants.gov and Simpler.Grants.gov share opportunity numbers."""
+    posted = today - timedelta(days=index // max(per_day, 1))
+    closes = posted + timedelta(days=60)
+    number = f"SYN-{index:05d}"
+    agency = _AGENCIES[index % len(_AGENCIES)]
+    title = f"{_TOPICS[index % len(_TOPICS)]} Program {index}"
+    description = f"Synthetic opportunity {index} for {title.lower()} funded by the {agency}."
+
+    if source == GRANTS_GOV:
+        return {
+            "id": 100000 + index,
+            "number": number,
+            "title": title,
+            "agency": agency,
+            "description": description,
+            "openDate": posted.strftime("%m/%d/%Y"),
+            "closeDate": closes.strftime("%m/%d/%Y"),
+        }
+    if source == SAM_GOV:
+        return {
+            "noticeId": f"sam{index:08d}",
+            "title": title,
+            "solicitationNumber": f"SAM-{index:05d}",
+            "fullParentPathName": f"{agency.upper()}.OFFICE OF ACQUISITION",
+            "department": agency.upper(),
+            "description": description,
+            "uiLink": f"https://sam.gov/opp/sam{index:08d}/view",
+            "postedDate": posted.strftime("%Y-%m-%d"),
+            "responseDeadLine": closes.strftime("%Y-%m-%dT17:00:00-05:00"),
+        }
+    return {
+        "opportunity_id": 100000 + index,
+        "opportunity_number": number,
+        "opportunity_title": title,
+        "agency_name": agency,
+        "summary": {
+            "summary_description": description,
+            "post_date": posted.strftime("%Y-%m-%d"),
+            "close_date": closes.strftime("%Y-%m-%d"),
+        },
+    }
+
+
+def _wrap(source: str, items: List[Dict[str, Any]], total: int, page_offset: int, page_size: int) -> Dict[str, Any]:
+    """Shape a page of items like the real API response."""
+    if source == GRANTS_GOV:
+        return {"errorcode": 0, "msg": "Webservice Succeeds", "data": {"hitCount": total, "oppHits": items}}
+    if source == SAM_GOV:
+        return {"totalRecords": total, "limit": page_size, "offset": page_offset * page_size, "opportunitiesData": items}
+    return {
+        "data": items,
+        "pagination_info": {
+            "page_offset": page_offset,
+            "page_size": page_size,
+            "total_records": total,
+            "total_pages": -(-total // page_size) if page_size else 0,
+        },
+        "status_code": 200,
+    }
+
+
+def _unwrap(source: str, payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Extract the raw items from a real API response."""
+    if source == GRANTS_GOV:
+        return payload.get("oppHits") or (payload.get("data") or {}).get("oppHits") or []
+    if source == SAM_GOV:
+        return payload.get("opportunitiesData") or []
+    return payload.get("data") or []
+
+
+def _item_id(source: str, item: Dict[str, Any]) -> str:
+    if source == GRANTS_GOV:
+        return str(item.get("id") or item.get("number"))
+    if source == SAM_GOV:
+        return str(item.get("noticeId") or item.get("solicitationNumber"))
+    return str(item.get("opportunity_id") or item.get("opportunity_number"))
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    server: "_ReplayHTTPServer"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._handle(b"")
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self._handle(self.rfile.read(length) if length else b"")
+
+    def _send_json(self, status: int, payload: Dict[str, Any], extra_headers: Optional[Dict[str, str]] = None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (extra_headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self, body: bytes):
+        parts = urlsplit(self.path)
+        route = ROUTES.get(parts.path.rstrip("/"))
+        if route is None:
+            self._send_json(404, {"message": f"Unknown path {parts.path}"})
+            return
+        source, upstream = route
+        server = self.server
+        server.count(source, "requests")
+
+        if server.config.record:
+            self._proxy(source, upstream, body)
+            return
+
+        delay = server.config.latency + server.uniform(0, server.config.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+        if server.config.error_rate and server.uniform(0, 1) < server.config.error_rate:
+            server.count(source, "errors")
+            self._send_json(503, {"message": "Injected failure"}, {"Retry-After": "0"})
+            return
+
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        payload = json.loads(body.decode("utf-8")) if body else {}
+        self._send_json(200, server.page(source, query, payload))
+
+    def _proxy(self, source: str, upstream: str, body: bytes):
+        """Forward the request upstream, save its items as fixtures and return the real response."""
+        headers = {k: v for k, v in self.headers.items() if k.lower() in ("content-type", "x-api-key", "user-agent")}
+        request = urllib.request.Request(
+            upstream + self.path,
+            data=body or None,
+            headers=headers,
+            method=self.command,
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=120) as response:
+                status, raw = response.status, response.read()
+        except urllib.error.HTTPError as e:
+            status, raw = e.code, e.read()
+        except urllib.error.URLError as e:
+            self._send_json(502, {"message": f"Upstream unreachable: {e.reason}"})
+            return
+
+        if status == 200:
+            self.server.save_fixture(source, _unwrap(source, json.loads(raw.decode("utf-8"))))
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+
+class _ReplayHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], config: ReplayConfig):
+        super().__init__(address, _ReplayHandler)
+        self.config = config
+        self.today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        self._random = random.Random(config.seed)
+        self._lock = threading.Lock()
+        self._fixtures: Dict[str, List[Dict[str, Any]]] = {}
+        self.stats: Dict[str, Dict[str, int]] = {}
+        if config.fixtures_dir:
+            os.makedirs(config.fixtures_dir, exist_ok=True)
+            for source in (GRANTS_GOV, SAM_GOV, SIMPLER_GRANTS):
+                path = self._fixture_path(source)
+                if os.path.exists(path):
+                    with open(path, "r", encoding="utf-8") as f:
+                        self._fixtures[source] = json.load(f)
+
+    def uniform(self, low: float, high: float) -> float:
+        with self._lock:
+            return self._random.uniform(low, high)
+
+    def count(self, source: str, key: str):
+        with self._lock:
+            counters = self.stats.setdefault(source, {"requests": 0, "errors": 0})
+            counters[key] += 1
+
+    def _fixture_path(self, source: str) -> str:
+        return os.path.join(self.config.fixtures_dir, f"{source}.json")
+
+    def save_fixture(self, source: str, items: List[Dict[str, Any]]):
+        if not self.config.fixtures_dir:
+            return
+        with self._lock:
+            existing = self._fixtures.setdefault(source, [])
+            known = {_item_id(source, item) for item in existing}
+            existing.extend(item for item in items if _item_id(source, item) not in known)
+            with open(self._fixture_path(source), "w", encoding="utf-8") as f:
+                json.dump(existing, f, indent=2)
+
+    def page(self, source: str, query: Dict[str, str], payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the response for one search request."""
+        if source == GRANTS_GOV:
+            page_size = int(payload.get("rows") or 25)
+            page_offset = 0
+            days_back = int(payload.get("dateRange") or 0) or None
+        elif source == SAM_GOV:
+            page_size = int(query.get("limit") or 10)
+            page_offset = int(query.get("offset") or 0) // max(page_size, 1)
+            days_back = None
+            if query.get("postedFrom"):
+                posted_from = datetime.strptime(query["postedFrom"], "%m/%d/%Y")
+                days_back = (self.today - posted_from).days
+        else:
+            pagination = payload.get("pagination") or {}
+            page_size = int(pagination.get("page_size") or 25)
+            page_offset = int(pagination.get("page_offset") or 1) - 1
+            # Simpler.Grants.gov has no date filter; the client stops at its own cutoff
+            days_back = None
+
+        capacity = self.config.pages * page_size
+        fixtures = self._fixtures.get(source)
+        if fixtures is not None:
+            total = min(len(fixtures), capacity)
+        else:
+            total = capacity
+            if days_back is not None:
+                total = min(total, (days_back + 1) * self.config.per_day)
+
+        start = page_offset * page_size
+        indexes = range(start, min(start + page_size, total))
+        if fixtures is not None:
+            items = [fixtures[i] for i in indexes]
+        else:
+            items = [synthetic_item(source, i, self.today, self.config.per_day) for i in indexes]
+        # Simpler.Grants.gov numbers pages from 1
+        return _wrap(source, items, total, page_offset + (1 if source == SIMPLER_GRANTS else 0), page_size)
+
+
+class ReplayServer:
+    """Runs the stand-in server on a background thread."""
+
+    def __init__(self, config: Optional[ReplayConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or ReplayConfig()
+        self._server = _ReplayHTTPServer((host, port), self.config)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {source: dict(counters) for source, counters in self._server.stats.items()}
+
+    def start(self) -> "ReplayServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stand-in server for the federal opportunity search APIs")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Base response latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument("--pages", type=int, default=5, help="Pages served per source and query")
+    parser.add_argument("--per-day", type=int, default=20, help="Synthetic records posted per day")
+    parser.add_argument("--fixtures", default=None, help="Directory of recorded <source>.json payloads")
+    parser.add_argument("--record", action="store_true", help="Proxy to the real APIs and record fixtures")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    if args.record and not args.fixtures:
+        parser.error("--record requires --fixtures")
+
+    config = ReplayConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        pages=args.pages,
+        per_day=args.per_day,
+        fixtures_dir=args.fixtures,
+        record=args.record,
+        seed=args.seed,
+    )
+    server = ReplayServer(config, host=args.host, port=args.port)
+    mode = "recording" if args.record else ("replaying fixtures" if args.fixtures else "synthetic")
+    print(f"🛰️  Replay server ({mode}) listening on {server.base_url}")
+    print(f"   GRANTS_GOV_BASE_URL={server.base_url}")
+    print(f"   SAM_GOV_BASE_URL={server.base_url}")
+    print(f"   SIMPLER_GRANTS_GOV_BASE_URL={server.base_url}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 Stopping replay server")
+    finally:
+        server._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+On-disk HTTP response cache for the government source APIs.
+
+Entries are keyed on method, normalized URL, query params and request body,
+expire after a per-source TTL, and are evicted LRU once the cache exceeds
+its size bound. Set SOURCE_CACHE_ENABLED=false to bypass it entirely.
+"""
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlsplit, urlunsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from workflow_common.disk_cache import DiskCache
+
+# Seconds a cached search response stays valid, per API host
+DEFAULT_TTLS = {
+    "api.grants.gov": 15 * 60,
+    "api.simpler.grants.gov": 15 * 60,
+    # SAM.gov has tight daily quotas, so hold its responses longer
+    "api.sam.gov": 60 * 60,
+}
+DEFAULT_TTL = 15 * 60
+
+# Credentials do not change the response and must not split the cache
+_IGNORED_PARAMS = {"api_key"}
+
+_BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _env_enabled() -> bool:
+    return os.getenv("SOURCE_CACHE_ENABLED", "true").lower() not in ("0", "false", "no")
+
+
+class ResponseCache:
+    """Caches successful source API responses on disk."""
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        ttls: Optional[Dict[str, int]] = None,
+        enabled: Optional[bool] = None,
+    ):
+        self.enabled = _env_enabled() if enabled is None else enabled
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.bypassed = 0
+        self._lock = threading.Lock()
+        self.store = DiskCache(
+            directory or os.getenv("SOURCE_CACHE_DIR", os.path.join(_BASE_PATH, ".cache", "http")),
+            max_bytes or int(float(os.getenv("SOURCE_CACHE_MAX_MB", "256")) * 1024 * 1024),
+        )
+
+    def ttl_for(self, url: str) -> int:
+        return self.ttls.get(urlsplit(url).hostname or "", DEFAULT_TTL)
+
+    def make_key(self, method: str, url: str, params: Any = None, json_body: Any = None, data: Any = None) -> str:
+        """Hash a request into a cache key that ignores param order and credentials."""
+        parts = urlsplit(url)
+        query = parse_qsl(parts.query, keep_blank_values=True)
+        if params:
+            query += list(params.items()) if isinstance(params, dict) else list(params)
+        query = sorted((str(k), str(v)) for k, v in query if k not in _IGNORED_PARAMS and v is not None)
+        normalized_url = urlunsplit((parts.scheme.lower(), (parts.netloc or "").lower(), parts.path.rstrip("/"), "", ""))
+
+        if json_body is not None:
+            body = json.dumps(json_body, sort_keys=True, separators=(",", ":"))
+        elif isinstance(data, bytes):
+            body = data.decode("utf-8", "replace")
+        else:
+            body = data or ""
+
+        material = json.dumps([method.upper(), normalized_url, query, body], separators=(",", ":"))
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def count_bypass(self):
+        """Record a request that skipped the cache; safe to call from worker threads."""
+        with self._lock:
+            self.bypassed += 1
+
+    def get(self, key: str, url: str) -> Optional[requests.Response]:
+        """Return a cached response for `key`, rebuilt as a requests.Response."""
+        raw = self.store.get(key, max_age=self.ttl_for(url))
+        if raw is None:
+            return None
+        entry = json.loads(raw.decode("utf-8"))
+        response = requests.Response()
+        response.status_code = entry["status_code"]
+        response.headers = CaseInsensitiveDict(entry.get("headers") or {})
+        response.url = entry.get("url") or url
+        response.encoding = entry.get("encoding") or "utf-8"
+        response._content = entry["body"].encode(response.encoding)
+        response.reason = "OK (cached)"
+        return response
+
+    def put(self, key: str, response: requests.Response):
+        """Store a successful response."""
+        if response.status_code != 200:
+            return
+        entry = {
+            "status_code": response.status_code,
+            "headers": {k: v for k, v in response.headers.items() if k.lower() == "content-type"},
+            "url": response.url,
+            "encoding": response.encoding or "utf-8",
+            "body": response.text,
+        }
+        self.store.set(key, json.dumps(entry).encode("utf-8"))
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self.store.stats()
+        with self._lock:
+            stats.update({"enabled": self.enabled, "bypassed": self.bypassed})
+        return stats
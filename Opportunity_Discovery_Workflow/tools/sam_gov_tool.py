@@ -3,11 +3,18 @@ from datetime import datetime, timedelta
 import os
 from typing import Optional
 from agno.tools import Toolkit
+from Opportunity_Discovery_Workflow.tools.http_client import SourceHttpClient, get_http_client
+from Opportunity_Discovery_Workflow.tools.pagination import fetch_all_pages
+
+# SAM.gov caps page size at 1000 records
+MAX_PAGE_SIZE = 1000
 
 class SamGovTools(Toolkit):
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, http_client: SourceHttpClient = None, base_url: str = None):
         super().__init__(name="sam_gov_tools")
+        self.http = http_client or get_http_client()
+        self.base_url = (base_url or os.getenv("SAM_GOV_BASE_URL") or "https://api.sam.gov").rstrip("/")
         self.api_key = api_key or os.getenv("SAM_GOV_API_KEY")
         
         if not self.api_key:
@@ -15,12 +22,13 @@ class SamGovTools(Toolkit):
 
         self.register(self.search_opportunities)
 
-    def search_opportunities(self, keywords: Optional[str] = None, days_back: int = 7, limit: int = 300):
+    def search_opportunities(self, keywords: Optional[str] = None, days_back: int = 7, limit: Optional[int] = None):
+        """Search active opportunities posted in the last `days_back` days; `limit=None` returns every page."""
 
         if not self.api_key:
             return "Error: SAM_GOV_API_KEY is missing."
 
-        base_url = "https://api.sam.gov/opportunities/v2/search"
+        base_url = f"{self.base_url}/opportunities/v2/search"
         
         # Calculate date range
         end_date = datetime.now()
@@ -30,12 +38,13 @@ class SamGovTools(Toolkit):
         posted_from = start_date.strftime("%m/%d/%Y")
         posted_to = end_date.strftime("%m/%d/%Y")
 
+        page_size = min(limit, MAX_PAGE_SIZE) if limit else MAX_PAGE_SIZE
+
         params = {
             "api_key": self.api_key,
             "postedFrom": posted_from,
             "postedTo": posted_to,
-            "limit": limit,
-            "offset": 0,
+            "limit": page_size,
             "active": "true"
         }
         
@@ -46,24 +55,39 @@ class SamGovTools(Toolkit):
         if keywords:
             params["keywords"] = keywords
 
-        try:
-            response = requests.get(base_url, params=params, headers=headers)
+        def fetch_page(page):
+            page_params = dict(params, offset=page * page_size)
+            response = self.http.get(base_url, params=page_params, headers=headers)
             response.raise_for_status()
             data = response.json()
+            return data.get("opportunitiesData") or [], data.get("totalRecords")
+
+        try:
+            # Requests count against a small daily quota, so keep the window narrow
+            items, total_records = fetch_all_pages(
+                fetch_page,
+                first_page=0,
+                page_size=page_size,
+                limit=limit,
+                max_in_flight=2,
+            )
+
+            if limit and total_records and total_records > limit:
+                print(f"Warning: SAM.gov reported {total_records} opportunities; returning the first {limit}.")
             
             opportunities = []
-            if "opportunitiesData" in data:
-                for item in data["opportunitiesData"]:
-                    opp = {
-                        "title": item.get("title"),
-                        "solicitationNumber": item.get("solicitationNumber"),
-                        "description": item.get("description"),
-                        "link": item.get("uiLink"),
-                        "postedDate": item.get("postedDate"),
-                        "responseDeadLine": item.get("responseDeadLine"),
-                        "source": "SAM.gov"
-                    }
-                    opportunities.append(opp)
+            for item in items:
+                opp = {
+                    "title": item.get("title"),
+                    "solicitationNumber": item.get("solicitationNumber"),
+                    "agency": item.get("fullParentPathName") or item.get("department"),
+                    "description": item.get("description"),
+                    "link": item.get("uiLink"),
+                    "postedDate": item.get("postedDate"),
+                    "responseDeadLine": item.get("responseDeadLine"),
+                    "source": "SAM.gov"
+                }
+                opportunities.append(opp)
             
             return opportunities
 
@@ -2,12 +2,16 @@ import os
 import requests
 from typing import Optional
 from agno.tools import Toolkit
+from Opportunity_Discovery_Workflow.tools.http_client import SourceHttpClient, get_http_client
+from Opportunity_Discovery_Workflow.tools.pagination import fetch_all_pages
 from datetime import datetime, timedelta
 
 class SimplerGrantsGovTools(Toolkit):
 
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, http_client: SourceHttpClient = None, base_url: str = None):
         super().__init__(name="simpler_grants_gov_tools")
+        self.http = http_client or get_http_client()
+        self.base_url = (base_url or os.getenv("SIMPLER_GRANTS_GOV_BASE_URL") or "https://api.simpler.grants.gov").rstrip("/")
 
         self.api_key = api_key or os.getenv("SIMPLER_GRANTS_GOV_API_KEY")
 
@@ -21,21 +25,18 @@ class SimplerGrantsGovTools(Toolkit):
         if not self.api_key:
             return "Error: SIMPLER_GRANTS_GOV_API_KEY is missing."
 
-        base_url = "https://api.simpler.grants.gov/v1/opportunities/search"
-        
+        base_url = f"{self.base_url}/v1/opportunities/search"
+
         cutoff_date = datetime.now() - timedelta(days=days_back)
-        
+
         headers = {
             "X-API-Key": self.api_key,
             "Content-Type": "application/json"
         }
-        
-        opportunities = []
-        page_offset = 1
+
         page_size = 50
-        more_pages = True
-        
-        while more_pages and len(opportunities) < limit:
+
+        def fetch_page(page_offset):
             search_payload = {
                                 "filters": {
                                     "opportunity_status": {
@@ -56,59 +57,57 @@ class SimplerGrantsGovTools(Toolkit):
                                     ]
                                 }
                             }
-            
+
             if keywords:
                 search_payload["query"] = keywords
 
-            try:
-                response = requests.post(base_url, json=search_payload, headers=headers)
-                response.raise_for_status()
-                data = response.json()
-                
-                if "data" not in data or not data["data"]:
-                    break
-                
-                current_batch = data["data"]
-                
-                for item in current_batch:
-                    # Extract summary dictionary
-                    summary = item.get("summary", {})
-                    
-                    post_date_str = summary.get("post_date")
-                    
-                    if post_date_str:
-                        try:
-                            # Try parsing YYYY-MM-DD
-                            post_date = datetime.strptime(post_date_str, "%Y-%m-%d")
-                            if post_date < cutoff_date:
-                                more_pages = False
-                                break
-                        except ValueError:
-                            pass
-                    
-                    opp = {
-                        "title": item.get("opportunity_title") or item.get("title"),
-                        "opportunityNumber": item.get("opportunity_number") or item.get("opportunityNumber"),
-                        "description": (summary.get("summary_description") or "")[:200],
-                        "agency": item.get("agency_name") or item.get("agency", {}).get("name"),
-                        "postedDate": post_date_str,
-                        "closeDate": summary.get("close_date"),
-                        "link": f"https://simpler.grants.gov/opportunity/{item.get('opportunity_id') or item.get('id')}",
-                        "source": "Simpler.Grants.gov"
-                    }
-
-                    opportunities.append(opp)
-                    
-                    if len(opportunities) >= limit:
-                        more_pages = False
-                        break
-                
-                page_offset += 1
-                
-            except requests.exceptions.RequestException as e:
-                error_msg = f"Error searching Simpler.Grants.gov: {e}"
-                if hasattr(e, 'response') and e.response is not None:
-                    error_msg += f"\nResponse: {e.response.text}"
-                return error_msg
-                
+            response = self.http.post(base_url, json=search_payload, headers=headers)
+            response.raise_for_status()
+            data = response.json()
+            total_records = (data.get("pagination_info") or {}).get("total_records")
+            return data.get("data") or [], total_records
+
+        def is_past_cutoff(item):
+            # Results are sorted by post_date descending, so the first older item ends the scan
+            post_date_str = (item.get("summary") or {}).get("post_date")
+            if post_date_str:
+                try:
+                    # Try parsing YYYY-MM-DD
+                    return datetime.strptime(post_date_str, "%Y-%m-%d") < cutoff_date
+                except ValueError:
+                    pass
+            return False
+
+        try:
+            items, _ = fetch_all_pages(
+                fetch_page,
+                first_page=1,
+                page_size=page_size,
+                limit=limit,
+                stop_at=is_past_cutoff,
+            )
+        except requests.exceptions.RequestException as e:
+            error_msg = f"Error searching Simpler.Grants.gov: {e}"
+            if hasattr(e, 'response') and e.response is not None:
+                error_msg += f"\nResponse: {e.response.text}"
+            return error_msg
+
+        opportunities = []
+        for item in items:
+            # Extract summary dictionary
+            summary = item.get("summary") or {}
+
+            opp = {
+                "title": item.get("opportunity_title") or item.get("title"),
+                "opportunityNumber": item.get("opportunity_number") or item.get("opportunityNumber"),
+                "description": (summary.get("summary_description") or "")[:200],
+                "agency": item.get("agency_name") or (item.get("agency") or {}).get("name"),
+                "postedDate": summary.get("post_date"),
+                "closeDate": summary.get("close_date"),
+                "link": f"https://simpler.grants.gov/opportunity/{item.get('opportunity_id') or item.get('id')}",
+                "source": "Simpler.Grants.gov"
+            }
+
+            opportunities.append(opp)
+
         return opportunities
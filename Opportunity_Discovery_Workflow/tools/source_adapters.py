@@ -0,0 +1,190 @@
+"""
+Deterministic source adapters.
+
+Map the records returned by the government source toolkits straight into
+`Opportunity` objects, without an LLM round-trip in between.
+"""
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from Opportunity_Discovery_Workflow.Models.data_models import Opportunity
+from Opportunity_Discovery_Workflow.tools.grants_gov_tool import GrantsGovTools
+from Opportunity_Discovery_Workflow.tools.sam_gov_tool import SamGovTools
+from Opportunity_Discovery_Workflow.tools.simpler_grants_gov_tool import SimplerGrantsGovTools
+
+UNCLASSIFIED_SECTOR = "Unclassified"
+
+_DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%m/%d/%Y",
+    "%m/%d/%y",
+    "%Y%m%d",
+    "%b %d, %Y",
+    "%B %d, %Y",
+    "%Y-%m-%d %H:%M:%S",
+    "%m/%d/%Y %I:%M %p",
+)
+
+
+def normalize_date(value: Any) -> Optional[str]:
+    """Normalize a source date (any of the formats the APIs use) to YYYY-MM-DD."""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d")
+
+    text = str(value).strip()
+    if not text:
+        return None
+
+    # ISO timestamps, e.g. SAM.gov responseDeadLine "2025-11-05T17:00:00-05:00"
+    try:
+        return datetime.fromisoformat(text.replace("Z", "+00:00")).strftime("%Y-%m-%d")
+    except ValueError:
+        pass
+
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+
+    # Timestamps with a trailing zone name, e.g. "Nov 05, 2025 05:00:00 PM EST"
+    head = text[:10]
+    for fmt in ("%Y-%m-%d", "%m/%d/%Y"):
+        try:
+            return datetime.strptime(head, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    return None
+
+
+def _clean(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+class SourceAdapter(ABC):
+    """Base adapter: run a toolkit search and map every record to an Opportunity."""
+
+    source_name = ""
+    default_limit: Optional[int] = 50
+
+    def __init__(self, tools=None, limit: Optional[int] = None):
+        self.tools = tools
+        self.limit = limit or self.default_limit
+
+    @abstractmethod
+    def search(self, days_back: int) -> Any:
+        """Run the toolkit search; a string return value is an error message."""
+
+    @abstractmethod
+    def to_opportunity(self, record: Dict[str, Any]) -> Optional[Opportunity]:
+        """Map one source record, or None if it cannot be used."""
+
+    def fetch(self, days_back: int = 7, since: Optional[str] = None) -> List[Opportunity]:
+        """
+        Fetch and normalize opportunities. Raises RuntimeError on source errors.
+
+        When `since` (YYYY-MM-DD) is given, only the delta from that post date
+        onwards is requested, bounded by `days_back`.
+        """
+        if since:
+            days_since = (datetime.now().date() - datetime.strptime(since, "%Y-%m-%d").date()).days + 1
+            days_back = max(1, min(days_back, days_since))
+
+        records = self.search(days_back)
+        if isinstance(records, str):
+            # Toolkits report failures as strings for the agents; surface them as errors here
+            raise RuntimeError(records)
+
+        opportunities = []
+        for record in records or []:
+            opp = self.to_opportunity(record)
+            if opp is None:
+                continue
+            if since and opp.published_date and opp.published_date < since:
+                continue
+            opportunities.append(opp)
+        return opportunities
+
+    def _build(self, record: Dict[str, Any], number: Any, published: Any, opened: Any, closed: Any) -> Optional[Opportunity]:
+        title = _clean(record.get("title"))
+        if not title:
+            return None
+        return Opportunity(
+            title=title,
+            description=_clean(record.get("description")) or "",
+            source=self.source_name,
+            agency=_clean(record.get("agency")),
+            sector=UNCLASSIFIED_SECTOR,
+            published_date=normalize_date(published),
+            openDate=normalize_date(opened),
+            closeDate=normalize_date(closed),
+            url=_clean(record.get("link")),
+            opportunity_number=_clean(number),
+        )
+
+
+class GrantsGovAdapter(SourceAdapter):
+    source_name = "Grants.gov"
+    default_limit = 50
+
+    def __init__(self, tools: Optional[GrantsGovTools] = None, limit: Optional[int] = None):
+        super().__init__(tools or GrantsGovTools(), limit)
+
+    def search(self, days_back: int) -> Any:
+        return self.tools.search_grants(days_back=days_back, limit=self.limit)
+
+    def to_opportunity(self, record: Dict[str, Any]) -> Optional[Opportunity]:
+        return self._build(
+            record,
+            number=record.get("opportunityNumber"),
+            published=record.get("openDate"),
+            opened=record.get("openDate"),
+            closed=record.get("closeDate"),
+        )
+
+
+class SamGovAdapter(SourceAdapter):
+    source_name = "SAM.gov"
+    # Page through everything SAM.gov reports for the window
+    default_limit = None
+
+    def __init__(self, tools: Optional[SamGovTools] = None, limit: Optional[int] = None):
+        super().__init__(tools or SamGovTools(), limit)
+
+    def search(self, days_back: int) -> Any:
+        return self.tools.search_opportunities(days_back=days_back, limit=self.limit)
+
+    def to_opportunity(self, record: Dict[str, Any]) -> Optional[Opportunity]:
+        return self._build(
+            record,
+            number=record.get("solicitationNumber"),
+            published=record.get("postedDate"),
+            opened=record.get("postedDate"),
+            closed=record.get("responseDeadLine"),
+        )
+
+
+class SimplerGrantsGovAdapter(SourceAdapter):
+    source_name = "Simpler.Grants.gov"
+    default_limit = 1000
+
+    def __init__(self, tools: Optional[SimplerGrantsGovTools] = None, limit: Optional[int] = None):
+        super().__init__(tools or SimplerGrantsGovTools(), limit)
+
+    def search(self, days_back: int) -> Any:
+        return self.tools.search_opportunities(days_back=days_back, limit=self.limit)
+
+    def to_opportunity(self, record: Dict[str, Any]) -> Optional[Opportunity]:
+        return self._build(
+            record,
+            number=record.get("opportunityNumber"),
+            published=record.get("postedDate"),
+            opened=record.get("postedDate"),
+            closed=record.get("closeDate"),
+        )
@@ -1,3 +1,3 @@
-from .pdf_converter import MarkdownToPdfConverter, convert_md_to_pdf
+from .pdf_converter import MarkdownToPdfConverter, convert_markdown_to_pdf, convert_md_to_pdf
 
-__all__ = ["MarkdownToPdfConverter", "convert_md_to_pdf"]
+__all__ = ["MarkdownToPdfConverter", "convert_markdown_to_pdf", "convert_md_to_pdf"]
@@ -0,0 +1,316 @@
+"""
+Deterministic deduplication of fetched opportunities.
+
+Records that share a normalized opportunity number, a canonical URL or a
+normalized title+agency are collapsed into one merged opportunity, with
+fields taken from the most authoritative source and every source record kept
+in its `sources`. Groups that only look alike
+(same loose title, or MinHash near-duplicate text) are reported as ambiguous
+so that just those need an LLM.
+"""
+import hashlib
+import os
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from itertools import combinations
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from Opportunity_Discovery_Workflow.Models.data_models import Opportunity, SourceRecord
+from Opportunity_Discovery_Workflow.utils.near_duplicates import near_duplicate_pairs
+
+# Lower is more authoritative. Simpler.Grants.gov mirrors Grants.gov with
+# truncated descriptions, so the system of record wins ties.
+SOURCE_PRIORITY = {
+    "Grants.gov": 0,
+    "SAM.gov": 0,
+    "Simpler.Grants.gov": 1,
+}
+DEFAULT_SOURCE_PRIORITY = 2
+
+# Estimated title+description Jaccard above which two records count as near-duplicates;
+# override with NEAR_DUPLICATE_THRESHOLD (see near_duplicate_threshold)
+NEAR_DUPLICATE_THRESHOLD = 0.8
+
+_TITLE_STOPWORDS = {
+    "a", "an", "and", "for", "in", "of", "on", "or", "the", "to", "with",
+    "fy", "program", "notice", "funding", "opportunity",
+}
+_NUMERIC_TOKEN = re.compile(r"^(fy)?\d+$")
+_TRACKING_PARAMS = {"utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content"}
+
+
+def near_duplicate_threshold() -> Optional[float]:
+    """The NEAR_DUPLICATE_THRESHOLD setting: a similarity in (0, 1], or None if set to "off"."""
+    value = os.getenv("NEAR_DUPLICATE_THRESHOLD", "").strip().lower()
+    if not value:
+        return NEAR_DUPLICATE_THRESHOLD
+    if value in ("off", "none", "false", "0"):
+        return None
+    threshold = float(value)
+    if not 0.0 < threshold <= 1.0:
+        raise ValueError(f"NEAR_DUPLICATE_THRESHOLD must be in (0, 1], got {value}")
+    return threshold
+
+
+def _ascii_lower(text: str) -> str:
+    return unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii").lower()
+
+
+def normalize_number(number: Optional[str]) -> Optional[str]:
+    """Opportunity number without case, spaces or punctuation."""
+    if not number:
+        return None
+    key = re.sub(r"[^A-Z0-9]", "", _ascii_lower(number).upper())
+    return key or None
+
+
+def canonical_url(url: Optional[str]) -> Optional[str]:
+    """URL without scheme differences, www., fragment, tracking params or trailing slash."""
+    if not url or url == "Not Specified":
+        return None
+    parts = urlsplit(url.strip())
+    if not parts.netloc:
+        return None
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = sorted((k, v) for k, v in parse_qsl(parts.query) if k.lower() not in _TRACKING_PARAMS)
+    return urlunsplit(("https", host, parts.path.rstrip("/"), urlencode(query), ""))
+
+
+def normalize_title(title: Optional[str]) -> str:
+    """Lower-cased title with punctuation collapsed to single spaces."""
+    if not title:
+        return ""
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", _ascii_lower(title)).split())
+
+
+def loose_title_key(title: Optional[str]) -> str:
+    """Order-insensitive title key ignoring years, numbers and filler words."""
+    tokens = {
+        token for token in normalize_title(title).split()
+        if token not in _TITLE_STOPWORDS and not _NUMERIC_TOKEN.match(token)
+    }
+    return " ".join(sorted(tokens))
+
+
+def source_records(opp: Opportunity) -> List[SourceRecord]:
+    """The records `opp` was merged from, or the record itself if it was never merged."""
+    if opp.sources:
+        return list(opp.sources)
+    return [SourceRecord(source=opp.source, opportunity_number=opp.opportunity_number, url=opp.url)]
+
+
+def merge_sources(records: List[Opportunity]) -> List[SourceRecord]:
+    """Source records of all `records`, in order and without repeats."""
+    merged: Dict[Tuple[str, Optional[str], Optional[str]], SourceRecord] = {}
+    for opp in records:
+        for record in source_records(opp):
+            merged.setdefault((record.source, record.opportunity_number, record.url), record)
+    return list(merged.values())
+
+
+def _source_rank(opp: Opportunity) -> Tuple[int, int, int]:
+    filled = sum(1 for value in opp.model_dump().values() if value not in (None, ""))
+    return (
+        SOURCE_PRIORITY.get(opp.source, DEFAULT_SOURCE_PRIORITY),
+        -filled,
+        -len(opp.description or ""),
+    )
+
+
+@dataclass
+class MergedOpportunity:
+    """One deduplicated opportunity and the raw records it was built from."""
+    opportunity: Opportunity
+    members: List[Opportunity]
+    matched_on: Set[str] = field(default_factory=set)
+
+    @property
+    def provenance(self) -> List[SourceRecord]:
+        return merge_sources(self.members)
+
+
+@dataclass
+class DedupResult:
+    """Outcome of the exact-key dedup stage."""
+    merged: List[MergedOpportunity]
+    ambiguous_groups: List[List[MergedOpportunity]]
+    input_count: int
+
+    @property
+    def opportunities(self) -> List[Opportunity]:
+        return [m.opportunity for m in self.merged]
+
+    @property
+    def unambiguous(self) -> List[MergedOpportunity]:
+        grouped = {id(m) for group in self.ambiguous_groups for m in group}
+        return [m for m in self.merged if id(m) not in grouped]
+
+    @property
+    def duplicates_removed(self) -> int:
+        return self.input_count - len(self.merged)
+
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, a: int, b: int) -> int:
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return ra
+        # Keep the lower index as root so output order follows input order
+        if rb < ra:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        return ra
+
+
+def merge_records(records: List[Opportunity]) -> Opportunity:
+    """Merge duplicate records, preferring fields from the most authoritative source."""
+    ranked = sorted(records, key=_source_rank)
+    merged = ranked[0].model_dump()
+    for other in ranked[1:]:
+        for key, value in other.model_dump().items():
+            if merged.get(key) in (None, "", "Not Specified") and value not in (None, ""):
+                merged[key] = value
+    # Descriptions are often truncated by one source; keep the fullest one
+    descriptions = [r.description for r in ranked if r.description]
+    if descriptions:
+        merged["description"] = max(descriptions, key=len)
+    merged["sources"] = merge_sources(records)
+    return Opportunity(**merged)
+
+
+def _may_match(a: MergedOpportunity, b: MergedOpportunity) -> bool:
+    """Two records of the same source with different numbers are never duplicates."""
+    for x in a.members:
+        for y in b.members:
+            nx, ny = normalize_number(x.opportunity_number), normalize_number(y.opportunity_number)
+            if x.source == y.source and nx and ny and nx != ny:
+                return False
+    return True
+
+
+def deduplicate(
+    opportunities: List[Opportunity],
+    near_duplicate_threshold: Optional[float] = NEAR_DUPLICATE_THRESHOLD,
+) -> DedupResult:
+    """Collapse records sharing a number, canonical URL or title+agency."""
+    uf = _UnionFind(len(opportunities))
+    numbers: Dict[int, Set[str]] = {}
+    matched: Dict[int, Set[str]] = {}
+
+    def join(i: int, j: int, kind: str):
+        ri, rj = uf.find(i), uf.find(j)
+        if ri == rj:
+            return
+        root = uf.union(ri, rj)
+        other = rj if root == ri else ri
+        numbers[root] = numbers.get(root, set()) | numbers.pop(other, set())
+        matched[root] = matched.get(root, set()) | matched.pop(other, set()) | {kind}
+
+    for i, opp in enumerate(opportunities):
+        number = normalize_number(opp.opportunity_number)
+        numbers[i] = {number} if number else set()
+
+    for kind, key_fn in (
+        ("opportunity_number", lambda o: normalize_number(o.opportunity_number)),
+        ("url", lambda o: canonical_url(o.url)),
+    ):
+        first_seen: Dict[str, int] = {}
+        for i, opp in enumerate(opportunities):
+            key = key_fn(opp)
+            if not key:
+                continue
+            if key in first_seen:
+                join(first_seen[key], i, kind)
+            else:
+                first_seen[key] = i
+
+    # Title+agency only joins components whose opportunity numbers agree
+    title_buckets: Dict[str, List[int]] = {}
+    for i, opp in enumerate(opportunities):
+        title = normalize_title(opp.title)
+        agency = normalize_title(opp.agency)
+        if title and agency:
+            title_buckets.setdefault(f"{title}|{agency}", []).append(i)
+    for indexes in title_buckets.values():
+        for i in indexes[1:]:
+            a, b = numbers[uf.find(indexes[0])], numbers[uf.find(i)]
+            if not a or not b or a & b:
+                join(indexes[0], i, "title_agency")
+
+    components: Dict[int, List[int]] = {}
+    for i in range(len(opportunities)):
+        components.setdefault(uf.find(i), []).append(i)
+
+    merged = []
+    for root in sorted(components):
+        members = [opportunities[i] for i in components[root]]
+        if len(members) == 1:
+            opportunity = members[0].model_copy(update={"sources": source_records(members[0])})
+        else:
+            opportunity = merge_records(members)
+        merged.append(MergedOpportunity(opportunity, members, matched.get(root, set())))
+
+    return DedupResult(merged, find_ambiguous_groups(merged, near_duplicate_threshold), len(opportunities))
+
+
+def near_duplicate_text(opp: Opportunity) -> str:
+    """The text MinHash similarity is measured on."""
+    return f"{opp.title or ''} {opp.description or ''}"
+
+
+def find_ambiguous_groups(
+    merged: List[MergedOpportunity],
+    near_duplicate_threshold: Optional[float] = NEAR_DUPLICATE_THRESHOLD,
+) -> List[List[MergedOpportunity]]:
+    """
+    Group merged records that exact keys kept apart but that look alike: same
+    loose title key, or title+description MinHash similarity at or above
+    `near_duplicate_threshold` (None disables the MinHash pass).
+    """
+    uf = _UnionFind(len(merged))
+
+    buckets: Dict[str, List[int]] = {}
+    for i, item in enumerate(merged):
+        key = loose_title_key(item.opportunity.title)
+        if key:
+            buckets.setdefault(key, []).append(i)
+    candidate_pairs = [pair for indexes in buckets.values() for pair in combinations(indexes, 2)]
+
+    if near_duplicate_threshold is not None and len(merged) > 1:
+        texts = [near_duplicate_text(item.opportunity) for item in merged]
+        candidate_pairs += [(i, j) for i, j, _ in near_duplicate_pairs(texts, threshold=near_duplicate_threshold)]
+
+    for i, j in candidate_pairs:
+        if _may_match(merged[i], merged[j]):
+            uf.union(i, j)
+
+    components: Dict[int, List[int]] = {}
+    for i in range(len(merged)):
+        components.setdefault(uf.find(i), []).append(i)
+    return [[merged[i] for i in indexes] for root, indexes in sorted(components.items()) if len(indexes) > 1]
+
+
+def content_hash(opp: Opportunity) -> str:
+    """Hash of an opportunity's normalized title, description, dates and URL."""
+    parts = [
+        normalize_title(opp.title),
+        normalize_title(opp.description),
+        opp.published_date or "",
+        opp.openDate or "",
+        opp.closeDate or "",
+        canonical_url(opp.url) or "",
+    ]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
@@ -0,0 +1,203 @@
+"""
+Stemmed keyword index over keywords.json.
+
+Every keyword phrase is tokenized and reduced with the Snowball English
+stemmer, then compiled into an Aho-Corasick automaton over stem sequences, so
+"battery storage" also matches "Batteries stored" in a single pass over the
+record's tokens. Acronyms (AI, REE, ...) are matched on their exact,
+case-sensitive tokens instead of stems.
+
+The compiled index is pickled under .cache/ and reused until the keywords
+file (or the index format) changes.
+"""
+import hashlib
+import json
+import os
+import pickle
+import re
+import threading
+import unicodedata
+from collections import deque
+from functools import lru_cache
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Sequence, Set, Tuple
+
+import snowballstemmer
+
+KEYWORDS_PATH = r"d:\Agno\keywords.json"
+# Copy shipped at the repository root, used when the configured path is absent
+_BUNDLED_KEYWORDS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "keywords.json"
+)
+NEGATIVE_DOMAIN = "Negative_Keywords_To_Exclude"
+
+_BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_INDEX_PATH = os.path.join(_BASE_PATH, ".cache", "keyword_index.pickle")
+# Bump when tokenization, stemming or the pickled layout changes
+INDEX_VERSION = 2
+
+_TOKEN = re.compile(r"[A-Za-z0-9]+")
+_local = threading.local()
+
+
+def resolve_keywords_path(path: Optional[str] = None) -> str:
+    path = path or KEYWORDS_PATH
+    if not os.path.exists(path) and os.path.exists(_BUNDLED_KEYWORDS_PATH):
+        return _BUNDLED_KEYWORDS_PATH
+    return path
+
+
+def load_keywords(path: Optional[str] = None) -> Dict[str, List[str]]:
+    """Domain -> keyword list from keywords.json (including the negative list)."""
+    with open(resolve_keywords_path(path), "r", encoding="utf-8") as f:
+        return json.load(f).get("keywords", {})
+
+
+def is_acronym(keyword: str) -> bool:
+    """Upper-case keywords such as AI, REE or AI/ML are matched case-sensitively."""
+    letters = [c for c in keyword if c.isalpha()]
+    return bool(letters) and keyword == keyword.upper() and len(keyword.replace("/", "")) <= 6
+
+
+class AhoCorasick:
+    """Multi-pattern matcher over sequences of any hashable symbols."""
+
+    def __init__(self):
+        self._goto: List[Dict[Hashable, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[Any, int]]] = [[]]
+        self._built = False
+
+    def add(self, pattern: Sequence[Hashable], value: Any):
+        if not pattern:
+            return
+        node = 0
+        for symbol in pattern:
+            nxt = self._goto[node].get(symbol)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][symbol] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append((value, len(pattern)))
+        self._built = False
+
+    def build(self):
+        """Compute failure links breadth-first."""
+        queue = deque(self._goto[0].values())
+        for child in queue:
+            self._fail[child] = 0
+        while queue:
+            node = queue.popleft()
+            for symbol, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and symbol not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(symbol, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+        self._built = True
+
+    def iter_matches(self, sequence: Sequence[Hashable]) -> Iterator[Tuple[int, int, Any]]:
+        """Yield (start, end, value) for every pattern occurrence, overlaps included."""
+        if not self._built:
+            self.build()
+        node = 0
+        for i, symbol in enumerate(sequence):
+            while node and symbol not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(symbol, 0)
+            for value, length in self._out[node]:
+                yield i + 1 - length, i + 1, value
+
+
+def tokenize(text: str) -> List[str]:
+    """ASCII-folded alphanumeric tokens, case preserved."""
+    text = unicodedata.normalize("NFKD", text or "").encode("ascii", "ignore").decode("ascii")
+    return _TOKEN.findall(text)
+
+
+@lru_cache(maxsize=65536)
+def stem(word: str) -> str:
+    """Snowball stem of a lower-cased token."""
+    # Stemmer instances keep per-call state, so each thread gets its own
+    stemmer = getattr(_local, "stemmer", None)
+    if stemmer is None:
+        stemmer = _local.stemmer = snowballstemmer.stemmer("english")
+    return stemmer.stemWord(word.lower())
+
+
+def stem_tokens(tokens: Sequence[str]) -> List[str]:
+    return [stem(token) for token in tokens]
+
+
+class KeywordIndex:
+    """Compiled stem-sequence and acronym automata for all keyword domains."""
+
+    def __init__(self, keywords: Dict[str, List[str]], fingerprint: str = ""):
+        self.fingerprint = fingerprint
+        self.domains = [domain for domain in keywords if domain != NEGATIVE_DOMAIN]
+        self.acronyms: Set[Tuple[str, str]] = set()
+        # Domain -> distinct stems of its keywords, the per-domain relevance query
+        self.queries: Dict[str, List[str]] = {}
+        self._stemmed = AhoCorasick()
+        self._exact = AhoCorasick()
+
+        for domain, domain_keywords in keywords.items():
+            for keyword in domain_keywords:
+                tokens = tokenize(keyword)
+                if not tokens:
+                    continue
+                if domain != NEGATIVE_DOMAIN:
+                    query = self.queries.setdefault(domain, [])
+                    for term in stem_tokens(tokens):
+                        if term not in query:
+                            query.append(term)
+                if is_acronym(keyword) and domain != NEGATIVE_DOMAIN:
+                    self._exact.add(tuple(tokens), (domain, keyword))
+                    self.acronyms.add((domain, keyword))
+                else:
+                    self._stemmed.add(tuple(stem_tokens(tokens)), (domain, keyword))
+        self._stemmed.build()
+        self._exact.build()
+
+    def find(self, text: str) -> List[Tuple[str, str]]:
+        """(domain, keyword) for every keyword occurrence in `text`."""
+        tokens = tokenize(text)
+        hits = [value for _, _, value in self._stemmed.iter_matches(stem_tokens(tokens))]
+        hits.extend(value for _, _, value in self._exact.iter_matches(tokens))
+        return hits
+
+    @classmethod
+    def load(cls, path: Optional[str] = None, index_path: Optional[str] = None) -> "KeywordIndex":
+        """
+        Index for the keywords file at `path`, read from the pickled copy at
+        `index_path` when it was built from the same file contents, otherwise
+        rebuilt and saved there.
+        """
+        with open(resolve_keywords_path(path), "rb") as f:
+            raw = f.read()
+        fingerprint = hashlib.sha256(raw).hexdigest() + f":v{INDEX_VERSION}"
+        index_path = index_path or os.getenv("KEYWORD_INDEX_PATH", DEFAULT_INDEX_PATH)
+
+        try:
+            with open(index_path, "rb") as f:
+                index = pickle.load(f)
+            if isinstance(index, cls) and index.fingerprint == fingerprint:
+                return index
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"⚠️ Ignoring unreadable keyword index {index_path}: {e}")
+
+        index = cls(json.loads(raw.decode("utf-8")).get("keywords", {}), fingerprint)
+        try:
+            os.makedirs(os.path.dirname(index_path) or ".", exist_ok=True)
+            tmp_path = f"{index_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, index_path)
+        except OSError as e:
+            print(f"⚠️ Could not save keyword index to {index_path}: {e}")
+        return index
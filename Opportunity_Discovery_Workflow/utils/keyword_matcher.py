@@ -0,0 +1,82 @@
+"""
+Local keyword pre-filter over keywords.json.
+
+All domain keywords and the negative keywords are compiled into a stemmed
+Aho-Corasick index (see keyword_index), so each opportunity is scanned once
+regardless of keyword count and plural or inflected forms still match.
+Records with a negative keyword or no keyword at all are rejected locally,
+records whose best domain is clear are accepted with that sector, and only
+the borderline ones need the filter agent.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+from Opportunity_Discovery_Workflow.utils.keyword_index import NEGATIVE_DOMAIN, KeywordIndex
+
+ACCEPT = "accept"
+REJECT = "reject"
+BORDERLINE = "borderline"
+
+
+@dataclass
+class KeywordMatch:
+    """Keyword hits for one opportunity and the resulting decision."""
+    decision: str
+    domain_hits: Dict[str, int] = field(default_factory=dict)
+    matched_keywords: Dict[str, Set[str]] = field(default_factory=dict)
+    negative_keywords: Set[str] = field(default_factory=set)
+    top_domains: List[str] = field(default_factory=list)
+
+    @property
+    def sector(self) -> Optional[str]:
+        return self.top_domains[0] if self.top_domains else None
+
+
+class KeywordMatcher:
+    """Decides opportunities against a keyword index, optionally limited to some domains."""
+
+    def __init__(self, index: KeywordIndex, domains: Optional[List[str]] = None):
+        self.index = index
+        self.domains = [domain for domain in index.domains if not domains or domain in domains]
+        self._allowed = set(self.domains) | {NEGATIVE_DOMAIN}
+
+    @classmethod
+    def from_keywords(cls, keywords: Dict[str, List[str]], domains: Optional[List[str]] = None) -> "KeywordMatcher":
+        return cls(KeywordIndex(keywords), domains)
+
+    @classmethod
+    def from_file(cls, path: Optional[str] = None, domains: Optional[List[str]] = None) -> "KeywordMatcher":
+        return cls(KeywordIndex.load(path), domains)
+
+    def match_text(self, text: str) -> KeywordMatch:
+        hits = [(domain, keyword) for domain, keyword in self.index.find(text) if domain in self._allowed]
+
+        result = KeywordMatch(decision=REJECT)
+        for domain, keyword in hits:
+            if domain == NEGATIVE_DOMAIN:
+                result.negative_keywords.add(keyword)
+                continue
+            result.domain_hits[domain] = result.domain_hits.get(domain, 0) + 1
+            result.matched_keywords.setdefault(domain, set()).add(keyword)
+
+        if result.negative_keywords or not result.domain_hits:
+            return result
+
+        ranked = sorted(
+            result.domain_hits,
+            key=lambda d: (-len(result.matched_keywords[d]), -result.domain_hits[d], self.domains.index(d)),
+        )
+        best = (len(result.matched_keywords[ranked[0]]), result.domain_hits[ranked[0]])
+        result.top_domains = [
+            d for d in ranked if (len(result.matched_keywords[d]), result.domain_hits[d]) == best
+        ]
+        acronym_only = all(
+            (domain, keyword) in self.index.acronyms
+            for domain in result.top_domains
+            for keyword in result.matched_keywords[domain]
+        )
+        result.decision = BORDERLINE if len(result.top_domains) > 1 or acronym_only else ACCEPT
+        return result
+
+    def match(self, title: str, description: str = "") -> KeywordMatch:
+        return self.match_text(f"{title or ''}\n{description or ''}")
@@ -0,0 +1,172 @@
+"""
+Near-duplicate detection with MinHash signatures and LSH banding.
+
+Texts are reduced to character shingles, hashed to 32 bits and summarised by
+a MinHash signature whose per-slot agreement estimates Jaccard similarity.
+LSH banding buckets signatures so that only pairs sharing a band are compared,
+which keeps lookups sub-quadratic over large stored collections. Signatures
+pack into 4 bytes per slot for storage, so stored records are hashed once.
+"""
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+# Shingles hashed per vectorised block when building signatures in bulk
+_BLOCK_SHINGLES = 8192
+
+
+def _normalize(text: str) -> str:
+    text = unicodedata.normalize("NFKD", text or "").encode("ascii", "ignore").decode("ascii").lower()
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", text).split())
+
+
+def shingle_hashes(text: str, k: int = 5) -> np.ndarray:
+    """Distinct 32-bit hashes of the character k-grams (k <= 8) of the normalized text."""
+    data = np.frombuffer(_normalize(text).encode("ascii"), dtype=np.uint8).astype(np.uint64)
+    if len(data) == 0:
+        return np.empty(0, dtype=np.uint64)
+    k = min(k, len(data))
+    n = len(data) - k + 1
+    # Pack each k-gram into one integer, then take the high half of a multiplicative hash
+    packed = np.zeros(n, dtype=np.uint64)
+    for j in range(k):
+        packed = (packed << np.uint64(8)) | data[j:j + n]
+    return np.unique((packed * _GOLDEN) >> np.uint64(32))
+
+
+def optimal_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    Pick (bands, rows) with bands * rows <= num_perm that minimise the summed
+    false positive and false negative probability around `threshold`.
+    """
+    xs = np.linspace(0.0, 1.0, 201)
+
+    def candidate_probability(b: int, r: int) -> np.ndarray:
+        return 1.0 - (1.0 - xs ** r) ** b
+
+    best, best_error = (1, num_perm), float("inf")
+    for b in range(1, num_perm + 1):
+        r = num_perm // b
+        if r < 1:
+            break
+        p = candidate_probability(b, r)
+        below = xs < threshold
+        false_positive = np.trapezoid(p[below], xs[below]) if below.any() else 0.0
+        false_negative = np.trapezoid(1.0 - p[~below], xs[~below]) if (~below).any() else 0.0
+        error = false_positive + false_negative
+        if error < best_error:
+            best, best_error = (b, r), error
+    return best
+
+
+class MinHasher:
+    """Computes fixed-length MinHash signatures."""
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, 1 << 31, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, 1 << 31, size=num_perm, dtype=np.uint64)
+
+    def signature(self, text: str) -> np.ndarray:
+        return self.signatures([text])[0]
+
+    def signatures(self, texts: Iterable[str]) -> np.ndarray:
+        """One signature row per text, computed in vectorised blocks."""
+        hashes = [shingle_hashes(text, self.shingle_size) for text in texts]
+        result = np.full((len(hashes), self.num_perm), _MAX_HASH, dtype=np.uint64)
+
+        start = 0
+        while start < len(hashes):
+            end, size = start, 0
+            while end < len(hashes) and (end == start or size + len(hashes[end]) <= _BLOCK_SHINGLES):
+                size += len(hashes[end])
+                end += 1
+            block = hashes[start:end]
+            lengths = np.array([len(h) for h in block])
+            nonempty = lengths > 0
+            if nonempty.any():
+                values = np.concatenate([h for h in block if len(h)])
+                # a < 2^31 and hashes < 2^32 keep a*x + b inside uint64 before the modulo
+                permuted = np.outer(values, self._a)
+                permuted += self._b
+                permuted %= _MERSENNE_PRIME
+                permuted &= _MAX_HASH
+                offsets = np.concatenate(([0], np.cumsum(lengths[nonempty])[:-1]))
+                result[start:end][nonempty] = np.minimum.reduceat(permuted, offsets, axis=0)
+            start = end
+        return result
+
+
+def pack_signature(signature: np.ndarray) -> bytes:
+    """Storage form of a signature; MinHash values fit in 32 bits."""
+    return signature.astype("<u4").tobytes()
+
+
+def unpack_signature(blob: bytes) -> np.ndarray:
+    return np.frombuffer(blob, dtype="<u4").astype(np.uint64)
+
+
+def jaccard_estimate(a: np.ndarray, b: np.ndarray) -> float:
+    return float(np.count_nonzero(a == b)) / len(a)
+
+
+class LSHIndex:
+    """Banded LSH index over MinHash signatures with a tunable similarity threshold."""
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 128, hasher: Optional[MinHasher] = None):
+        self.threshold = threshold
+        self.hasher = hasher or MinHasher(num_perm=num_perm)
+        self.bands, self.rows = optimal_bands(threshold, self.hasher.num_perm)
+        self._buckets: List[Dict[bytes, List[Hashable]]] = [defaultdict(list) for _ in range(self.bands)]
+        self._signatures: Dict[Hashable, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [
+            signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def add(self, key: Hashable, text: str, signature: Optional[np.ndarray] = None):
+        signature = self.hasher.signature(text) if signature is None else signature
+        self._signatures[key] = signature
+        for band, band_key in enumerate(self._band_keys(signature)):
+            self._buckets[band][band_key].append(key)
+
+    def query(self, text: str, signature: Optional[np.ndarray] = None) -> List[Tuple[Hashable, float]]:
+        """Indexed keys whose estimated similarity to `text` reaches the threshold, best first."""
+        signature = self.hasher.signature(text) if signature is None else signature
+        candidates = set()
+        for band, band_key in enumerate(self._band_keys(signature)):
+            candidates.update(self._buckets[band].get(band_key, ()))
+        matches = []
+        for key in candidates:
+            similarity = jaccard_estimate(signature, self._signatures[key])
+            if similarity >= self.threshold:
+                matches.append((key, similarity))
+        matches.sort(key=lambda item: -item[1])
+        return matches
+
+
+def near_duplicate_pairs(texts: List[str], threshold: float = 0.8, num_perm: int = 128) -> List[Tuple[int, int, float]]:
+    """All (i, j, similarity) pairs with i < j whose estimated Jaccard reaches `threshold`."""
+    index = LSHIndex(threshold=threshold, num_perm=num_perm)
+    signatures = index.hasher.signatures(texts)
+    pairs = []
+    for i, text in enumerate(texts):
+        signature = signatures[i]
+        for j, similarity in index.query(text, signature):
+            pairs.append((j, i, similarity))
+        index.add(i, text, signature)
+    pairs.sort()
+    return pairs
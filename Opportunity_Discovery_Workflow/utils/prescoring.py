@@ -0,0 +1,240 @@
+"""
+Heuristic pre-scoring of filtered opportunities.
+
+Features are computed for the whole batch at once as NumPy columns:
+
+- deadline: days until `closeDate`, ramping up to a comfortable lead time
+- agency: priority of the issuing agency (DARPA, DOE, NSF, DoD, ...)
+- relevance: BM25 keyword relevance per domain, weighted by the focus areas
+  in scoring_instructions (AR/VR, AI, critical minerals)
+- source: authority tier from aggregation_instructions
+- length: log-scaled description length
+
+Their weighted sum becomes a provisional 1-10 score. Only the top records go
+to the scoring agent; the rest keep the provisional score, flagged "heuristic"
+and capped at the threshold so they never outrank an agent-reviewed record
+that cleared it.
+"""
+import math
+import re
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from Opportunity_Discovery_Workflow.Models.data_models import Opportunity, ScoredOpportunity
+from Opportunity_Discovery_Workflow.utils.relevance import RelevanceMatrix
+
+# Provisional score at or above which a record is worth an LLM scoring pass
+PRESCORE_THRESHOLD = 4.0
+# At most this many records per run go to the scoring agent
+PRESCORE_TOP_N = 150
+# Fewer days than this before the close date is too late to write a proposal
+MIN_DAYS_TO_PREPARE = 7
+# Lead time at which the deadline no longer lowers the score
+COMFORTABLE_LEAD_DAYS = 45
+# Deadline feature for records without a (parsable) close date, e.g. rolling calls
+UNKNOWN_DEADLINE = 0.6
+
+FEATURE_WEIGHTS = {
+    "relevance": 0.35,
+    "deadline": 0.25,
+    "agency": 0.15,
+    "length": 0.15,
+    "source": 0.10,
+}
+
+# Tier 1 agencies from aggregation_instructions score highest; matched as whole words
+AGENCY_PRIORITY = {
+    "DARPA": 1.0,
+    "ARPA-E": 1.0,
+    "DOE": 1.0,
+    "DEPARTMENT OF ENERGY": 1.0,
+    "NSF": 1.0,
+    "NATIONAL SCIENCE FOUNDATION": 1.0,
+    "DOD": 0.9,
+    "DEPARTMENT OF DEFENSE": 0.9,
+    "AIR FORCE": 0.9,
+    "ARMY": 0.9,
+    "NAVY": 0.9,
+    "NASA": 0.8,
+    "NIST": 0.8,
+    "USGS": 0.8,
+    "GEOLOGICAL SURVEY": 0.8,
+    "DEPARTMENT OF COMMERCE": 0.7,
+    "DEPARTMENT OF THE INTERIOR": 0.6,
+}
+OTHER_AGENCY_PRIORITY = 0.4
+NO_AGENCY_PRIORITY = 0.2
+
+# Source authority tiers from aggregation_instructions
+SOURCE_TIERS = {
+    "SAM.gov": 1,
+    "Grants.gov": 1,
+    "Simpler.Grants.gov": 1,
+    "SBIR.gov": 2,
+}
+DEFAULT_SOURCE_TIER = 3
+TIER_VALUES = {1: 1.0, 2: 0.7, 3: 0.3}
+
+# Focus areas from scoring_instructions weigh fully, other domains less
+DOMAIN_WEIGHTS = {
+    "Critical Minerals & Battery Materials": 1.0,
+    "Artificial Intelligence & Machine Learning": 1.0,
+    "AR, VR, and XR Technologies": 1.0,
+}
+OTHER_DOMAIN_WEIGHT = 0.7
+# BM25 score at which relevance reaches ~63% of its maximum
+RELEVANCE_SCALE = 4.0
+# Description length (characters) that earns the full length feature
+FULL_DESCRIPTION_CHARS = 1500
+
+_AGENCY_PATTERNS = [
+    (re.compile(rf"(?<![A-Z0-9]){re.escape(name)}(?![A-Z0-9])"), weight)
+    for name, weight in AGENCY_PRIORITY.items()
+]
+
+
+@dataclass
+class PrescoreResult:
+    """Records chosen for LLM scoring and the heuristically scored rest."""
+    to_score: List[Opportunity] = field(default_factory=list)
+    heuristic: List[ScoredOpportunity] = field(default_factory=list)
+    expired: int = 0
+
+    @property
+    def summary(self) -> str:
+        text = f"{len(self.to_score)} to scoring agent, {len(self.heuristic)} heuristic"
+        if self.expired:
+            text += f" ({self.expired} closing within {MIN_DAYS_TO_PREPARE} days)"
+        return text
+
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value[:10], "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+def days_to_close(opportunities: Sequence[Opportunity], today: Optional[date] = None) -> np.ndarray:
+    """Days until each close date; NaN where unknown."""
+    today = today or date.today()
+    days = np.full(len(opportunities), np.nan)
+    for i, opp in enumerate(opportunities):
+        closes = _parse_date(opp.closeDate)
+        if closes is not None:
+            days[i] = (closes - today).days
+    return days
+
+
+def agency_priority(opportunities: Sequence[Opportunity]) -> np.ndarray:
+    priority = np.full(len(opportunities), NO_AGENCY_PRIORITY)
+    for i, opp in enumerate(opportunities):
+        agency = (opp.agency or "").upper()
+        if agency:
+            priority[i] = max((weight for pattern, weight in _AGENCY_PATTERNS if pattern.search(agency)),
+                              default=OTHER_AGENCY_PRIORITY)
+    return priority
+
+
+def source_tiers(opportunities: Sequence[Opportunity]) -> np.ndarray:
+    return np.array([SOURCE_TIERS.get(opp.source, DEFAULT_SOURCE_TIER) for opp in opportunities], dtype=int)
+
+
+def compute_features(
+    opportunities: Sequence[Opportunity],
+    relevance: RelevanceMatrix,
+    today: Optional[date] = None,
+) -> Dict[str, np.ndarray]:
+    """Raw and normalized (0-1) feature columns for every record."""
+    days = days_to_close(opportunities, today)
+    ramp = (days - MIN_DAYS_TO_PREPARE) / (COMFORTABLE_LEAD_DAYS - MIN_DAYS_TO_PREPARE)
+    deadline = np.where(np.isnan(days), UNKNOWN_DEADLINE, np.clip(ramp, 0.0, 1.0))
+
+    domain_weights = np.array([DOMAIN_WEIGHTS.get(domain, OTHER_DOMAIN_WEIGHT) for domain in relevance.domains])
+    if relevance.domains:
+        weighted = (1.0 - np.exp(-relevance.scores / RELEVANCE_SCALE)) * domain_weights
+        relevance_feature = weighted.max(axis=1)
+    else:
+        relevance_feature = np.zeros(len(opportunities))
+
+    tiers = source_tiers(opportunities)
+    chars = np.array([len(opp.description or "") for opp in opportunities], dtype=float)
+
+    return {
+        "days_to_close": days,
+        "deadline": deadline,
+        "agency": agency_priority(opportunities),
+        "relevance": relevance_feature,
+        "source_tier": tiers,
+        "source": np.vectorize(TIER_VALUES.get, otypes=[float])(tiers) if len(tiers) else np.zeros(0),
+        "description_chars": chars,
+        "length": np.minimum(1.0, np.log1p(chars) / math.log1p(FULL_DESCRIPTION_CHARS)),
+    }
+
+
+def provisional_scores(features: Dict[str, np.ndarray]) -> np.ndarray:
+    """Weighted feature sum mapped onto the 1-10 scoring scale."""
+    combined = sum(weight * features[name] for name, weight in FEATURE_WEIGHTS.items())
+    return np.round(1.0 + 9.0 * combined, 2)
+
+
+def _justification(features: Dict[str, np.ndarray], i: int, score: float) -> str:
+    days = features["days_to_close"][i]
+    deadline = "no close date" if np.isnan(days) else f"closes in {int(days)} days"
+    return (
+        f"Heuristic pre-score {score:.2f}, not reviewed by the scoring agent: "
+        f"{deadline}, keyword relevance {features['relevance'][i]:.2f}, "
+        f"agency priority {features['agency'][i]:.1f}, source tier {features['source_tier'][i]}, "
+        f"{int(features['description_chars'][i])}-character description."
+    )
+
+
+def prescore(
+    opportunities: Sequence[Opportunity],
+    relevance: RelevanceMatrix,
+    top_n: Optional[int] = PRESCORE_TOP_N,
+    threshold: Optional[float] = PRESCORE_THRESHOLD,
+    today: Optional[date] = None,
+) -> PrescoreResult:
+    """
+    Split `opportunities` into the records worth an LLM scoring pass (at or
+    above `threshold`, at most `top_n`, best first) and heuristic scores for
+    the rest. Records closing too soon to respond are never sent.
+    """
+    result = PrescoreResult()
+    if not opportunities:
+        return result
+
+    features = compute_features(opportunities, relevance, today)
+    scores = provisional_scores(features)
+    expired = features["days_to_close"] < MIN_DAYS_TO_PREPARE
+    selected = ~expired
+    if threshold is not None:
+        selected &= scores >= threshold
+    order = np.argsort(-scores, kind="stable")
+    chosen = [i for i in order if selected[i]]
+    if top_n is not None:
+        chosen = chosen[:top_n]
+
+    chosen_set = set(chosen)
+    result.to_score = [opportunities[i] for i in chosen]
+    for i in order:
+        if i in chosen_set:
+            continue
+        score = float(scores[i]) if threshold is None else min(float(scores[i]), threshold)
+        result.heuristic.append(ScoredOpportunity(
+            **opportunities[i].model_dump(),
+            feasibility_score=score,
+            impact_score=score,
+            alignment_score=score,
+            total_score=score,
+            justification=_justification(features, i, float(scores[i])),
+            score_method="heuristic",
+        ))
+    result.expired = int(expired.sum())
+    return result
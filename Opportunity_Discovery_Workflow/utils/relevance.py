@@ -0,0 +1,104 @@
+"""
+BM25 relevance of opportunities to the keyword domains.
+
+Each domain's keywords form one stemmed query. Every opportunity is scored
+against every domain at once: the corpus statistics come from rank-bm25 and
+the per-term BM25 weights are multiplied by a term x domain query matrix,
+giving a (records x domains) relevance matrix.
+"""
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from rank_bm25 import BM25Okapi
+
+from Opportunity_Discovery_Workflow.Models.data_models import Opportunity
+from Opportunity_Discovery_Workflow.utils.keyword_index import stem_tokens, tokenize
+
+# Best-domain BM25 score below which a record is treated as off-topic
+MIN_RELEVANCE = 1.0
+# IDF is meaningless over a handful of records, so no cut-off below this size
+MIN_CORPUS_SIZE = 20
+# A keyword shared by the whole batch (e.g. a single-domain search) still counts
+IDF_FLOOR = 1.0
+
+
+class _DomainBM25(BM25Okapi):
+    """BM25Okapi with the Lucene IDF floored at IDF_FLOOR instead of going negative."""
+
+    def _calc_idf(self, nd):
+        for word, freq in nd.items():
+            self.idf[word] = max(IDF_FLOOR, math.log(1 + (self.corpus_size - freq + 0.5) / (freq + 0.5)))
+        self.average_idf = sum(self.idf.values()) / len(self.idf) if self.idf else 0.0
+
+
+@dataclass
+class RelevanceMatrix:
+    """BM25 scores of each record (rows) against each domain (columns)."""
+    domains: List[str]
+    scores: np.ndarray
+
+    @property
+    def best_scores(self) -> np.ndarray:
+        if not self.domains:
+            return np.zeros(len(self.scores))
+        return self.scores.max(axis=1)
+
+    def best_domain(self, row: int, among: Optional[Sequence[str]] = None) -> Optional[str]:
+        """Highest-scoring domain for record `row`, optionally limited to `among`."""
+        candidates = [i for i, domain in enumerate(self.domains) if not among or domain in among]
+        if not candidates:
+            return None
+        return self.domains[max(candidates, key=lambda i: self.scores[row, i])]
+
+    def order(self) -> np.ndarray:
+        """Record indices, most relevant first (stable for ties)."""
+        return np.argsort(-self.best_scores, kind="stable")
+
+    def above(self, threshold: float = MIN_RELEVANCE) -> np.ndarray:
+        """Boolean mask of records relevant enough to keep; all True for small corpora."""
+        if len(self.scores) < MIN_CORPUS_SIZE:
+            return np.ones(len(self.scores), dtype=bool)
+        return self.best_scores >= threshold
+
+
+class RelevanceRanker:
+    """Scores opportunities against per-domain stemmed keyword queries."""
+
+    def __init__(self, queries: Dict[str, List[str]], domains: Optional[List[str]] = None, k1: float = 1.5, b: float = 0.75):
+        self.domains = [domain for domain in queries if not domains or domain in domains]
+        self.k1 = k1
+        self.b = b
+        self.vocabulary: Dict[str, int] = {}
+        for domain in self.domains:
+            for term in queries[domain]:
+                self.vocabulary.setdefault(term, len(self.vocabulary))
+
+        # Term x domain indicator: which query each term belongs to
+        self._query_matrix = np.zeros((len(self.vocabulary), len(self.domains)))
+        for column, domain in enumerate(self.domains):
+            for term in queries[domain]:
+                self._query_matrix[self.vocabulary[term], column] = 1.0
+
+    def score_texts(self, texts: Sequence[str]) -> RelevanceMatrix:
+        if not texts:
+            return RelevanceMatrix(self.domains, np.zeros((0, len(self.domains))))
+        corpus = [stem_tokens(tokenize(text)) or [""] for text in texts]
+        bm25 = _DomainBM25(corpus, k1=self.k1, b=self.b)
+
+        tf = np.zeros((len(corpus), len(self.vocabulary)))
+        for row, frequencies in enumerate(bm25.doc_freqs):
+            for term, count in frequencies.items():
+                column = self.vocabulary.get(term)
+                if column is not None:
+                    tf[row, column] = count
+
+        idf = np.array([bm25.idf.get(term, 0.0) for term in self.vocabulary])
+        doc_len = np.array(bm25.doc_len, dtype=float)[:, None]
+        norm = self.k1 * (1 - self.b + self.b * doc_len / bm25.avgdl)
+        weights = idf * tf * (self.k1 + 1) / (tf + norm)
+        return RelevanceMatrix(self.domains, weights @ self._query_matrix)
+
+    def score(self, opportunities: Sequence[Opportunity]) -> RelevanceMatrix:
+        return self.score_texts([f"{opp.title or ''}\n{opp.description or ''}" for opp in opportunities])
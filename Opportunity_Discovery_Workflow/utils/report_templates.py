@@ -0,0 +1,71 @@
+REPORT_TEMPLATE = """\
+# Opportunity Discovery Report
+**Date Generated:** {{ generated_at }}
+
+## Executive Summary
+
+### Overview
+- **Total opportunities discovered:** {{ total }}
+- **Analysis time period:** {{ period }}
+- **Key sectors covered:**
+{% for domain in domains %}
+  - {{ domain.name }} ({{ domain.opportunities|length }} opportunities)
+{% endfor %}
+{% if heuristic_count %}
+- **Pre-scored only:** {{ heuristic_count }} opportunities were ranked by the heuristic pre-scorer and not reviewed by the scoring agent
+{% endif %}
+
+### Key Findings
+{% for finding in key_findings %}
+- {{ finding }}
+{% endfor %}
+
+---
+
+{% for domain in domains %}
+## {{ domain.name }}
+
+{% for opp in domain.opportunities %}
+### {{ opp.title or "Untitled opportunity" }}
+
+**Source:** {{ opp.source or "See source documentation" }}{{ " / " ~ opp.agency if opp.agency else "" }}  
+{% if opp.opportunity_number %}
+**Opportunity Number:** {{ opp.opportunity_number }}  
+{% endif %}
+**Published Date:** {{ opp.published_date or "Not specified" }}  
+**Deadline:** **{{ opp.closeDate or "Not specified" }}**  
+**URL:** {{ "<" ~ opp.url ~ ">" if opp.url else "See source documentation" }}  
+**Total Score:** **{{ "%.2f"|format(opp.total_score) }}/10.0**{{ " *(heuristic pre-score)*" if opp.score_method == "heuristic" else "" }}
+
+#### Scoring Breakdown
+| Dimension   | Score (/10.0) |
+|-------------|---------------|
+| Feasibility | {{ "%.1f"|format(opp.feasibility_score) }} |
+| Impact      | {{ "%.1f"|format(opp.impact_score) }} |
+| Alignment   | {{ "%.1f"|format(opp.alignment_score) }} |
+
+#### Description
+{{ opp.description or "See source for details." }}
+
+#### Score Justification
+{{ opp.justification or "Not specified." }}
+
+---
+
+{% endfor %}
+{% endfor %}
+## Appendix
+
+### Methodology
+
+1. **Scoring System**
+   - **Feasibility (weight 0.35):** whether the organization can realistically execute the work with its expertise and SME partners
+   - **Impact (weight 0.35):** strategic and financial value of winning the award
+   - **Alignment (weight 0.30):** fit with the AR/VR, AI and critical minerals focus areas
+   - Opportunities with a heuristic pre-score were ranked on deadline, agency, keyword relevance, source and description length only
+
+2. **Data Quality and Enrichment**
+   - Sources: {{ sources|join(", ") if sources else "Not specified" }}
+   - Duplicates across sources were merged and descriptions enriched during aggregation
+   - Missing dates and links are marked "Not specified" or "See source documentation"; consult the source for details
+"""
@@ -4,7 +4,7 @@ Health check and system status endpoints.
 from fastapi import APIRouter, status
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import os
 import sys
 
@@ -27,6 +27,8 @@ class SystemInfoResponse(BaseModel):
     outputs_directory_exists: bool
     config_loaded: bool
     agents_available: bool
+    agent_cache: Optional[Dict[str, Any]] = None
+    pdf_renderer: Optional[Dict[str, Any]] = None
 
 
 @router.get(
@@ -119,6 +121,22 @@ async def system_info():
     except:
         pass
     
+    # Agent response cache
+    agent_cache = None
+    try:
+        from utils import get_agent_cache
+        agent_cache = get_agent_cache().stats()
+    except Exception:
+        pass
+    
+    # Background PDF rendering queue
+    pdf_renderer = None
+    try:
+        from utils import get_pdf_service
+        pdf_renderer = get_pdf_service().stats()
+    except Exception:
+        pass
+    
     return SystemInfoResponse(
         python_version=sys.version,
         platform=platform.platform(),
@@ -126,4 +144,6 @@ async def system_info():
         outputs_directory_exists=os.path.exists(os.path.join(base_path, "outputs")),
         config_loaded=config_ok,
         agents_available=agents_ok,
+        agent_cache=agent_cache,
+        pdf_renderer=pdf_renderer,
     )
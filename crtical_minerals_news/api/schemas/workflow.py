@@ -104,6 +104,10 @@ class WorkflowStatusResponse(BaseModel):
     completed_at: Optional[datetime] = Field(None, description="Workflow completion time")
     report_filename: Optional[str] = Field(None, description="Generated report filename")
     pdf_filename: Optional[str] = Field(None, description="Generated PDF filename")
+    pdf_job_id: Optional[str] = Field(None, description="Background PDF rendering job ID")
+    pdf_status: Optional[str] = Field(
+        None, description="PDF rendering status: queued, running, completed, failed or timeout"
+    )
     error: Optional[str] = Field(None, description="Error message if failed")
 
 
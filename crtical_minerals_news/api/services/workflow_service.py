@@ -147,6 +147,8 @@ class WorkflowService:
             
             # Import workflow components
             from workflows import enhanced_workflow
+            from utils import get_artifact_sink
+            from workflow_common.pdf_service import FAILED, QUEUED, get_pdf_service
             
             # Update phase: PREPARE
             self._update_workflow_status(
@@ -183,17 +185,37 @@ class WorkflowService:
                     )
                 )
                 
-                # Find the generated report files
-                report_filename = self._find_latest_report('.md')
-                pdf_filename = self._find_latest_report('.pdf')
+                # The PDF step reports this run's report and its background PDF job
+                content = getattr(response, "content", None)
+                if not isinstance(content, dict):
+                    content = {}
+                pdf_job_id = content.get("pdf_job_id")
+                if pdf_job_id:
+                    # Set before attaching so a job that already finished is not reported as queued
+                    self._update_workflow_status(workflow_id, pdf_job_id=pdf_job_id, pdf_status=QUEUED)
+                    attached = get_pdf_service().add_done_callback(
+                        pdf_job_id, lambda job: self._pdf_finished(workflow_id, job)
+                    )
+                    if not attached:
+                        self._update_workflow_status(
+                            workflow_id,
+                            phase_result=WorkflowPhaseResult(
+                                phase=WorkflowPhase.PDF_CONVERT,
+                                status=WorkflowStatus.FAILED,
+                                message=f"PDF job {pdf_job_id} is no longer tracked"
+                            ),
+                            pdf_status=FAILED,
+                        )
+                
+                # The report is written in the background; wait for it before reporting completion
+                get_artifact_sink(self.output_dir).flush()
                 
                 self._update_workflow_status(
                     workflow_id,
                     status=WorkflowStatus.COMPLETED,
                     current_phase=None,
                     completed_at=datetime.now(),
-                    report_filename=report_filename,
-                    pdf_filename=pdf_filename
+                    report_filename=os.path.basename(content["filepath"]) if content.get("filepath") else None,
                 )
                 
             except Exception as e:
@@ -212,22 +234,22 @@ class WorkflowService:
                 completed_at=datetime.now()
             )
     
-    def _find_latest_report(self, extension: str = '.md') -> Optional[str]:
-        """Find the most recently created report with the given extension."""
-        if not os.path.exists(self.output_dir):
-            return None
+    def _pdf_finished(self, workflow_id: str, job):
+        """Record a background PDF job's outcome on its workflow."""
+        from workflow_common.pdf_service import COMPLETED
         
-        reports = [f for f in os.listdir(self.output_dir) if f.endswith(extension)]
-        if not reports:
-            return None
-        
-        # Sort by modification time, newest first
-        reports.sort(
-            key=lambda f: os.path.getmtime(os.path.join(self.output_dir, f)),
-            reverse=True
+        ok = job.status == COMPLETED
+        self._update_workflow_status(
+            workflow_id,
+            phase_result=WorkflowPhaseResult(
+                phase=WorkflowPhase.PDF_CONVERT,
+                status=WorkflowStatus.COMPLETED if ok else WorkflowStatus.FAILED,
+                duration_seconds=job.to_dict()["render_seconds"],
+                message=f"Generated PDF: {os.path.basename(job.pdf_path)}" if ok else f"PDF conversion {job.status}: {job.error}"
+            ),
+            pdf_filename=os.path.basename(job.pdf_path) if ok else None,
+            pdf_status=job.status,
         )
-        
-        return reports[0] if reports else None
     
     def get_workflow_status(self, workflow_id: str) -> Optional[WorkflowStatusResponse]:
         """Get the status of a workflow by ID."""
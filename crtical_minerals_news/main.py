@@ -1,4 +1,5 @@
 from workflows import enhanced_workflow
+from utils import get_pdf_service
 
 
 def main():
@@ -16,6 +17,9 @@ def main():
         markdown=True,
     )
     
+    # The PDF renders in the background; let it finish before exiting
+    get_pdf_service().wait_all()
+    
     print()
     print("-" * 70)
     print("Workflow completed!")
@@ -1,6 +1,13 @@
 """
 Utility functions for Critical Minerals News Discovery.
 """
+import os
+import sys
+
+# Caches and PDF rendering are shared with the opportunity workflow from the repository root
+_REPO_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if _REPO_PATH not in sys.path:
+    sys.path.append(_REPO_PATH)
 
 from .workflow_steps import (
     prepare_search_queries,
@@ -12,7 +19,11 @@ from .workflow_steps import (
     format_report,
     save_enhanced_report,
     convert_to_pdf,
+    cached_agent_step,
 )
+from workflow_common.agent_cache import get_agent_cache
+from workflow_common.artifacts import get_artifact_sink
+from workflow_common.pdf_service import get_pdf_service
 
 __all__ = [
     "prepare_search_queries",
@@ -24,4 +35,8 @@ __all__ = [
     "format_report",
     "save_enhanced_report",
     "convert_to_pdf",
+    "cached_agent_step",
+    "get_agent_cache",
+    "get_artifact_sink",
+    "get_pdf_service",
 ]
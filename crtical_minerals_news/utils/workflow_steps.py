@@ -4,7 +4,35 @@ from textwrap import dedent
 from datetime import datetime
 import re
 from pathlib import Path
+from typing import Any, Callable
 from agno.workflow.types import StepInput, StepOutput
+from pydantic import BaseModel
+
+from workflow_common.agent_cache import cached
+from workflow_common.artifacts import get_artifact_sink
+
+OUTPUT_DIR = Path(__file__).parent.parent / "outputs"
+
+
+def cached_agent_step(agent: Any) -> Callable[[StepInput], StepOutput]:
+    """
+    Workflow step executor that runs `agent` through the shared response cache.
+
+    Like an agent step, the agent receives the previous step's output (or the
+    workflow input for the first step).
+    """
+    runner = cached(agent)
+
+    def run_step(step_input: StepInput) -> StepOutput:
+        prompt = step_input.previous_step_content or step_input.input
+        response = runner.run(prompt)
+        content = response.content
+        if isinstance(content, BaseModel):
+            content = content.model_dump_json(indent=2)
+        return StepOutput(content=content)
+
+    run_step.__name__ = f"cached_{(getattr(agent, 'name', None) or 'agent').lower().replace(' ', '_')}"
+    return run_step
 
 
 def prepare_search_queries(step_input: StepInput) -> StepOutput:
@@ -105,12 +133,9 @@ def aggregate_results(step_input: StepInput) -> StepOutput:
 
 
 def format_report(step_input: StepInput) -> StepOutput:
-    """Format the final report."""
-    current_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
+    """Format the final report; the generation date is added when it is saved so the prompt stays cacheable."""
     return StepOutput(content=dedent(f"""\
         CREATE MARKDOWN REPORT
-        Date: {current_date}
         
         Content: {step_input.previous_step_content}
         
@@ -145,19 +170,21 @@ def save_enhanced_report(step_input: StepInput) -> StepOutput:
     else:
         report_content = new_content
     
-    output_dir = Path(__file__).parent.parent / "outputs"
-    output_dir.mkdir(exist_ok=True)
-    
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"critical_minerals_enhanced_{timestamp}.md"
-    filepath = output_dir / filename
+    sink = get_artifact_sink(str(OUTPUT_DIR))
+    filepath = sink.path(filename)
     
     try:
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(report_content)
+        # Written in the background; the PDF step gets the Markdown from this output
+        sink.write_text(filename, report_content)
         
         return StepOutput(
-            content=f"Report saved: {filename}\nLocation: {filepath}\nFILEPATH:{filepath}",
+            content={
+                "message": f"Report saved: {filename}\nLocation: {filepath}",
+                "filepath": filepath,
+                "markdown": report_content,
+            },
             success=True
         )
     except Exception as e:
@@ -165,38 +192,35 @@ def save_enhanced_report(step_input: StepInput) -> StepOutput:
 
 
 def convert_to_pdf(step_input: StepInput) -> StepOutput:
-    """Convert the saved markdown report to PDF."""
-    from .md_to_pdf_converter import MarkdownToPdfConverter
-    import re
+    """Queue the saved markdown report for background PDF rendering."""
+    from workflow_common.pdf_service import get_pdf_service
     
-    md_filepath = None
+    from .pdf_templates import PDF_TEMPLATE
     
-    # Extract filepath from previous step content
-    if step_input.previous_step_content:
-        match = re.search(r'FILEPATH:(.+?)(?:\n|$)', str(step_input.previous_step_content))
-        if match:
-            md_filepath = match.group(1).strip()
-    
-    if not md_filepath:
-        output_dir = Path(__file__).parent.parent / "outputs"
-        md_files = sorted(output_dir.glob("*.md"), key=lambda f: f.stat().st_mtime, reverse=True)
-        if md_files:
-            md_filepath = str(md_files[0])
+    # Only this run's saved report; never guess from other files in outputs/
+    previous = step_input.previous_step_content
+    md_filepath = previous.get("filepath") if isinstance(previous, dict) else None
+    md_content = previous.get("markdown") if isinstance(previous, dict) else None
     
     if not md_filepath:
-        return StepOutput(content="Error: No markdown file found.", success=False, error="No markdown file found")
+        return StepOutput(content="Error: No saved report to convert.", success=False, error="No saved report to convert")
     
     md_path = Path(md_filepath)
     pdf_filepath = md_path.with_suffix('.pdf')
     
     try:
-        converter = MarkdownToPdfConverter()
-        if converter.convert(str(md_path), str(pdf_filepath)):
-            return StepOutput(
-                content=f"PDF generated: {pdf_filepath.name}\nPDF Location: {pdf_filepath}",
-                success=True
-            )
-        else:
-            return StepOutput(content="PDF conversion failed.", success=False, error="Conversion returned False")
+        if md_content is None:
+            md_content = md_path.read_text(encoding="utf-8")
+        # Rendering runs in a child process; the workflow finishes without waiting
+        job = get_pdf_service().submit(md_content, str(pdf_filepath), PDF_TEMPLATE)
+        return StepOutput(
+            content={
+                "message": f"PDF rendering queued: {pdf_filepath.name}\nPDF Location: {pdf_filepath}",
+                "filepath": str(md_path),
+                "pdf_path": str(pdf_filepath),
+                "pdf_job_id": job.job_id,
+            },
+            success=True
+        )
     except Exception as e:
         return StepOutput(content=f"Error converting to PDF: {e}", success=False, error=str(e))
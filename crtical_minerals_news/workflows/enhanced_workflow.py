@@ -20,6 +20,7 @@ from utils import (
     format_report,
     save_enhanced_report,
     convert_to_pdf,
+    cached_agent_step,
 )
 
 
@@ -29,14 +30,14 @@ enhanced_workflow = Workflow(
     description="Multi-category search across news, Twitter, and LinkedIn with PDF output",
     steps=[
         Step(name="prepare_queries", executor=prepare_search_queries),
-        Step(name="news_search", agent=news_search_agent),
-        Step(name="twitter_search", agent=twitter_search_agent),
-        Step(name="linkedin_search", agent=linkedin_search_agent),
-        Step(name="csis_search", agent=csis_search_agent),
+        Step(name="news_search", executor=cached_agent_step(news_search_agent)),
+        Step(name="twitter_search", executor=cached_agent_step(twitter_search_agent)),
+        Step(name="linkedin_search", executor=cached_agent_step(linkedin_search_agent)),
+        Step(name="csis_search", executor=cached_agent_step(csis_search_agent)),
         Step(name="aggregate_results", executor=aggregate_results),
-        Step(name="aggregation_agent", agent=aggregation_agent),
+        Step(name="aggregation_agent", executor=cached_agent_step(aggregation_agent)),
         Step(name="format_report", executor=format_report),
-        Step(name="formatting_agent", agent=formatting_agent),
+        Step(name="formatting_agent", executor=cached_agent_step(formatting_agent)),
         Step(name="save_report", executor=save_enhanced_report),
         Step(name="convert_pdf", executor=convert_to_pdf),
     ],
@@ -0,0 +1,54 @@
+"""Shared pytest setup: make the workflow packages importable from the repository root."""
+import os
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+
+@pytest.fixture
+def make_opportunity():
+    """Factory for Opportunity records with every required field filled in."""
+    from Opportunity_Discovery_Workflow.Models.data_models import Opportunity
+
+    def factory(**fields):
+        values = {
+            "title": "Grid-scale storage research",
+            "description": "Funding for long-duration energy storage pilots.",
+            "source": "Grants.gov",
+            "agency": "Department of Energy",
+            "sector": "Energy",
+            "published_date": "2025-03-10",
+            "openDate": "2025-03-10",
+            "closeDate": "2025-06-30",
+            "url": None,
+            "opportunity_number": None,
+        }
+        values.update(fields)
+        return Opportunity(**values)
+
+    return factory
+
+
+@pytest.fixture
+def make_scored(make_opportunity):
+    """Factory for ScoredOpportunity records built on `make_opportunity`."""
+    from Opportunity_Discovery_Workflow.Models.data_models import ScoredOpportunity
+
+    def factory(score=7.0, score_method="llm", **fields):
+        opp = make_opportunity(**fields)
+        return ScoredOpportunity(
+            **opp.model_dump(),
+            feasibility_score=score,
+            impact_score=score,
+            alignment_score=score,
+            total_score=score,
+            justification="Strong fit.",
+            score_method=score_method,
+        )
+
+    return factory
@@ -0,0 +1,66 @@
+"""Warm agent pool: reuse, rebuilds and static handle attributes (user-019)."""
+from types import SimpleNamespace
+
+from Opportunity_Discovery_Workflow.Agents.registry import AgentRegistry
+
+
+class _FakeAgent:
+    built = 0
+
+    def __init__(self, model_id="model-a", http_client=None):
+        _FakeAgent.built += 1
+        self.name = "Fake_Agent"
+        self.model = SimpleNamespace(id=model_id, temperature=0, seed=42)
+        self.instructions = "Be precise."
+
+    def run(self, prompt, **kwargs):
+        return SimpleNamespace(content=f"{self.model.id}:{prompt}")
+
+
+def _registry(fingerprint=lambda: None):
+    _FakeAgent.built = 0
+    registry = AgentRegistry()
+    registry.register("fake", _FakeAgent, fingerprint)
+    return registry
+
+
+def test_handles_reuse_one_instance():
+    registry = _registry()
+    for prompt in ("a", "b", "c"):
+        assert registry.get("fake").run(prompt).content == f"model-a:{prompt}"
+    assert _FakeAgent.built == 1
+    assert registry.stats()["builds"] == 1
+
+
+def test_attribute_reads_do_not_touch_the_pool():
+    registry = _registry()
+    handle = registry.get("fake")
+    before = registry.stats()
+
+    for _ in range(5):
+        assert handle.name == "Fake_Agent"
+        assert handle.model.id == "model-a"
+        assert handle.instructions == "Be precise."
+
+    assert registry.stats() == before
+
+
+def test_model_override_gets_its_own_pool():
+    registry = _registry()
+    handle = registry.get("fake", model_id="model-b")
+    assert handle.model.id == "model-b"
+    assert handle.run("x").content == "model-b:x"
+    assert registry.get("fake").model.id == "model-a"
+    assert _FakeAgent.built == 2
+
+
+def test_fingerprint_change_rebuilds_pool():
+    version = {"value": 1}
+    registry = _registry(lambda: version["value"])
+    registry.get("fake").run("a")
+
+    version["value"] = 2
+    registry.get("fake").run("b")
+
+    assert _FakeAgent.built == 2
+    assert registry.stats()["rebuilds"] == 1
@@ -0,0 +1,91 @@
+"""Deterministic dedup and merge provenance (user-008)."""
+import json
+from types import SimpleNamespace
+
+from Opportunity_Discovery_Workflow.Database.db_manager import DBManager
+from Opportunity_Discovery_Workflow.Models.data_models import Opportunity, OpportunityList, ScoredOpportunity
+from Opportunity_Discovery_Workflow.Workflows.aggregation import aggregate_opportunities
+from Opportunity_Discovery_Workflow.utils.dedup import canonical_url, deduplicate, normalize_number
+
+
+def _records(make_opportunity):
+    return [
+        make_opportunity(
+            title="Grid Storage Pilots", source="Grants.gov", opportunity_number="DE-FOA-0003001",
+            url="https://www.grants.gov/search-results-detail/1", description="Short.",
+        ),
+        make_opportunity(
+            title="Grid storage pilots", source="Simpler.Grants.gov", opportunity_number="de foa 0003001",
+            url="https://simpler.grants.gov/opportunity/1", description="A much longer description of the pilots.",
+        ),
+        make_opportunity(
+            title="Battery Recycling", source="SAM.gov", opportunity_number="W911-25-R-0001",
+            url="https://sam.gov/opp/9",
+        ),
+    ]
+
+
+def test_key_normalization():
+    assert normalize_number("DE-FOA-0003001") == normalize_number("de foa 0003001")
+    assert canonical_url("http://www.sam.gov/opp/9/?utm_source=x#top") == "https://sam.gov/opp/9"
+
+
+def test_merged_record_keeps_every_source(make_opportunity):
+    result = deduplicate(_records(make_opportunity))
+
+    assert result.duplicates_removed == 1
+    merged, single = result.opportunities
+    assert merged.source == "Grants.gov"
+    assert merged.description == "A much longer description of the pilots."
+    assert [(s.source, s.opportunity_number) for s in merged.sources] == [
+        ("Grants.gov", "DE-FOA-0003001"),
+        ("Simpler.Grants.gov", "de foa 0003001"),
+    ]
+    assert result.merged[0].matched_on == {"opportunity_number"}
+    assert result.merged[0].provenance == merged.sources
+    assert [s.url for s in single.sources] == ["https://sam.gov/opp/9"]
+
+
+def test_sources_are_not_sent_to_agents(make_opportunity):
+    from Opportunity_Discovery_Workflow.Workflows.scoring import _payload
+
+    merged = deduplicate(_records(make_opportunity)).opportunities[0]
+    assert "sources" not in _payload([merged])
+    assert "sources" not in OpportunityList.model_json_schema()["$defs"]["Opportunity"]["properties"]
+
+
+def test_sources_are_persisted(tmp_path, make_opportunity):
+    merged = deduplicate(_records(make_opportunity)).opportunities[0]
+    scored = ScoredOpportunity(
+        **merged.model_dump(), feasibility_score=8, impact_score=8, alignment_score=8,
+        total_score=8, justification="Fit.",
+    )
+    db = DBManager(str(tmp_path / "opportunities.db"))
+    db.save_scored_opportunities([scored])
+
+    _, stored = db.get_scored_by_urls([merged.url])[merged.url]
+    assert stored.sources == merged.sources
+
+
+class _MergingAgent:
+    """Merges every ambiguous group into its first record, dropping the sources field like an LLM would."""
+
+    def run(self, prompt, response_model=None):
+        groups = json.loads(prompt.split("\n", 1)[1].rsplit("\n\n", 1)[0])
+        merged = [Opportunity(**group[0]) for group in groups]
+        return SimpleNamespace(content=OpportunityList(opportunities=merged))
+
+
+def test_agent_merges_keep_sources(make_opportunity):
+    records = [
+        make_opportunity(title="Storage pilots for rural grids", agency="DOE", source="Grants.gov",
+                         opportunity_number="A-1", url="https://grants.gov/a"),
+        make_opportunity(title="Rural grids storage pilots", agency="Energy Dept", source="SAM.gov",
+                         opportunity_number="B-2", url="https://sam.gov/b"),
+    ]
+
+    result = aggregate_opportunities(records, agent_factory=_MergingAgent)
+
+    assert result.llm_input_count == 2
+    (merged,) = result.opportunities
+    assert [s.source for s in merged.sources] == ["Grants.gov", "SAM.gov"]
@@ -0,0 +1,81 @@
+"""Cross-run content skip and re-filtering of unchanged records (user-010, user-020)."""
+import pytest
+
+from Opportunity_Discovery_Workflow.Database.db_manager import DBManager
+from Opportunity_Discovery_Workflow.Workflows.filtering import filter_unchanged
+from Opportunity_Discovery_Workflow.Workflows.incremental import split_by_content
+from Opportunity_Discovery_Workflow.utils.keyword_index import NEGATIVE_DOMAIN
+from Opportunity_Discovery_Workflow.utils.keyword_matcher import KeywordMatcher
+
+KEYWORDS = {
+    "Energy": ["energy storage", "battery"],
+    "AI/ML": ["machine learning", "neural network"],
+    NEGATIVE_DOMAIN: ["construction services"],
+}
+
+
+@pytest.fixture
+def db(tmp_path):
+    return DBManager(str(tmp_path / "opportunities.db"))
+
+
+def test_split_by_content(db, make_opportunity, make_scored):
+    stored = make_scored(url="https://example.gov/same", title="Battery pilots")
+    edited = make_scored(url="https://example.gov/edited", title="Battery research")
+    db.save_scored_opportunities([stored, edited])
+
+    split = split_by_content([
+        make_opportunity(url="https://example.gov/same", title="Battery pilots"),
+        make_opportunity(url="https://example.gov/edited", title="Battery research", description="New scope."),
+        make_opportunity(url="https://example.gov/new", title="Battery materials"),
+    ], db)
+
+    assert [opp.url for opp in split.unchanged] == ["https://example.gov/same"]
+    assert split.unchanged[0].total_score == 7.0
+    assert [opp.url for opp in split.changed] == ["https://example.gov/edited"]
+    assert [opp.url for opp in split.new] == ["https://example.gov/new"]
+    assert set(split.hashes) == {"https://example.gov/same", "https://example.gov/edited", "https://example.gov/new"}
+
+
+def test_heuristic_rows_are_not_reused(db, make_opportunity, make_scored):
+    db.save_scored_opportunities([
+        make_scored(url="https://example.gov/llm", title="Battery pilots"),
+        make_scored(url="https://example.gov/heuristic", title="Battery recycling", score=2.0, score_method="heuristic"),
+    ])
+
+    stored = db.get_scored_by_urls(["https://example.gov/llm", "https://example.gov/heuristic"])
+    assert set(stored) == {"https://example.gov/llm"}
+
+    split = split_by_content([
+        make_opportunity(url="https://example.gov/heuristic", title="Battery recycling"),
+    ], db)
+    assert split.unchanged == []
+    assert [opp.url for opp in split.new] == ["https://example.gov/heuristic"]
+
+
+def test_filter_unchanged_applies_domains_and_negative_keywords(make_scored):
+    matcher = KeywordMatcher.from_keywords(KEYWORDS, domains=["Energy"])
+    records = [
+        make_scored(url="https://example.gov/1", description="", title="Battery pilots", sector="Other"),
+        make_scored(url="https://example.gov/2", description="", title="Machine learning for grids", sector="AI/ML"),
+        make_scored(url="https://example.gov/3", description="", title="Battery plant construction services", sector="Energy"),
+        make_scored(url="https://example.gov/4", description="", title="Office furniture", sector="Energy"),
+    ]
+
+    kept = filter_unchanged(records, matcher=matcher)
+
+    assert [opp.url for opp in kept] == ["https://example.gov/1"]
+    assert kept[0].sector == "Energy"
+    assert kept[0].total_score == 7.0
+
+
+def test_filter_unchanged_keeps_borderline_in_requested_domain(make_scored):
+    matcher = KeywordMatcher.from_keywords(KEYWORDS)
+    tied = "Battery research with machine learning"
+    kept = filter_unchanged([
+        make_scored(url="https://example.gov/1", description="", title=tied, sector="AI/ML"),
+        make_scored(url="https://example.gov/2", description="", title=tied, sector="Transportation"),
+    ], matcher=matcher)
+
+    assert [opp.url for opp in kept] == ["https://example.gov/1"]
+    assert kept[0].sector == "AI/ML"
@@ -0,0 +1,140 @@
+"""MinHash/LSH near-duplicate detection, within a run and against stored records (user-009)."""
+import sqlite3
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from Opportunity_Discovery_Workflow.Database.db_manager import DBManager
+from Opportunity_Discovery_Workflow.Models.data_models import OpportunityList
+from Opportunity_Discovery_Workflow.Workflows.aggregation import aggregate_opportunities
+from Opportunity_Discovery_Workflow.Workflows.incremental import split_by_content
+from Opportunity_Discovery_Workflow.utils.dedup import NEAR_DUPLICATE_THRESHOLD, near_duplicate_threshold
+from Opportunity_Discovery_Workflow.utils.near_duplicates import (
+    LSHIndex,
+    MinHasher,
+    jaccard_estimate,
+    near_duplicate_pairs,
+    shingle_hashes,
+)
+
+BASE = (
+    "The Department of Energy invites applications for long-duration energy storage "
+    "demonstrations at rural electric cooperatives, including flow batteries and thermal storage."
+)
+AMENDED = BASE.replace("invites applications", "is accepting applications") + " Amendment 1 extends the deadline."
+UNRELATED = "Wildlife habitat restoration grants for coastal wetlands and estuaries in the Gulf region."
+
+
+def _jaccard(a, b):
+    x, y = set(shingle_hashes(a).tolist()), set(shingle_hashes(b).tolist())
+    return len(x & y) / len(x | y)
+
+
+def test_minhash_estimates_jaccard():
+    hasher = MinHasher(num_perm=256)
+    a, b = hasher.signatures([BASE, AMENDED])
+    assert jaccard_estimate(a, b) == pytest.approx(_jaccard(BASE, AMENDED), abs=0.1)
+    assert jaccard_estimate(a, hasher.signature(UNRELATED)) < 0.2
+
+
+def test_lsh_index_returns_only_similar_records():
+    index = LSHIndex(threshold=0.6)
+    index.add("base", BASE)
+    index.add("other", UNRELATED)
+
+    matches = index.query(AMENDED)
+    assert [key for key, _ in matches] == ["base"]
+    assert index.query("Quantum sensing testbeds for navigation") == []
+
+
+def test_near_duplicate_pairs():
+    pairs = near_duplicate_pairs([BASE, UNRELATED, AMENDED], threshold=0.6)
+    assert [(i, j) for i, j, _ in pairs] == [(0, 2)]
+
+
+@pytest.mark.parametrize("value, expected", [
+    (None, NEAR_DUPLICATE_THRESHOLD),
+    ("0.65", 0.65),
+    ("off", None),
+])
+def test_threshold_from_environment(monkeypatch, value, expected):
+    if value is None:
+        monkeypatch.delenv("NEAR_DUPLICATE_THRESHOLD", raising=False)
+    else:
+        monkeypatch.setenv("NEAR_DUPLICATE_THRESHOLD", value)
+    assert near_duplicate_threshold() == expected
+
+
+def test_threshold_out_of_range(monkeypatch):
+    monkeypatch.setenv("NEAR_DUPLICATE_THRESHOLD", "1.5")
+    with pytest.raises(ValueError):
+        near_duplicate_threshold()
+
+
+def test_aggregation_uses_given_threshold(make_opportunity):
+    records = [
+        make_opportunity(title="Rural storage demonstrations", description=BASE, opportunity_number="A-1",
+                         url="https://grants.gov/a"),
+        make_opportunity(title="Rural storage demonstrations amendment", description=AMENDED, opportunity_number="B-2",
+                         url="https://sam.gov/b", source="SAM.gov"),
+    ]
+
+    def no_agent():
+        raise AssertionError("agent should not be called")
+
+    off = aggregate_opportunities(records, agent_factory=no_agent, near_duplicate_threshold=None)
+    assert off.dedup.ambiguous_groups == []
+
+    class KeepSeparate:
+        def run(self, prompt, response_model=None):
+            return SimpleNamespace(content=OpportunityList(opportunities=records))
+
+    on = aggregate_opportunities(records, agent_factory=KeepSeparate, near_duplicate_threshold=0.6)
+    assert len(on.dedup.ambiguous_groups) == 1
+    assert on.llm_input_count == 2 and not on.llm_errors
+
+
+def test_split_matches_reposted_records_against_database(tmp_path, make_opportunity, make_scored):
+    db = DBManager(str(tmp_path / "opportunities.db"))
+    db.save_scored_opportunities([
+        make_scored(title="Rural storage demonstrations", description=BASE, url="https://grants.gov/old",
+                    opportunity_number="DE-FOA-1"),
+        make_scored(title="Coastal wetlands", description=UNRELATED, url="https://grants.gov/wetlands"),
+    ])
+    reposted = make_opportunity(title="Rural storage demonstrations", description=AMENDED,
+                                url="https://grants.gov/new", opportunity_number="DE-FOA-1-A1")
+    fresh = make_opportunity(title="Quantum sensing", description="Navigation testbeds.", url="https://grants.gov/q")
+
+    split = split_by_content([reposted, fresh], db, near_duplicate_threshold=0.6)
+
+    assert [opp.url for opp in split.new] == ["https://grants.gov/q"]
+    assert [opp.url for opp in split.changed] == ["https://grants.gov/new"]
+    assert split.reposted == {"https://grants.gov/new": "https://grants.gov/old"}
+    assert {s.url for s in split.changed[0].sources} == {"https://grants.gov/new", "https://grants.gov/old"}
+
+    disabled = split_by_content([reposted, fresh], db, near_duplicate_threshold=None)
+    assert len(disabled.new) == 2 and disabled.reposted == {}
+
+
+def test_signatures_are_stored_once_and_backfilled(tmp_path, make_scored, monkeypatch):
+    db = DBManager(str(tmp_path / "opportunities.db"))
+    db.save_scored_opportunities([make_scored(title="Rural storage", description=BASE, url="https://grants.gov/a")])
+    with sqlite3.connect(db.db_path) as conn:
+        conn.execute(
+            "INSERT INTO opportunities (title, description, url, total_score) VALUES (?, ?, ?, ?)",
+            ("Coastal wetlands", UNRELATED, "https://grants.gov/legacy", 5.0),
+        )
+
+    hashed = []
+    original = MinHasher.signatures
+    monkeypatch.setattr(MinHasher, "signatures", lambda self, texts: hashed.append(list(texts)) or original(self, texts))
+
+    urls, signatures = db.get_stored_signatures()
+    assert urls == ["https://grants.gov/a", "https://grants.gov/legacy"]
+    assert hashed == [[f"Coastal wetlands {UNRELATED}"]]
+    assert np.array_equal(signatures[0], MinHasher().signature(f"Rural storage {BASE}"))
+
+    hashed.clear()
+    _, again = db.get_stored_signatures()
+    assert hashed == [] and np.array_equal(again, signatures)
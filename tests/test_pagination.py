@@ -0,0 +1,99 @@
+"""Concurrent pagination and SAM.gov paging through totalRecords (user-004)."""
+import threading
+
+from Opportunity_Discovery_Workflow.tools.pagination import fetch_all_pages
+from Opportunity_Discovery_Workflow.tools.sam_gov_tool import SamGovTools
+from Opportunity_Discovery_Workflow.tools.source_adapters import SamGovAdapter
+
+
+def _pages(total, page_size, first_page=0, report_total=True):
+    requested = []
+    lock = threading.Lock()
+
+    def fetch_page(page):
+        with lock:
+            requested.append(page)
+        start = (page - first_page) * page_size
+        items = list(range(start, min(start + page_size, total)))
+        return items, total if report_total else None
+
+    return fetch_page, requested
+
+
+def test_fetch_all_pages_returns_items_in_page_order():
+    fetch_page, requested = _pages(total=95, page_size=10)
+    items, total = fetch_all_pages(fetch_page, first_page=0, page_size=10, limit=1000)
+    assert items == list(range(95))
+    assert total == 95
+    assert sorted(requested) == list(range(10))
+
+
+def test_fetch_all_pages_respects_limit():
+    fetch_page, requested = _pages(total=95, page_size=10)
+    items, _ = fetch_all_pages(fetch_page, first_page=0, page_size=10, limit=25)
+    assert items == list(range(25))
+    assert max(requested) == 2
+
+
+def test_fetch_all_pages_without_limit_follows_total():
+    fetch_page, requested = _pages(total=95, page_size=10, first_page=1)
+    items, _ = fetch_all_pages(fetch_page, first_page=1, page_size=10, limit=None)
+    assert items == list(range(95))
+    assert sorted(requested) == list(range(1, 11))
+
+
+def test_fetch_all_pages_unknown_total_stops_at_short_page():
+    fetch_page, _ = _pages(total=42, page_size=10, report_total=False)
+    items, total = fetch_all_pages(fetch_page, first_page=0, page_size=10, limit=None, max_in_flight=2)
+    assert items == list(range(42))
+    assert total is None
+
+
+def test_fetch_all_pages_stop_at_ends_scan():
+    fetch_page, _ = _pages(total=95, page_size=10)
+    items, _ = fetch_all_pages(fetch_page, first_page=0, page_size=10, limit=None, stop_at=lambda item: item >= 33)
+    assert items == list(range(33))
+
+
+class _Response:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+class _SamHttp:
+    def __init__(self, total):
+        self.total = total
+        self.offsets = []
+        self.lock = threading.Lock()
+
+    def get(self, url, params=None, headers=None):
+        offset, size = params["offset"], params["limit"]
+        with self.lock:
+            self.offsets.append(offset)
+        records = [{"title": f"Notice {i}", "postedDate": "2025-01-01"} for i in range(offset, min(offset + size, self.total))]
+        return _Response({"totalRecords": self.total, "opportunitiesData": records})
+
+
+def test_sam_gov_pages_past_first_thousand_records():
+    http = _SamHttp(total=2500)
+    tools = SamGovTools(api_key="test", http_client=http)
+
+    records = tools.search_opportunities(days_back=7)
+
+    assert len(records) == 2500
+    assert sorted(http.offsets) == [0, 1000, 2000]
+
+
+def test_sam_gov_adapter_fetches_every_page_by_default():
+    http = _SamHttp(total=1500)
+    adapter = SamGovAdapter(SamGovTools(api_key="test", http_client=http))
+
+    assert adapter.limit is None
+    assert len(adapter.search(days_back=7)) == 1500
+    assert sorted(http.offsets) == [0, 1000]
@@ -0,0 +1,58 @@
+"""PDF render cache: normalized keys, template and backend separation, fetch/store."""
+import os
+
+import pytest
+
+from workflow_common.pdf_cache import PdfRenderCache, normalize_markdown
+
+TEMPLATE = "<html><body>{html_content}</body></html>"
+REPORT = "# Report\n**Generated on:** 2026-01-05 10:00 UTC\n\nThree opportunities found.  \n"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return PdfRenderCache(directory=str(tmp_path / "pdf"), enabled=True)
+
+
+def _pdf(tmp_path, name="rendered.pdf", payload=b"%PDF-1.4 test"):
+    path = tmp_path / name
+    path.write_bytes(payload)
+    return str(path)
+
+
+def test_normalize_drops_generation_dates_and_trailing_whitespace():
+    text = "# Report\r\n**Date Generated:** 2026-01-05\r\nBody   \r\n"
+    assert normalize_markdown(text) == "# Report\n\nBody\n"
+
+
+def test_date_only_change_keeps_the_key(cache):
+    later = REPORT.replace("2026-01-05 10:00", "2026-02-17 08:30")
+    assert cache.make_key(REPORT, TEMPLATE, "xhtml2pdf") == cache.make_key(later, TEMPLATE, "xhtml2pdf")
+    assert cache.make_key(REPORT, TEMPLATE, "xhtml2pdf") != cache.make_key(REPORT + "One more.\n", TEMPLATE, "xhtml2pdf")
+
+
+def test_template_and_backend_are_part_of_the_key(cache):
+    key = cache.make_key(REPORT, TEMPLATE, "xhtml2pdf")
+    assert key != cache.make_key(REPORT, TEMPLATE + "<!-- v2 -->", "xhtml2pdf")
+    assert key != cache.make_key(REPORT, TEMPLATE, "weasyprint")
+
+
+def test_fetch_after_store_places_the_pdf(cache, tmp_path):
+    cache.store_rendering(REPORT, _pdf(tmp_path), TEMPLATE, "xhtml2pdf")
+    target = str(tmp_path / "out" / "again.pdf")
+
+    later = REPORT.replace("2026-01-05 10:00", "2026-02-17 08:30")
+    assert cache.fetch(later, target, TEMPLATE, "xhtml2pdf")
+    with open(target, "rb") as f:
+        assert f.read() == b"%PDF-1.4 test"
+
+    assert not cache.fetch(REPORT, str(tmp_path / "other.pdf"), TEMPLATE, "weasyprint")
+    assert not cache.fetch(REPORT, str(tmp_path / "other.pdf"), TEMPLATE + " ", "xhtml2pdf")
+
+
+def test_disabled_cache_never_hits(tmp_path):
+    cache = PdfRenderCache(directory=str(tmp_path / "pdf"), enabled=False)
+    cache.store_rendering(REPORT, _pdf(tmp_path), TEMPLATE, "xhtml2pdf")
+    target = str(tmp_path / "again.pdf")
+    assert not cache.fetch(REPORT, target, TEMPLATE, "xhtml2pdf")
+    assert not os.path.exists(target)
@@ -0,0 +1,67 @@
+"""Background PDF service: cached renderings complete without a child process."""
+from workflow_common import pdf_service
+from workflow_common.pdf_cache import PdfRenderCache
+
+TEMPLATE = "<html><body>{html_content}</body></html>"
+
+
+def test_cached_job_completes_with_its_template(tmp_path, monkeypatch):
+    cache = PdfRenderCache(directory=str(tmp_path / "pdf"), enabled=True)
+    rendered = tmp_path / "rendered.pdf"
+    rendered.write_bytes(b"%PDF-1.4 test")
+    cache.store_rendering("# Report\n", str(rendered), TEMPLATE)
+    monkeypatch.setattr(pdf_service, "get_pdf_cache", lambda: cache)
+
+    def fail_render(job):
+        raise AssertionError("a cached job must not start a renderer")
+
+    service = pdf_service.PdfRenderService(max_workers=1, timeout=5)
+    monkeypatch.setattr(service, "_render_in_process", fail_render)
+    finished = []
+    job = service.submit("# Report\n", str(tmp_path / "out.pdf"), TEMPLATE, on_done=finished.append)
+
+    assert job.wait(5)
+    assert job.status == pdf_service.COMPLETED
+    assert job.cached and finished == [job]
+    assert job.markdown is None and job.template is None
+    assert (tmp_path / "out.pdf").read_bytes() == b"%PDF-1.4 test"
+
+
+def test_other_template_misses_the_cache(tmp_path, monkeypatch):
+    cache = PdfRenderCache(directory=str(tmp_path / "pdf"), enabled=True)
+    rendered = tmp_path / "rendered.pdf"
+    rendered.write_bytes(b"%PDF-1.4 test")
+    cache.store_rendering("# Report\n", str(rendered), TEMPLATE)
+    monkeypatch.setattr(pdf_service, "get_pdf_cache", lambda: cache)
+
+    service = pdf_service.PdfRenderService(max_workers=1, timeout=5)
+    monkeypatch.setattr(service, "_render_in_process", lambda job: (pdf_service.FAILED, f"rendered {job.template}"))
+    job = service.submit("# Report\n", str(tmp_path / "out.pdf"), "<p>{html_content}</p>")
+
+    assert job.wait(5)
+    assert job.status == pdf_service.FAILED
+    assert not job.cached
+    assert job.error == "rendered <p>{html_content}</p>"
+
+
+def test_rendered_job_is_stored_for_the_next_one(tmp_path, monkeypatch):
+    cache = PdfRenderCache(directory=str(tmp_path / "pdf"), enabled=True)
+    monkeypatch.setattr(pdf_service, "get_pdf_cache", lambda: cache)
+
+    renders = []
+
+    def render(job):
+        renders.append(job.pdf_path)
+        with open(job.pdf_path, "wb") as f:
+            f.write(b"%PDF-1.4 test")
+        return pdf_service.COMPLETED, None
+
+    service = pdf_service.PdfRenderService(max_workers=1, timeout=5)
+    monkeypatch.setattr(service, "_render_in_process", render)
+    first = service.submit("# Report\n", str(tmp_path / "first.pdf"), TEMPLATE)
+    assert first.wait(5) and not first.cached
+    second = service.submit("# Report\n", str(tmp_path / "second.pdf"), TEMPLATE)
+    assert second.wait(5) and second.cached
+
+    assert renders == [str(tmp_path / "first.pdf")]
+    assert service.stats()["cached"] == 1
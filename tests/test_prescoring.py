@@ -0,0 +1,81 @@
+"""Heuristic pre-scoring triage and how scoring treats heuristic records."""
+import json
+from datetime import date
+from types import SimpleNamespace
+
+import numpy as np
+
+from Opportunity_Discovery_Workflow.Database.score_cache import ScoreCache
+from Opportunity_Discovery_Workflow.Models.data_models import ScoredOpportunityList
+from Opportunity_Discovery_Workflow.Workflows import scoring
+from Opportunity_Discovery_Workflow.utils.dedup import content_hash
+from Opportunity_Discovery_Workflow.utils.prescoring import MIN_DAYS_TO_PREPARE, prescore
+from Opportunity_Discovery_Workflow.utils.relevance import RelevanceMatrix
+
+TODAY = date(2025, 4, 1)
+DOMAINS = ["Artificial Intelligence & Machine Learning"]
+
+
+def _relevance(*bm25):
+    return RelevanceMatrix(DOMAINS, np.array([[score] for score in bm25], dtype=float))
+
+
+def _batch(make_opportunity):
+    return [
+        make_opportunity(title="Strong", url="https://example.gov/strong", closeDate="2025-07-01", description="x" * 1500),
+        make_opportunity(title="Medium", url="https://example.gov/medium", closeDate="2025-06-01"),
+        make_opportunity(title="Weak", url="https://example.gov/weak", agency=None, source="Blog", closeDate=None, description=""),
+        make_opportunity(title="Closing", url="https://example.gov/closing", closeDate="2025-04-03", description="x" * 1500),
+    ]
+
+
+def test_threshold_top_n_and_expired(make_opportunity):
+    opportunities = _batch(make_opportunity)
+    result = prescore(opportunities, _relevance(20, 8, 0, 20), top_n=1, threshold=4.0, today=TODAY)
+
+    assert [opp.title for opp in result.to_score] == ["Strong"]
+    assert {opp.title for opp in result.heuristic} == {"Medium", "Weak", "Closing"}
+    assert result.expired == 1
+    assert all(opp.score_method == "heuristic" for opp in result.heuristic)
+    # Capped at the threshold so a heuristic record never outranks one the agent cleared
+    assert max(opp.total_score for opp in result.heuristic) <= 4.0
+
+
+def test_no_limits_sends_everything_but_expired(make_opportunity):
+    opportunities = _batch(make_opportunity)
+    result = prescore(opportunities, _relevance(20, 8, 0, 20), top_n=None, threshold=None, today=TODAY)
+
+    assert [opp.title for opp in result.to_score] == ["Strong", "Medium", "Weak"]
+    assert [opp.title for opp in result.heuristic] == ["Closing"]
+    assert f"within {MIN_DAYS_TO_PREPARE} days" in result.summary
+
+
+class ScoringAgent:
+    def __init__(self, seen):
+        self.seen = seen
+
+    def run(self, prompt, response_model=None):
+        records = json.loads(prompt.split("\n")[1])
+        self.seen.extend(record["title"] for record in records)
+        scores = {"feasibility_score": 9.0, "impact_score": 9.0, "alignment_score": 9.0,
+                  "total_score": 9.0, "justification": "Fit."}
+        return SimpleNamespace(content=ScoredOpportunityList(opportunities=[dict(record, **scores) for record in records]))
+
+
+def test_heuristic_records_are_ranked_but_not_cached(tmp_path, make_opportunity, monkeypatch):
+    # score_opportunities pre-scores against the real date
+    opportunities = [opp.model_copy(update={"closeDate": "2099-01-01"}) for opp in _batch(make_opportunity)[:3]]
+    monkeypatch.setattr(scoring, "_relevance", lambda opps: _relevance(20, 8, 0))
+    cache = ScoreCache(str(tmp_path / "scores.db"))
+
+    seen = []
+    result = scoring.score_opportunities(
+        opportunities, lambda: ScoringAgent(seen), cache=cache, model_id="model-1", top_n=1, threshold=None,
+    )
+
+    assert seen == ["Strong"]
+    assert result.heuristic == 2
+    assert [opp.title for opp in result.scored][0] == "Strong"
+    assert [opp.score_method for opp in result.scored] == ["llm", "heuristic", "heuristic"]
+    cached = cache.get_many([content_hash(opp) for opp in opportunities], scoring.SCORING_VERSION, "model-1")
+    assert list(cached) == [content_hash(opportunities[0])]
@@ -0,0 +1,97 @@
+"""Persistent LLM score cache and its use by the scoring phase."""
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from Opportunity_Discovery_Workflow.Database import score_cache
+from Opportunity_Discovery_Workflow.Database.score_cache import ScoreCache
+from Opportunity_Discovery_Workflow.Models.data_models import ScoredOpportunityList
+from Opportunity_Discovery_Workflow.Workflows.scoring import score_opportunities
+
+SCORES = {"feasibility_score": 8.0, "impact_score": 7.0, "alignment_score": 9.0, "total_score": 8.0, "justification": "Fit."}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ScoreCache(str(tmp_path / "scores.db"))
+
+
+class ScoringAgent:
+    """Scores every record in the prompt 6.0 and counts the records it saw."""
+
+    def __init__(self, seen):
+        self.seen = seen
+
+    def run(self, prompt, response_model=None):
+        records = json.loads(prompt.split("\n")[1])
+        self.seen.extend(record["url"] for record in records)
+        scored = [dict(record, **dict(SCORES, total_score=6.0)) for record in records]
+        return SimpleNamespace(content=ScoredOpportunityList(opportunities=scored))
+
+
+def test_get_many_returns_only_matching_keys(cache):
+    cache.put_many([("hash-a", SCORES), ("hash-b", dict(SCORES, total_score=5.0))], "v1", "model-1")
+
+    found = cache.get_many(["hash-a", "hash-b", "hash-c"], "v1", "model-1")
+    assert set(found) == {"hash-a", "hash-b"}
+    assert found["hash-b"]["total_score"] == 5.0
+    assert cache.get_many(["hash-a"], "v2", "model-1") == {}
+    assert cache.get_many(["hash-a"], "v1", "model-2") == {}
+    assert cache.stats()["hits"] == 2
+
+
+def test_expired_and_evicted_entries_miss(tmp_path):
+    cache = ScoreCache(str(tmp_path / "scores.db"), max_entries=2, max_age_days=0)
+    cache.put_many([("hash-a", SCORES)], "v1", "model-1")
+    assert cache.get_many(["hash-a"], "v1", "model-1") == {}
+
+    cache = ScoreCache(str(tmp_path / "lru.db"), max_entries=2)
+    cache.put_many([("hash-a", SCORES), ("hash-b", SCORES)], "v1", "model-1")
+    cache.put_many([("hash-c", SCORES)], "v1", "model-1")
+    assert cache.stats()["entries"] == 2
+
+
+def test_invalidate_filters(cache):
+    cache.put_many([("hash-a", SCORES)], "old", "model-1")
+    cache.put_many([("hash-a", SCORES)], "new", "model-1")
+    cache.put_many([("hash-a", SCORES)], "new", "model-2")
+
+    assert cache.invalidate(keep_instructions="new") == 1
+    assert cache.invalidate(instructions="new", model_id="model-2") == 1
+    assert cache.get_many(["hash-a"], "new", "model-1")
+    assert cache.invalidate() == 1
+
+
+def test_scoring_reuses_cached_scores(cache, make_opportunity):
+    opportunities = [make_opportunity(url=f"https://example.gov/{i}", title=f"Battery pilots {i}") for i in range(3)]
+
+    seen = []
+    first = score_opportunities(opportunities, lambda: ScoringAgent(seen), cache=cache, model_id="model-1", triage=False)
+    assert first.cache_hits == 0 and len(first.scored) == 3
+    assert len(seen) == 3
+
+    edited = opportunities[:2] + [opportunities[2].model_copy(update={"description": "Revised scope."})]
+    seen.clear()
+    second = score_opportunities(edited, lambda: ScoringAgent(seen), cache=cache, model_id="model-1", triage=False)
+    assert second.cache_hits == 2
+    assert seen == ["https://example.gov/2"]
+    assert [opp.total_score for opp in second.scored] == [6.0, 6.0, 6.0]
+
+    seen.clear()
+    score_opportunities(edited, lambda: ScoringAgent(seen), cache=cache, model_id="model-2", triage=False)
+    assert len(seen) == 3
+    assert cache.stats()["entries"] == 7
+
+
+def test_process_wide_cache_keeps_hit_counters(tmp_path, monkeypatch):
+    monkeypatch.setattr(score_cache, "_cache", None)
+    monkeypatch.setattr(score_cache, "ScoreCache", lambda: ScoreCache(str(tmp_path / "shared.db")))
+
+    writer = score_cache.get_score_cache()
+    writer.put_many([("hash-a", SCORES)], "v1", "model-1")
+    score_cache.get_score_cache().get_many(["hash-a", "hash-b"], "v1", "model-1")
+
+    stats = score_cache.get_score_cache().stats()
+    assert score_cache.get_score_cache() is writer
+    assert (stats["hits"], stats["misses"], stats["hit_ratio"]) == (1, 1, 0.5)
@@ -0,0 +1,165 @@
+"""Incremental fetch watermarks: scoping and when they may advance (user-005)."""
+import sqlite3
+
+import pytest
+
+from Opportunity_Discovery_Workflow.Database.watermark_store import WatermarkStore, watermark_scope
+from Opportunity_Discovery_Workflow.Workflows import discovery_workflow
+from Opportunity_Discovery_Workflow.Workflows.fetch_engine import FetchEngine
+from Opportunity_Discovery_Workflow.Workflows.incremental import ContentSplit
+
+
+@pytest.fixture
+def store(tmp_path):
+    return WatermarkStore(str(tmp_path / "watermarks.db"))
+
+
+@pytest.fixture
+def dated_opportunity(make_opportunity):
+    def factory(number, published):
+        return make_opportunity(
+            title=f"Opportunity {number}",
+            published_date=published,
+            url=f"https://example.gov/{number}",
+            opportunity_number=number,
+        )
+
+    return factory
+
+
+def test_scope_normalizes_domains():
+    assert watermark_scope(7) == "days=7"
+    assert watermark_scope(7, [" Energy", "ai", "energy"]) == watermark_scope(7, ["AI", "energy"])
+    assert watermark_scope(7, ["energy"]) != watermark_scope(30, ["energy"])
+
+
+def test_restricted_run_does_not_move_unrestricted_watermark(store, dated_opportunity):
+    store.advance("grants_gov", [dated_opportunity("A", "2025-03-10")], watermark_scope(2, ["energy"]))
+
+    assert store.get("grants_gov", watermark_scope(30)) is None
+    assert store.get("grants_gov", watermark_scope(2, ["energy"])).last_post_date == "2025-03-10"
+
+
+def test_advance_keeps_ids_seen_on_newest_day(store, dated_opportunity):
+    scope = watermark_scope(7)
+    store.advance("grants_gov", [dated_opportunity("A", "2025-03-09"), dated_opportunity("B", "2025-03-10")], scope)
+    store.advance("grants_gov", [dated_opportunity("C", "2025-03-10")], scope)
+
+    watermark = store.get("grants_gov", scope)
+    assert watermark.last_post_date == "2025-03-10"
+    assert watermark.seen_ids == {"B", "C"}
+
+
+def test_legacy_unscoped_tables_are_replaced(tmp_path):
+    path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE fetch_watermarks (source TEXT PRIMARY KEY, last_post_date TEXT NOT NULL, updated_at TEXT)")
+    conn.execute("INSERT INTO fetch_watermarks VALUES ('grants_gov', '2099-01-01', NULL)")
+    conn.commit()
+    conn.close()
+
+    store = WatermarkStore(str(path))
+    assert store.get("grants_gov") is None
+    assert store.get("grants_gov", watermark_scope(7)) is None
+
+
+def _engine(store, records):
+    calls = []
+
+    def fetcher(days_back, since):
+        calls.append(since)
+        return list(records)
+
+    return FetchEngine({"grants_gov": fetcher}, watermarks=store), calls
+
+
+def test_fetch_uses_watermark_only_after_commit(store, dated_opportunity):
+    today = "2099-01-01"
+    engine, calls = _engine(store, [dated_opportunity("A", today)])
+
+    first = engine.fetch(["grants_gov"], days_back=7)
+    # Not committed (e.g. the run failed): the next run fetches the full window again
+    second = engine.fetch(["grants_gov"], days_back=7)
+    assert calls == [None, None]
+    assert len(second.opportunities) == 1
+
+    engine.commit_watermarks(first)
+    third = engine.fetch(["grants_gov"], days_back=7)
+    assert calls[-1] == today
+    assert third.opportunities == []
+    assert third.sources["grants_gov"].skipped_seen == 1
+
+    # Another scope never reads that watermark
+    engine.fetch(["grants_gov"], days_back=7, domains=["energy"])
+    assert calls[-1] is None
+
+
+class _FakeFetchEngine:
+    def __init__(self):
+        self.commits = 0
+
+    def commit_watermarks(self, result):
+        self.commits += 1
+
+
+class _FakeDb:
+    def __init__(self):
+        self.saved = []
+
+    def save_scored_opportunities(self, scored, hashes=None):
+        self.saved.extend(scored)
+
+
+class _FakeArtifacts:
+    def __init__(self):
+        self.errors = []
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def _workflow(monkeypatch, opportunities):
+    workflow = discovery_workflow.DiscoveryWorkflow.__new__(discovery_workflow.DiscoveryWorkflow)
+    workflow.fetch_engine = _FakeFetchEngine()
+    workflow.fetch_result = object()
+    workflow.db = _FakeDb()
+    workflow.near_duplicate_threshold = None
+    workflow.artifacts = _FakeArtifacts()
+    monkeypatch.setattr(workflow, "_fetch_opportunities", lambda: opportunities)
+    monkeypatch.setattr(workflow, "_aggregate_opportunities", lambda opps: opps)
+    monkeypatch.setattr(
+        discovery_workflow, "split_by_content", lambda opps, db, threshold=None: ContentSplit(new=list(opps))
+    )
+    return workflow
+
+
+def test_filter_failure_does_not_commit_watermarks(monkeypatch, dated_opportunity):
+    workflow = _workflow(monkeypatch, [dated_opportunity("A", "2025-03-10")])
+    monkeypatch.setattr(discovery_workflow.KeywordMatcher, "from_file", classmethod(lambda cls: 1 / 0))
+
+    workflow.run()
+
+    assert workflow.fetch_engine.commits == 0
+    assert workflow.db.saved == []
+    # Early returns still stop the artifact writer
+    assert workflow.artifacts.closed
+
+
+def test_scoring_failure_does_not_commit_watermarks(monkeypatch, dated_opportunity):
+    workflow = _workflow(monkeypatch, [dated_opportunity("A", "2025-03-10")])
+    monkeypatch.setattr(workflow, "_filter_opportunities", lambda opps: opps)
+    monkeypatch.setattr(workflow, "_score_opportunities", lambda opps: None)
+
+    workflow.run()
+
+    assert workflow.fetch_engine.commits == 0
+
+
+def test_empty_filter_result_commits_watermarks(monkeypatch, dated_opportunity):
+    workflow = _workflow(monkeypatch, [dated_opportunity("A", "2025-03-10")])
+    monkeypatch.setattr(workflow, "_filter_opportunities", lambda opps: [])
+
+    workflow.run()
+
+    assert workflow.fetch_engine.commits == 1
@@ -0,0 +1,4 @@
+"""
+Caching and PDF rendering shared by the Opportunity Discovery and Critical
+Minerals News workflows.
+"""
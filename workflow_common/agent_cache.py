@@ -0,0 +1,212 @@
+"""
+On-disk cache of agent run results, shared by both workflows.
+
+A run is keyed on the agent's model id, temperature and seed, a hash of its
+instructions, the prompt, and the JSON schema of the response model, so any
+change to those misses. Structured outputs are stored as JSON and re-parsed
+into the response model on a hit. Entries expire after a per-agent TTL (short
+for the live news search agents) and are evicted LRU by the underlying
+DiskCache.
+
+Set AGENT_CACHE_ENABLED=false to always call the model.
+"""
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Type
+
+from pydantic import BaseModel
+
+from workflow_common.disk_cache import DiskCache
+from workflow_common.tokens import count_tokens
+
+# Seconds a cached run stays valid, per agent name
+DEFAULT_TTLS = {
+    # Opportunity discovery
+    "Aggregation_Agent": 24 * 3600,
+    "Filter_Agent": 7 * 24 * 3600,
+    "Scoring_Agent": 7 * 24 * 3600,
+    "Key_Findings_Agent": 7 * 24 * 3600,
+    # Critical minerals news
+    "News Search Agent": 6 * 3600,
+    "Twitter Search Agent": 6 * 3600,
+    "LinkedIn Search Agent": 6 * 3600,
+    "CSIS Research Agent": 12 * 3600,
+    "Content Aggregation Agent": 24 * 3600,
+    "Report Formatting Agent": 24 * 3600,
+}
+DEFAULT_TTL = 24 * 3600
+
+_BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _env_enabled() -> bool:
+    return os.getenv("AGENT_CACHE_ENABLED", "true").lower() not in ("0", "false", "no")
+
+
+def _text(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (list, tuple)):
+        return "\n".join(_text(item) for item in value)
+    return str(value)
+
+
+@dataclass
+class CachedRunResponse:
+    """Stand-in for an agent run response served from the cache."""
+    content: Any
+    cached: bool = True
+
+
+class AgentResponseCache:
+    """Caches agent run outputs on disk and tracks hit ratio and tokens saved."""
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        ttls: Optional[Dict[str, int]] = None,
+        enabled: Optional[bool] = None,
+    ):
+        self.enabled = _env_enabled() if enabled is None else enabled
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.store = DiskCache(
+            directory or os.getenv("AGENT_CACHE_DIR", os.path.join(_BASE_PATH, ".cache", "agents")),
+            max_bytes or int(float(os.getenv("AGENT_CACHE_MAX_MB", "128")) * 1024 * 1024),
+        )
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "tokens_saved": 0}
+
+    def ttl_for(self, agent: Any) -> int:
+        return self.ttls.get(getattr(agent, "name", None) or "", DEFAULT_TTL)
+
+    def make_key(self, agent: Any, prompt: Any, response_model: Optional[Type[BaseModel]] = None) -> str:
+        model = getattr(agent, "model", None)
+        schema = response_model.model_json_schema() if response_model is not None else None
+        material = {
+            "agent": getattr(agent, "name", None),
+            "model_id": getattr(model, "id", None),
+            "temperature": getattr(model, "temperature", None),
+            "seed": getattr(model, "seed", None),
+            "instructions": hashlib.sha256(_text(getattr(agent, "instructions", None)).encode("utf-8")).hexdigest(),
+            "prompt": hashlib.sha256(_text(prompt).encode("utf-8")).hexdigest(),
+            "schema": schema,
+        }
+        return hashlib.sha256(json.dumps(material, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def get(self, key: str, agent: Any, response_model: Optional[Type[BaseModel]] = None) -> Optional[CachedRunResponse]:
+        payload = self.store.get(key, max_age=self.ttl_for(agent))
+        if payload is None:
+            with self._lock:
+                self._stats["misses"] += 1
+            return None
+        try:
+            entry = json.loads(payload.decode("utf-8"))
+            content = entry["content"]
+            if entry.get("structured") and response_model is not None:
+                content = response_model.model_validate(content)
+        except Exception:
+            # Unreadable or no longer matching the model: treat as a miss
+            self.store.delete(key)
+            with self._lock:
+                self._stats["misses"] += 1
+            return None
+        with self._lock:
+            self._stats["hits"] += 1
+            self._stats["tokens_saved"] += entry.get("tokens", 0)
+        return CachedRunResponse(content)
+
+    def put(self, key: str, prompt: Any, response: Any):
+        """Store a run's content; empty or unparsed string output for a structured run is skipped."""
+        content = getattr(response, "content", None)
+        if content is None or content == "":
+            return
+        structured = isinstance(content, BaseModel)
+        stored = content.model_dump(mode="json") if structured else content
+        try:
+            body = json.dumps(stored)
+        except TypeError:
+            return
+        self.store.set(key, json.dumps({
+            "structured": structured,
+            "content": stored,
+            "tokens": _run_tokens(response, prompt, body),
+        }).encode("utf-8"))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["enabled"] = self.enabled
+        stats["store"] = self.store.stats()
+        return stats
+
+
+def _run_tokens(response: Any, prompt: Any, body: str) -> int:
+    """Tokens the run cost: reported usage when available, else an estimate."""
+    metrics = getattr(response, "metrics", None)
+    if metrics is not None:
+        total = getattr(metrics, "total_tokens", None)
+        if total is None and isinstance(metrics, dict):
+            total = metrics.get("total_tokens")
+        if isinstance(total, (list, tuple)):
+            total = sum(total)
+        if isinstance(total, (int, float)) and total > 0:
+            return int(total)
+    return count_tokens(_text(prompt)) + count_tokens(body)
+
+
+class CachedAgent:
+    """Wraps an agent so `run` is served from the cache when possible; other attributes pass through."""
+
+    def __init__(self, agent: Any, cache: "AgentResponseCache"):
+        self.agent = agent
+        self.cache = cache
+
+    def __getattr__(self, name):
+        return getattr(self.agent, name)
+
+    def run(self, prompt: Any = None, *args, response_model: Optional[Type[BaseModel]] = None, **kwargs):
+        if not self.cache.enabled or args or kwargs.get("stream"):
+            return self._call(prompt, args, response_model, kwargs)
+        key = self.cache.make_key(self.agent, prompt, response_model)
+        cached = self.cache.get(key, self.agent, response_model)
+        if cached is not None:
+            return cached
+        response = self._call(prompt, args, response_model, kwargs)
+        if response_model is None or not isinstance(getattr(response, "content", None), str):
+            self.cache.put(key, prompt, response)
+        return response
+
+    def _call(self, prompt, args, response_model, kwargs):
+        if response_model is not None:
+            kwargs["response_model"] = response_model
+        return self.agent.run(prompt, *args, **kwargs)
+
+
+_cache: Optional[AgentResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_agent_cache() -> AgentResponseCache:
+    """Process-wide agent response cache."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = AgentResponseCache()
+        return _cache
+
+
+def cached(agent: Any) -> CachedAgent:
+    return CachedAgent(agent, get_agent_cache())
+
+
+def cached_factory(agent_factory: Callable) -> Callable:
+    """Agent factory whose agents go through the shared response cache."""
+    return lambda: cached(agent_factory())
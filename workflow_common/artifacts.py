@@ -0,0 +1,115 @@
+"""
+Asynchronous writer for workflow artifacts.
+
+Phases hand each other typed objects in memory; anything that should also
+land on disk (the Markdown report, the scored-opportunity JSON) is queued on
+an ArtifactSink and written by one background thread, atomically, so the
+workflow never waits on serialization or file I/O. Call `flush` before
+relying on the files, e.g. when a run is reported as completed. A run can own
+its sink or share the process-wide one for a directory (get_artifact_sink).
+
+Intermediate artifacts are optional: set SAVE_INTERMEDIATE_ARTIFACTS=false to
+skip them. Reports are always written.
+"""
+import json
+import os
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+def _env_enabled() -> bool:
+    return os.getenv("SAVE_INTERMEDIATE_ARTIFACTS", "true").lower() not in ("0", "false", "no")
+
+
+def _jsonable(data: Any) -> Any:
+    if isinstance(data, BaseModel):
+        return data.model_dump(mode="json")
+    if isinstance(data, (list, tuple)):
+        return [_jsonable(item) for item in data]
+    return data
+
+
+def _write_atomic(path: str, payload: bytes):
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class ArtifactSink:
+    """Queues artifact writes under `directory` on a single background thread."""
+
+    def __init__(self, directory: str, save_intermediate: Optional[bool] = None):
+        self.directory = directory
+        self.save_intermediate = _env_enabled() if save_intermediate is None else save_intermediate
+        self.errors: List[str] = []
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="artifacts")
+        self._pending: List[Future] = []
+        self._lock = threading.Lock()
+
+    def path(self, name: str) -> str:
+        """Absolute path of artifact `name`."""
+        return os.path.join(self.directory, name)
+
+    def _submit(self, name: str, render: Callable[[], bytes]) -> Future:
+        path = self.path(name)
+
+        def write():
+            try:
+                _write_atomic(path, render())
+            except Exception as e:
+                with self._lock:
+                    self.errors.append(f"{name}: {e}")
+                raise
+            return path
+
+        future = self._executor.submit(write)
+        with self._lock:
+            self._pending = [pending for pending in self._pending if not pending.done()]
+            self._pending.append(future)
+        return future
+
+    def write_text(self, name: str, text: str) -> Future:
+        """Write a final artifact such as the report; returns a future of its path."""
+        return self._submit(name, lambda: text.encode("utf-8"))
+
+    def write_json(self, name: str, data: Any, intermediate: bool = True) -> Optional[Future]:
+        """Write models or plain data as compact JSON; skipped for intermediates when disabled."""
+        if intermediate and not self.save_intermediate:
+            return None
+        return self._submit(name, lambda: json.dumps(_jsonable(data), separators=(",", ":")).encode("utf-8"))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued writes; False if some were still running at `timeout`."""
+        with self._lock:
+            pending = list(self._pending)
+        _, not_done = wait(pending, timeout=timeout)
+        return not not_done
+
+    def close(self):
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+
+_sinks: Dict[str, ArtifactSink] = {}
+_sinks_lock = threading.Lock()
+
+
+def get_artifact_sink(directory: str) -> ArtifactSink:
+    """Process-wide sink writing under `directory`, shared by every caller using it."""
+    directory = os.path.abspath(directory)
+    with _sinks_lock:
+        if directory not in _sinks:
+            _sinks[directory] = ArtifactSink(directory)
+        return _sinks[directory]
@@ -0,0 +1,198 @@
+"""
+Size-bounded, LRU-evicting key/value cache on disk.
+
+Payloads are stored as plain files; a small SQLite index tracks size, store
+time and last access so entries can expire by age and be evicted by recency.
+"""
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+def link_or_copy(source_path: str, target_path: str):
+    """Hard-link `source_path` at `target_path`, copying where links are not possible."""
+    if os.path.exists(target_path):
+        os.remove(target_path)
+    try:
+        os.link(source_path, target_path)
+    except OSError:
+        shutil.copyfile(source_path, target_path)
+
+
+class DiskCache:
+    """Disk-backed byte cache with TTL checks on read and LRU eviction on write."""
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+        self._index_path = os.path.join(self.directory, "index.db")
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "expired": 0, "stores": 0, "evictions": 0}
+        self._init_index()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self._index_path, timeout=30)
+
+    def _init_index(self):
+        conn = self._connect()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        ''')
+        conn.commit()
+        conn.close()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[bytes]:
+        """Return the payload for `key`, or None if missing or older than `max_age` seconds."""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute('SELECT stored_at FROM entries WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                conn.close()
+                self._stats["misses"] += 1
+                return None
+            if max_age is not None and now - row[0] > max_age:
+                self._delete(conn, key)
+                conn.commit()
+                conn.close()
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                return None
+            try:
+                with open(self._path(key), "rb") as f:
+                    data = f.read()
+            except OSError:
+                self._delete(conn, key)
+                conn.commit()
+                conn.close()
+                self._stats["misses"] += 1
+                return None
+            conn.execute('UPDATE entries SET accessed_at = ? WHERE key = ?', (now, key))
+            conn.commit()
+            conn.close()
+            self._stats["hits"] += 1
+            return data
+
+    def get_file(self, key: str, max_age: Optional[float] = None) -> Optional[str]:
+        """Like `get`, but return the path of the stored file instead of reading it."""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute('SELECT stored_at FROM entries WHERE key = ?', (key,)).fetchone()
+            expired = row is not None and max_age is not None and now - row[0] > max_age
+            path = self._path(key)
+            if row is None or expired or not os.path.exists(path):
+                if row is not None:
+                    self._delete(conn, key)
+                    conn.commit()
+                conn.close()
+                self._stats["expired"] += int(expired)
+                self._stats["misses"] += 1
+                return None
+            conn.execute('UPDATE entries SET accessed_at = ? WHERE key = ?', (now, key))
+            conn.commit()
+            conn.close()
+            self._stats["hits"] += 1
+            return path
+
+    def set(self, key: str, data: bytes):
+        """Store `data` under `key`, evicting least recently used entries past the size bound."""
+        if len(data) > self.max_bytes:
+            return
+
+        def write(tmp_path: str):
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+
+        self._store(key, len(data), write)
+
+    def set_file(self, key: str, source_path: str):
+        """Store the file at `source_path` under `key`, hard-linking it when possible."""
+        size = os.path.getsize(source_path)
+        if size > self.max_bytes:
+            return
+        self._store(key, size, lambda tmp_path: link_or_copy(source_path, tmp_path))
+
+    def _store(self, key: str, size: int, write: Callable[[str], None]):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        write(tmp_path)
+        os.replace(tmp_path, path)
+
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute('''
+                INSERT OR REPLACE INTO entries (key, size, stored_at, accessed_at)
+                VALUES (?, ?, ?, ?)
+            ''', (key, size, now, now))
+            self._stats["stores"] += 1
+            self._evict(conn)
+            conn.commit()
+            conn.close()
+
+    def delete(self, key: str):
+        with self._lock:
+            conn = self._connect()
+            self._delete(conn, key)
+            conn.commit()
+            conn.close()
+
+    def clear(self):
+        """Remove every entry."""
+        with self._lock:
+            conn = self._connect()
+            keys = [row[0] for row in conn.execute('SELECT key FROM entries')]
+            for key in keys:
+                self._delete(conn, key)
+            conn.commit()
+            conn.close()
+
+    def _delete(self, conn: sqlite3.Connection, key: str):
+        conn.execute('DELETE FROM entries WHERE key = ?', (key,))
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def _evict(self, conn: sqlite3.Connection):
+        total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Evict down to 90% of the bound so we do not evict on every write
+        target = int(self.max_bytes * 0.9)
+        for key, size in conn.execute('SELECT key, size FROM entries ORDER BY accessed_at ASC').fetchall():
+            if total <= target:
+                break
+            self._delete(conn, key)
+            total -= size
+            self._stats["evictions"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters plus current entry count and size."""
+        with self._lock:
+            conn = self._connect()
+            entries, size = conn.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries').fetchone()
+            conn.close()
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats.update({
+            "entries": entries,
+            "size_bytes": size,
+            "max_bytes": self.max_bytes,
+            "hit_ratio": round(stats["hits"] / lookups, 3) if lookups else None,
+        })
+        return stats
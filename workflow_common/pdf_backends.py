@@ -0,0 +1,104 @@
+"""
+HTML -> PDF rendering engines.
+
+The converters turn Markdown into HTML with their PDF_TEMPLATE and hand it to a
+backend. Two are available:
+
+- xhtml2pdf (default): pure Python, but slow on large tables and its fonts
+  lack most non-ASCII glyphs, so Markdown is reduced to ASCII first.
+- weasyprint: full CSS layout through Pango, keeps Unicode text. Needs the
+  Pango system libraries (see the WeasyPrint installation docs).
+
+Pick one with PDF_BACKEND=xhtml2pdf|weasyprint. The backend name is part of
+the PDF render cache key, so switching engines never serves the other
+engine's output.
+"""
+import os
+from typing import Dict, Optional, Type
+
+DEFAULT_BACKEND = "xhtml2pdf"
+
+# PDF_TEMPLATE draws its footer with xhtml2pdf frames; WeasyPrint uses page margin boxes
+WEASYPRINT_CSS = """
+@page {
+    @bottom-center {
+        content: counter(page) " / " counter(pages);
+        font-size: 9pt;
+        color: #666666;
+    }
+}
+#footerContent { display: none; }
+"""
+
+
+class PdfBackend:
+    """Renders a complete HTML document to a PDF file."""
+
+    name = ""
+    # Whether Markdown must be reduced to ASCII before rendering
+    ascii_only = False
+
+    def available(self) -> Optional[str]:
+        """None if the engine can run here, otherwise why not."""
+        return None
+
+    def render(self, html: str, output_file: str):
+        """Write `html` as a PDF to `output_file`; raises on failure."""
+        raise NotImplementedError
+
+
+class Xhtml2PdfBackend(PdfBackend):
+    name = "xhtml2pdf"
+    ascii_only = True
+
+    def available(self) -> Optional[str]:
+        try:
+            import xhtml2pdf  # noqa: F401
+        except ImportError as e:
+            return f"{e}. Install with: pip install xhtml2pdf"
+        return None
+
+    def render(self, html: str, output_file: str):
+        from xhtml2pdf import pisa
+
+        with open(output_file, "wb") as pdf_file:
+            pisa_status = pisa.CreatePDF(html, dest=pdf_file, encoding='utf-8')
+        if pisa_status.err:
+            raise RuntimeError(f"xhtml2pdf reported {pisa_status.err} error(s)")
+
+
+class WeasyPrintBackend(PdfBackend):
+    name = "weasyprint"
+
+    def available(self) -> Optional[str]:
+        try:
+            import weasyprint  # noqa: F401
+        except ImportError as e:
+            return f"{e}. Install with: pip install weasyprint"
+        except OSError as e:
+            # The package is installed but the Pango libraries are not
+            return str(e).splitlines()[0]
+        return None
+
+    def render(self, html: str, output_file: str):
+        from weasyprint import CSS, HTML
+
+        HTML(string=html).write_pdf(output_file, stylesheets=[CSS(string=WEASYPRINT_CSS)])
+
+
+BACKENDS: Dict[str, Type[PdfBackend]] = {
+    Xhtml2PdfBackend.name: Xhtml2PdfBackend,
+    WeasyPrintBackend.name: WeasyPrintBackend,
+}
+
+
+def backend_name(name: Optional[str] = None) -> str:
+    """The backend to use: `name`, else PDF_BACKEND, else xhtml2pdf."""
+    name = (name or os.getenv("PDF_BACKEND") or DEFAULT_BACKEND).strip().lower()
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown PDF backend '{name}'. Choose from: {', '.join(BACKENDS)}")
+    return name
+
+
+def get_backend(name: Optional[str] = None) -> PdfBackend:
+    return BACKENDS[backend_name(name)]()
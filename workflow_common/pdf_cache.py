@@ -0,0 +1,108 @@
+"""
+Content-addressed cache of rendered PDFs, shared by both workflows.
+
+A PDF is keyed on the SHA-256 of the normalized Markdown plus the rendering
+backend and a version of the page template, so re-rendering an unchanged
+report (same opportunities or articles, same findings) is a file link instead
+of a multi-second render. Normalization drops the report's generation date and
+trailing whitespace and unifies line endings; anything else that changes the
+text is a miss. Each workflow passes its own PDF_TEMPLATE, so the two never
+share entries and editing a template invalidates its renderings.
+
+Hits are hard-linked into place where the filesystem allows it and copied
+otherwise. Entries are evicted LRU by the underlying DiskCache. Set
+PDF_CACHE_ENABLED=false to always render.
+"""
+import hashlib
+import os
+import re
+import threading
+from typing import Any, Dict, Optional
+
+from workflow_common.disk_cache import DiskCache, link_or_copy
+from workflow_common.pdf_backends import backend_name
+
+# Report lines that change on every run without changing the content
+_VOLATILE_LINES = re.compile(r"^\s*\*\*(?:Date Generated|Generated on):\*\*.*$", re.MULTILINE)
+_TRAILING_WHITESPACE = re.compile(r"[ \t]+$", re.MULTILINE)
+
+_BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _env_enabled() -> bool:
+    return os.getenv("PDF_CACHE_ENABLED", "true").lower() not in ("0", "false", "no")
+
+
+def template_version(template: str) -> str:
+    """Short hash of a page template; part of every key so stale renderings are never served."""
+    return hashlib.sha256(template.encode("utf-8")).hexdigest()[:16]
+
+
+def normalize_markdown(md_content: str) -> str:
+    """Markdown with line endings, trailing whitespace and generation dates normalized."""
+    text = md_content.replace("\r\n", "\n").replace("\r", "\n")
+    text = _VOLATILE_LINES.sub("", text)
+    return _TRAILING_WHITESPACE.sub("", text).strip() + "\n"
+
+
+class PdfRenderCache:
+    """Maps normalized Markdown to a previously rendered PDF on disk."""
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        enabled: Optional[bool] = None,
+    ):
+        self.enabled = _env_enabled() if enabled is None else enabled
+        self.store = DiskCache(
+            directory or os.getenv("PDF_CACHE_DIR", os.path.join(_BASE_PATH, ".cache", "pdf")),
+            max_bytes or int(float(os.getenv("PDF_CACHE_MAX_MB", "256")) * 1024 * 1024),
+        )
+
+    def make_key(self, md_content: str, template: str, backend: Optional[str] = None) -> str:
+        material = f"{backend_name(backend)}:{template_version(template)}\n{normalize_markdown(md_content)}"
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def fetch(self, md_content: str, pdf_path: str, template: str, backend: Optional[str] = None) -> bool:
+        """Place a cached rendering of `md_content` with `template` at `pdf_path`; False on a miss."""
+        if not self.enabled:
+            return False
+        cached_path = self.store.get_file(self.make_key(md_content, template, backend))
+        if cached_path is None:
+            return False
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(pdf_path)), exist_ok=True)
+            link_or_copy(cached_path, pdf_path)
+        except OSError as e:
+            print(f"⚠️ Could not reuse cached PDF: {e}")
+            return False
+        return True
+
+    def store_rendering(self, md_content: str, pdf_path: str, template: str, backend: Optional[str] = None):
+        """Remember the PDF rendered from `md_content` with `template`; cache failures never fail a render."""
+        if not self.enabled:
+            return
+        try:
+            self.store.set_file(self.make_key(md_content, template, backend), pdf_path)
+        except OSError as e:
+            print(f"⚠️ Could not cache PDF: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self.store.stats()
+        stats["enabled"] = self.enabled
+        stats["backend"] = backend_name()
+        return stats
+
+
+_cache: Optional[PdfRenderCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_pdf_cache() -> PdfRenderCache:
+    """Process-wide PDF render cache."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = PdfRenderCache()
+        return _cache
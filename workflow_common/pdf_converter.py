@@ -0,0 +1,77 @@
+from pathlib import Path
+from workflow_common.pdf_backends import get_backend
+from workflow_common.pdf_cache import get_pdf_cache
+from workflow_common.text_processing import normalize_unicode_characters
+
+
+class MarkdownToPdfConverter:
+    """Converts markdown files to PDF with a workflow's page template and the configured backend (xhtml2pdf by default)."""
+    
+    def __init__(self, template, backend=None):
+        self.template = template
+        self.backend = get_backend(backend)
+    
+    def convert(self, input_file, output_file=None):
+        """Convert markdown file to PDF."""
+        input_path = Path(input_file)
+        if not input_path.exists():
+            print(f"✗ Input file not found: {input_file}")
+            return False
+        
+        if input_path.suffix.lower() != '.md':
+            print(f"✗ Input must be a markdown file: {input_file}")
+            return False
+        
+        if output_file is None:
+            output_file = str(input_path.with_suffix('.pdf'))
+        
+        try:
+            with open(input_file, 'r', encoding='utf-8') as f:
+                md_content = f.read()
+        except Exception as e:
+            print(f"✗ Conversion failed: {e}")
+            return False
+        
+        return self.convert_text(md_content, output_file)
+    
+    def convert_text(self, md_content, output_file, use_cache=True):
+        """Convert a Markdown string to a PDF file, reusing a cached rendering of the same content."""
+        output_path = Path(output_file)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        cache = get_pdf_cache() if use_cache else None
+        if cache is not None and cache.fetch(md_content, output_file, self.template, self.backend.name):
+            print(f"✓ PDF reused from cache: {output_file}")
+            return True
+        
+        try:
+            import markdown
+            
+            # xhtml2pdf fonts lack most non-ASCII glyphs; normalize to prevent square boxes in PDF
+            text = normalize_unicode_characters(md_content) if self.backend.ascii_only else md_content
+            
+            html_content = markdown.markdown(
+                text,
+                extensions=['tables', 'toc', 'fenced_code', 'extra']
+            )
+            
+            # Create styled HTML document
+            styled_html = self.template.format(html_content=html_content)
+            
+            # Never write through a hard link into the cache
+            if output_path.exists():
+                output_path.unlink()
+            self.backend.render(styled_html, output_file)
+            
+            if cache is not None:
+                cache.store_rendering(md_content, output_file, self.template, self.backend.name)
+            print(f"✓ PDF created: {output_file}")
+            return True
+            
+        except ImportError as e:
+            print(f"✗ Missing library: {e}. Install with: pip install markdown {self.backend.name}")
+            return False
+        except Exception as e:
+            print(f"✗ Conversion failed: {e}")
+            return False
+
@@ -0,0 +1,237 @@
+"""
+Background PDF rendering service, shared by both workflows.
+
+Markdown -> PDF conversion is CPU-bound and holds the GIL for seconds on long
+reports, so it runs in child processes instead of the workflow threads.
+Workflows `submit` a job and carry on; a dispatcher thread takes jobs off a
+queue and runs each in its own process, at most `max_workers` at a time. A
+process is used per job (rather than a pool of long-lived workers) so a job
+that exceeds its timeout can be terminated without affecting the others.
+
+Job status (queued, running, completed, failed, timeout) is kept in memory
+and callbacks fire when a job finishes. Markdown that was rendered before is
+served from the PDF render cache without starting a process. Each job carries
+the page template of the workflow that submitted it. Configure with
+PDF_RENDER_WORKERS and PDF_RENDER_TIMEOUT (seconds).
+"""
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from workflow_common.pdf_cache import get_pdf_cache
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+TIMEOUT = "timeout"
+FINISHED_STATES = (COMPLETED, FAILED, TIMEOUT)
+
+DEFAULT_WORKERS = 2
+DEFAULT_TIMEOUT = 300.0
+# Finished jobs kept for status lookups
+MAX_FINISHED_JOBS = 200
+
+# Spawned children start clean instead of forking a threaded parent
+_mp = multiprocessing.get_context("spawn")
+
+
+def _render(md_content: str, pdf_filepath: str, template: str):
+    """Child process entry point; the exit code tells the parent whether it worked."""
+    from workflow_common.pdf_converter import MarkdownToPdfConverter
+    # The parent already missed the cache and stores the result itself
+    ok = MarkdownToPdfConverter(template).convert_text(md_content, pdf_filepath, use_cache=False)
+    raise SystemExit(0 if ok else 1)
+
+
+@dataclass
+class PdfJob:
+    """One queued rendering of Markdown to `pdf_path`."""
+    job_id: str
+    pdf_path: str
+    timeout: float
+    status: str = QUEUED
+    error: Optional[str] = None
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    cached: bool = False
+    markdown: Optional[str] = field(default=None, repr=False)
+    template: Optional[str] = field(default=None, repr=False)
+    _callbacks: List[Callable[["PdfJob"], Any]] = field(default_factory=list, repr=False)
+    _done: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def done(self) -> bool:
+        return self.status in FINISHED_STATES
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "pdf_path": self.pdf_path,
+            "status": self.status,
+            "error": self.error,
+            "cached": self.cached,
+            "queued_seconds": round((self.started_at or time.time()) - self.submitted_at, 2),
+            "render_seconds": round((self.finished_at or time.time()) - self.started_at, 2) if self.started_at else None,
+        }
+
+
+class PdfRenderService:
+    """Queue of PDF jobs rendered in child processes with per-job timeouts."""
+
+    def __init__(self, max_workers: Optional[int] = None, timeout: Optional[float] = None):
+        self.max_workers = max_workers or int(os.getenv("PDF_RENDER_WORKERS", DEFAULT_WORKERS))
+        self.timeout = timeout or float(os.getenv("PDF_RENDER_TIMEOUT", DEFAULT_TIMEOUT))
+        self._queue: "queue.Queue[PdfJob]" = queue.Queue()
+        self._slots = threading.BoundedSemaphore(self.max_workers)
+        self._jobs: Dict[str, PdfJob] = {}
+        self._lock = threading.Lock()
+        self._stats = {"submitted": 0, "cached": 0, COMPLETED: 0, FAILED: 0, TIMEOUT: 0}
+        self._dispatcher = threading.Thread(target=self._dispatch, name="pdf-dispatcher", daemon=True)
+        self._dispatcher.start()
+
+    def submit(
+        self,
+        md_content: str,
+        pdf_path: str,
+        template: str,
+        on_done: Optional[Callable[[PdfJob], Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> PdfJob:
+        """Queue a rendering with `template` and return immediately; `on_done(job)` runs when it finishes."""
+        job = PdfJob(
+            job_id=uuid.uuid4().hex,
+            pdf_path=pdf_path,
+            timeout=timeout or self.timeout,
+            markdown=md_content,
+            template=template,
+        )
+        if on_done is not None:
+            job._callbacks.append(on_done)
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._stats["submitted"] += 1
+        self._queue.put(job)
+        return job
+
+    def add_done_callback(self, job_id: str, callback: Callable[[PdfJob], Any]) -> bool:
+        """Attach a callback to a job; it runs right away if the job already finished."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return False
+            if not job.done:
+                job._callbacks.append(callback)
+                return True
+        self._call(callback, job)
+        return True
+
+    def get(self, job_id: str) -> Optional[PdfJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def wait_all(self, timeout: Optional[float] = None) -> bool:
+        """Wait for every submitted job; False if some were unfinished at `timeout`."""
+        deadline = None if timeout is None else time.time() + timeout
+        with self._lock:
+            jobs = list(self._jobs.values())
+        for job in jobs:
+            remaining = None if deadline is None else max(0.0, deadline - time.time())
+            if not job.wait(remaining):
+                return False
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["queued"] = sum(job.status == QUEUED for job in self._jobs.values())
+            stats["running"] = sum(job.status == RUNNING for job in self._jobs.values())
+        stats["max_workers"] = self.max_workers
+        stats["timeout_seconds"] = self.timeout
+        stats["cache"] = get_pdf_cache().stats()
+        return stats
+
+    def _dispatch(self):
+        while True:
+            job = self._queue.get()
+            self._slots.acquire()
+            threading.Thread(target=self._run, args=(job,), name=f"pdf-{job.job_id[:8]}", daemon=True).start()
+
+    def _run(self, job: PdfJob):
+        try:
+            with self._lock:
+                job.status = RUNNING
+                job.started_at = time.time()
+            cache = get_pdf_cache()
+            job.cached = cache.fetch(job.markdown, job.pdf_path, job.template)
+            if job.cached:
+                status, error = COMPLETED, None
+            else:
+                status, error = self._render_in_process(job)
+                if status == COMPLETED:
+                    cache.store_rendering(job.markdown, job.pdf_path, job.template)
+        except Exception as e:
+            status, error = FAILED, str(e)
+        finally:
+            self._slots.release()
+        self._finish(job, status, error)
+
+    def _render_in_process(self, job: PdfJob):
+        process = _mp.Process(target=_render, args=(job.markdown, job.pdf_path, job.template), daemon=True)
+        process.start()
+        process.join(job.timeout)
+        if process.is_alive():
+            process.terminate()
+            process.join(5)
+            if os.path.exists(job.pdf_path):
+                os.remove(job.pdf_path)
+            return TIMEOUT, f"rendering exceeded {job.timeout:.0f}s"
+        if process.exitcode == 0:
+            return COMPLETED, None
+        return FAILED, f"renderer exited with code {process.exitcode}"
+
+    def _finish(self, job: PdfJob, status: str, error: Optional[str]):
+        with self._lock:
+            job.status = status
+            job.error = error
+            job.finished_at = time.time()
+            job.markdown = None
+            job.template = None
+            self._stats[status] += 1
+            self._stats["cached"] += int(job.cached)
+            callbacks, job._callbacks = job._callbacks, []
+            finished = [key for key, other in self._jobs.items() if other.done]
+            for key in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+                del self._jobs[key]
+        job._done.set()
+        for callback in callbacks:
+            self._call(callback, job)
+
+    @staticmethod
+    def _call(callback: Callable[[PdfJob], Any], job: PdfJob):
+        try:
+            callback(job)
+        except Exception as e:
+            print(f"⚠️ PDF job callback failed: {e}")
+
+
+_service: Optional[PdfRenderService] = None
+_service_lock = threading.Lock()
+
+
+def get_pdf_service() -> PdfRenderService:
+    """Process-wide PDF rendering service."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = PdfRenderService()
+        return _service
@@ -0,0 +1,36 @@
+"""
+Token counting for sizing LLM prompts.
+"""
+from functools import lru_cache
+from typing import Optional
+
+import tiktoken
+
+DEFAULT_ENCODING = "o200k_base"
+# Rough characters per token for English/JSON, used when no tokenizer is available
+CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=None)
+def get_encoding(model_id: Optional[str] = None) -> Optional[tiktoken.Encoding]:
+    """
+    Tokenizer for `model_id`, falling back to the default encoding for unknown
+    models. Returns None when the encoding files cannot be loaded (offline).
+    """
+    try:
+        if model_id:
+            try:
+                return tiktoken.encoding_for_model(model_id)
+            except KeyError:
+                pass
+        return tiktoken.get_encoding(DEFAULT_ENCODING)
+    except Exception as e:
+        print(f"⚠️ Tokenizer unavailable, estimating tokens from length: {e}")
+        return None
+
+
+def count_tokens(text: str, model_id: Optional[str] = None) -> int:
+    encoding = get_encoding(model_id)
+    if encoding is None:
+        return -(-len(text) // CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))